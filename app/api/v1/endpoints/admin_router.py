@@ -0,0 +1,150 @@
+from fastapi import APIRouter, Depends
+
+from app.core.auth_dependencies import get_current_admin_user
+from app.core.auth_utils import password_hash_executor
+from app.core.database import engine, get_pool_stats, read_router, replica_engines
+from app.core.identity_cache import identity_cache
+from app.models.user import User
+from app.schemas.admin_schemas import (
+    DatabasePoolStatsResponse,
+    ReadRoutingStatsResponse,
+)
+from app.schemas.auth_schemas import (
+    IdentityCacheStatsResponse,
+    PasswordHashStatsResponse,
+)
+from app.schemas.chat_schemas import (
+    MessageRetentionStatsResponse,
+    TranslationCacheStatsResponse,
+)
+from app.schemas.room_schemas import RoomOccupancyStatsResponse
+from app.schemas.room_user_schemas import (
+    PresenceStatsResponse,
+    UserActivityStatsResponse,
+)
+from app.services.message_retention import message_retention_sweeper
+from app.services.presence_service import presence_service
+from app.services.user_activity_buffer import user_activity_buffer
+from app.services.room_occupancy import room_occupancy_reconciler
+from app.services.service_dependencies import get_translation_cache
+from app.services.translation_cache import TranslationCache
+
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get("/translation-cache", response_model=TranslationCacheStatsResponse)
+async def get_translation_cache_stats(
+    current_admin: User = Depends(get_current_admin_user),
+    translation_cache: TranslationCache = Depends(get_translation_cache),
+) -> TranslationCacheStatsResponse:
+    """
+    Get translation cache hit/miss counters (admin only).
+    :param current_admin: Current authenticated admin user
+    :param translation_cache: TranslationCache instance
+    :return: Counters of memory and persistent cache tier
+    """
+    return TranslationCacheStatsResponse(**translation_cache.stats())
+
+
+@router.get("/identity-cache", response_model=IdentityCacheStatsResponse)
+async def get_identity_cache_stats(
+    current_admin: User = Depends(get_current_admin_user),
+) -> IdentityCacheStatsResponse:
+    """
+    Get authenticated-user cache counters (admin only).
+    :param current_admin: Current authenticated admin user
+    :return: Cache counters
+    """
+    return IdentityCacheStatsResponse(**identity_cache.stats())
+
+
+@router.get("/password-hashing", response_model=PasswordHashStatsResponse)
+async def get_password_hash_stats(
+    current_admin: User = Depends(get_current_admin_user),
+) -> PasswordHashStatsResponse:
+    """
+    Get password hashing pool load and queue wait times (admin only).
+    :param current_admin: Current authenticated admin user
+    :return: Pool counters
+    """
+    return PasswordHashStatsResponse(**password_hash_executor.stats())
+
+
+@router.get("/message-retention", response_model=MessageRetentionStatsResponse)
+async def get_message_retention_stats(
+    current_admin: User = Depends(get_current_admin_user),
+) -> MessageRetentionStatsResponse:
+    """
+    Get retention sweep progress and totals (admin only).
+    :param current_admin: Current authenticated admin user
+    :return: Sweep counters
+    """
+    return MessageRetentionStatsResponse(**message_retention_sweeper.stats())
+
+
+@router.get("/room-occupancy", response_model=RoomOccupancyStatsResponse)
+async def get_room_occupancy_stats(
+    current_admin: User = Depends(get_current_admin_user),
+) -> RoomOccupancyStatsResponse:
+    """
+    Get occupancy counter reconciliation totals (admin only).
+    :param current_admin: Current authenticated admin user
+    :return: Reconciliation counters
+    """
+    return RoomOccupancyStatsResponse(**room_occupancy_reconciler.stats())
+
+
+@router.get("/presence", response_model=PresenceStatsResponse)
+async def get_presence_stats(
+    current_admin: User = Depends(get_current_admin_user),
+) -> PresenceStatsResponse:
+    """
+    Get presence index size and idle expiry totals (admin only).
+    :param current_admin: Current authenticated admin user
+    :return: Presence counters
+    """
+    return PresenceStatsResponse(**presence_service.stats())
+
+
+@router.get("/user-activity", response_model=UserActivityStatsResponse)
+async def get_user_activity_stats(
+    current_admin: User = Depends(get_current_admin_user),
+) -> UserActivityStatsResponse:
+    """
+    Get write-behind buffer size and flush totals (admin only).
+    :param current_admin: Current authenticated admin user
+    :return: Buffer counters
+    """
+    return UserActivityStatsResponse(**user_activity_buffer.stats())
+
+
+@router.get("/database-pool", response_model=list[DatabasePoolStatsResponse])
+async def get_database_pool_stats(
+    current_admin: User = Depends(get_current_admin_user),
+) -> list[DatabasePoolStatsResponse]:
+    """
+    Get connection pool usage and checkout wait times of this worker (admin only).
+    :param current_admin: Current authenticated admin user
+    :return: Pool metrics of the primary and each replica
+    """
+    engines = {"primary": engine} | {
+        f"replica-{number}": replica_engine
+        for number, replica_engine in enumerate(replica_engines, start=1)
+    }
+    return [
+        DatabasePoolStatsResponse(engine=name, **get_pool_stats(database_engine))
+        for name, database_engine in engines.items()
+    ]
+
+
+@router.get("/read-routing", response_model=ReadRoutingStatsResponse)
+async def get_read_routing_stats(
+    current_admin: User = Depends(get_current_admin_user),
+) -> ReadRoutingStatsResponse:
+    """
+    Get replica and read-your-writes routing counters of this worker (admin only).
+    :param current_admin: Current authenticated admin user
+    :return: Routing counters
+    """
+    return ReadRoutingStatsResponse(**read_router.stats())
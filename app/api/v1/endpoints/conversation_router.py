@@ -1,8 +1,15 @@
-from fastapi import APIRouter, Depends, status, Body
+from fastapi import APIRouter, Depends, status, Body, Query, Response
 
 from app.core.auth_dependencies import get_current_active_user
+from app.core.constants import MAX_MESSAGE_PAGE_SIZE
+from app.core.pagination import set_message_page_headers
 from app.models.user import User
-from app.schemas.chat_schemas import ConversationCreate, MessageResponse, MessageCreate
+from app.schemas.chat_schemas import (
+    ConversationCreate,
+    MessageResponse,
+    MessageCreate,
+    TranslationStatusResponse,
+)
 from app.services.conversation_service import ConversationService
 from app.services.service_dependencies import get_conversation_service
 
@@ -23,10 +30,13 @@ async def create_conversation(
     :param conversation_service: Service instance handling conversation logic
     :return: Success response with conversation info
     """
-    new_conversation = conversation_service.create_conversation(
+    new_conversation = await conversation_service.create_conversation(
         current_user=current_user,
         participant_usernames=conversation_data.participant_usernames,
         conversation_type=conversation_data.conversation_type,
+        message_retention_count=conversation_data.message_retention_count,
+        message_retention_days=conversation_data.message_retention_days,
+        message_retention_mode=conversation_data.message_retention_mode,
     )
     return {
         "message": f"{conversation_data.conversation_type.title()} conversation created successfully",
@@ -50,7 +60,7 @@ async def send_conversation_message(
     :param conversation_service: Service instance handling conversation logic
     :return: Created message object
     """
-    return conversation_service.send_message(
+    return await conversation_service.send_message(
         current_user=current_user,
         conversation_id=conversation_id,
         content=message_data.content,
@@ -60,26 +70,35 @@ async def send_conversation_message(
 @router.get("/{conversation_id}/messages", response_model=list[MessageResponse])
 async def get_conversation_messages(
     conversation_id: int,
-    page: int = 1,
-    page_size: int = 50,
+    response: Response,
+    page_size: int = Query(50, ge=1, le=MAX_MESSAGE_PAGE_SIZE),
+    before: int | None = Query(None, description="Load messages older than this ID"),
+    after: int | None = Query(None, description="Load messages newer than this ID"),
+    include_total: bool = Query(False, description="Return X-Total-Count header"),
     current_user: User = Depends(get_current_active_user),
     conversation_service: ConversationService = Depends(get_conversation_service),
 ) -> list[MessageResponse]:
     """
-    Get conversation message history.
+    Get conversation message history, newest first, with cursor pagination.
     :param conversation_id: Conversation ID to get messages from
-    :param page: Page number
+    :param response: Response to attach pagination headers to
     :param page_size: Messages per page
+    :param before: Message ID cursor for older messages
+    :param after: Message ID cursor for newer messages
+    :param include_total: Whether to count all conversation messages
     :param current_user: Current authenticated user
     :param conversation_service: Service instance handling conversation logic
     :return: List of conversation messages
     """
-    messages, total_count = conversation_service.get_messages(
+    messages, has_more, total_count = await conversation_service.get_messages(
         current_user=current_user,
         conversation_id=conversation_id,
-        page=page,
         page_size=page_size,
+        before=before,
+        after=after,
+        include_total=include_total,
     )
+    set_message_page_headers(response, messages, has_more, total_count)
 
     return messages
 
@@ -95,7 +114,7 @@ async def get_user_conversations(
     :param conversation_service: Service instance handling conversation logic
     :return: List of conversation dictionaries the user is part of
     """
-    return conversation_service.get_user_conversations(current_user.id)
+    return await conversation_service.get_user_conversations(current_user.id)
 
 
 @router.get("/{conversation_id}/participants", response_model=list[dict])
@@ -111,6 +130,31 @@ async def get_conversation_participants(
     :param conversation_service: Service instance handling conversation logic
     :return: List of participant user dictionaries for the given conversation
     """
-    return conversation_service.get_participants(
+    return await conversation_service.get_participants(
         current_user=current_user, conversation_id=conversation_id
     )
+
+
+@router.get(
+    "/{conversation_id}/messages/{message_id}/translation",
+    response_model=TranslationStatusResponse,
+)
+async def get_conversation_message_translation_status(
+    conversation_id: int,
+    message_id: int,
+    current_user: User = Depends(get_current_active_user),
+    conversation_service: ConversationService = Depends(get_conversation_service),
+) -> TranslationStatusResponse:
+    """
+    Poll background translation status of a conversation message.
+    :param conversation_id: Conversation ID of the message
+    :param message_id: Message ID
+    :param current_user: Current authenticated user
+    :param conversation_service: Service instance handling conversation logic
+    :return: Translation job status
+    """
+    return await conversation_service.get_message_translation_status(
+        current_user=current_user,
+        conversation_id=conversation_id,
+        message_id=message_id,
+    )
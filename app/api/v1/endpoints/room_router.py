@@ -1,7 +1,13 @@
-from fastapi import APIRouter, Depends, status, Body
+from fastapi import APIRouter, Depends, status, Body, Query, Response
 from app.core.auth_dependencies import get_current_active_user, get_current_admin_user
+from app.core.constants import MAX_MESSAGE_PAGE_SIZE
+from app.core.pagination import set_message_page_headers
 from app.models.user import User
-from app.schemas.chat_schemas import MessageResponse, MessageCreate
+from app.schemas.chat_schemas import (
+    MessageResponse,
+    MessageCreate,
+    TranslationStatusResponse,
+)
 from app.schemas.room_schemas import RoomResponse, RoomCreate
 from app.schemas.room_user_schemas import (
     RoomJoinResponse,
@@ -27,7 +33,7 @@ async def get_all_rooms(
     :param room_service: Service instance handling room logic
     :return: List of active rooms
     """
-    return room_service.get_all_rooms()
+    return await room_service.get_all_rooms()
 
 
 @router.post("/", response_model=RoomResponse, status_code=status.HTTP_201_CREATED)
@@ -43,11 +49,14 @@ async def create_room(
     :param room_service: Service instance handling room logic
     :return: Created room object
     """
-    return room_service.create_room(
+    return await room_service.create_room(
         name=room_data.name,
         description=room_data.description,
         max_users=room_data.max_users,
         is_translation_enabled=room_data.is_translation_enabled,
+        message_retention_count=room_data.message_retention_count,
+        message_retention_days=room_data.message_retention_days,
+        message_retention_mode=room_data.message_retention_mode,
     )
 
 
@@ -66,12 +75,15 @@ async def update_room(
     :param room_service: Service instance handling room logic
     :return: Updated room object
     """
-    return room_service.update_room(
+    return await room_service.update_room(
         room_id=room_id,
         name=room_data.name,
         description=room_data.description,
         max_users=room_data.max_users,
         is_translation_enabled=room_data.is_translation_enabled,
+        message_retention_count=room_data.message_retention_count,
+        message_retention_days=room_data.message_retention_days,
+        message_retention_mode=room_data.message_retention_mode,
     )
 
 
@@ -88,7 +100,7 @@ async def delete_room(
     :param room_service: Service instance handling room logic
     :return: Cleanup summary with statistics
     """
-    return room_service.delete_room(room_id)
+    return await room_service.delete_room(room_id)
 
 
 @router.get("/count")
@@ -102,7 +114,7 @@ async def get_room_count(
     :param room_service: Service instance handling room logic
     :return: Dictionary with room count
     """
-    return room_service.get_room_count()
+    return await room_service.get_room_count()
 
 
 @router.get("/health")
@@ -124,7 +136,7 @@ async def get_room_by_id(
     :param room_service: Service instance handling room logic
     :return: Room object
     """
-    return room_service.get_room_by_id(room_id)
+    return await room_service.get_room_by_id(room_id)
 
 
 @router.post("/{room_id}/join", response_model=RoomJoinResponse)
@@ -140,7 +152,7 @@ async def join_room(
     :param room_service: Service instance handling room logic
     :return: Join confirmation with room info
     """
-    return room_service.join_room(current_user, room_id)
+    return await room_service.join_room(current_user, room_id)
 
 
 @router.post("/{room_id}/leave", response_model=RoomLeaveResponse)
@@ -156,7 +168,7 @@ async def leave_room(
     :param room_service: Service instance handling room logic
     :return: Leave confirmation
     """
-    return room_service.leave_room(current_user, room_id)
+    return await room_service.leave_room(current_user, room_id)
 
 
 @router.get("/{room_id}/users", response_model=RoomUsersListResponse)
@@ -172,7 +184,21 @@ async def get_room_users(
     :param room_service: Service instance handling room logic
     :return: List of users in room
     """
-    return room_service.get_room_users(room_id)
+    return await room_service.get_room_users(room_id)
+
+
+@router.post("/heartbeat")
+async def heartbeat(
+    current_user: User = Depends(get_current_active_user),
+    room_service: RoomService = Depends(get_room_service),
+) -> dict:
+    """
+    Keep current user present, switching them back from idle AWAY.
+    :param current_user: Current authenticated user
+    :param room_service: Service instance handling room logic
+    :return: Heartbeat confirmation
+    """
+    return await room_service.heartbeat(current_user)
 
 
 @router.patch("/users/status")
@@ -188,7 +214,7 @@ async def update_user_status(
     :param room_service: Service instance handling room logic
     :return: Status update confirmation
     """
-    return room_service.update_user_status(current_user, status_update.status)
+    return await room_service.update_user_status(current_user, status_update.status)
 
 
 @router.post("/{room_id}/messages", response_model=MessageResponse)
@@ -206,27 +232,64 @@ async def send_room_message(
     :param room_service: Service instance handling room logic
     :return: Created message object
     """
-    return room_service.send_room_message(current_user, room_id, message_data.content)
+    return await room_service.send_room_message(
+        current_user, room_id, message_data.content
+    )
 
 
 @router.get("/{room_id}/messages", response_model=list[MessageResponse])
 async def get_room_messages(
     room_id: int,
-    page: int = 1,
-    page_size: int = 50,
+    response: Response,
+    page_size: int = Query(50, ge=1, le=MAX_MESSAGE_PAGE_SIZE),
+    before: int | None = Query(None, description="Load messages older than this ID"),
+    after: int | None = Query(None, description="Load messages newer than this ID"),
+    include_total: bool = Query(False, description="Return X-Total-Count header"),
     current_user: User = Depends(get_current_active_user),
     room_service: RoomService = Depends(get_room_service),
 ) -> list[MessageResponse]:
     """
-    Get room message history.
+    Get room message history, newest first, with cursor pagination.
     :param room_id: Room ID to get messages from
-    :param page: Page number
+    :param response: Response to attach pagination headers to
     :param page_size: Messages per page
+    :param before: Message ID cursor for older messages
+    :param after: Message ID cursor for newer messages
+    :param include_total: Whether to count all room messages
     :param current_user: Current authenticated User
     :param room_service: Service instance handling room logic
     :return: List of room messages
     """
-    messages, total_count = room_service.get_room_messages(
-        current_user, room_id, page, page_size
+    messages, has_more, total_count = await room_service.get_room_messages(
+        current_user,
+        room_id,
+        page_size=page_size,
+        before=before,
+        after=after,
+        include_total=include_total,
     )
+    set_message_page_headers(response, messages, has_more, total_count)
     return messages
+
+
+@router.get(
+    "/{room_id}/messages/{message_id}/translation",
+    response_model=TranslationStatusResponse,
+)
+async def get_room_message_translation_status(
+    room_id: int,
+    message_id: int,
+    current_user: User = Depends(get_current_active_user),
+    room_service: RoomService = Depends(get_room_service),
+) -> TranslationStatusResponse:
+    """
+    Poll background translation status of a room message.
+    :param room_id: Room ID of the message
+    :param message_id: Message ID
+    :param current_user: Current authenticated User
+    :param room_service: Service instance handling room logic
+    :return: Translation job status
+    """
+    return await room_service.get_message_translation_status(
+        current_user, room_id, message_id
+    )
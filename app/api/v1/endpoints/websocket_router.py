@@ -0,0 +1,141 @@
+import asyncio
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.schemas.websocket_schemas import WebSocketCommand
+from app.services.connection_manager import ClientConnection, connection_manager
+from app.services.presence_service import presence_service
+from app.services.service_dependencies import get_websocket_service
+from app.services.websocket_service import WebSocketService
+
+
+router = APIRouter(tags=["websocket"])
+
+
+@router.websocket("/ws")
+async def websocket_gateway(
+    websocket: WebSocket,
+    token: str | None = Query(None, description="JWT access token"),
+    db: AsyncSession = Depends(get_db),
+    websocket_service: WebSocketService = Depends(get_websocket_service),
+):
+    """
+    Real-time gateway pushing new messages and their translations.
+
+    Authenticate with ?token=<JWT> or an Authorization: Bearer header, then
+    send {"action": "subscribe", "channel": "room"|"conversation", "id": N}.
+    :param websocket: WebSocket connection
+    :param token: JWT token from query string
+    :param db: Database session, released while the socket is idle
+    :param websocket_service: Service instance handling authentication
+    """
+    authorization = websocket.headers.get("authorization", "")
+    if not token and authorization.lower().startswith("bearer "):
+        token = authorization[7:]
+
+    try:
+        user = await websocket_service.authenticate(token)
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    finally:
+        await db.close()
+
+    await websocket.accept()
+    connection = ClientConnection(
+        websocket=websocket,
+        user_id=user.id,
+        username=user.username,
+        preferred_language=user.preferred_language,
+    )
+    connection_manager.register(connection)
+
+    sender = connection.start_sender()
+    receiver = asyncio.create_task(_receive_commands(connection, db, websocket_service))
+    try:
+        await asyncio.wait({sender, receiver}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        connection_manager.unregister(connection)
+        for task in (sender, receiver):
+            task.cancel()
+        await asyncio.gather(sender, receiver, return_exceptions=True)
+        try:
+            await websocket.close()
+        except RuntimeError:
+            pass
+
+
+async def _receive_commands(
+    connection: ClientConnection,
+    db: AsyncSession,
+    websocket_service: WebSocketService,
+) -> None:
+    """
+    Handle client commands until the client disconnects.
+    :param connection: Client connection
+    :param db: Database session of the connection
+    :param websocket_service: Service instance handling authorization
+    """
+    try:
+        while True:
+            data = await connection.websocket.receive_text()
+            try:
+                command = WebSocketCommand.model_validate_json(data)
+                await _handle_command(connection, command, websocket_service)
+            except ValidationError as e:
+                connection.enqueue({"type": "error", "detail": e.errors()[0]["msg"]})
+            except HTTPException as e:
+                connection.enqueue({"type": "error", "detail": e.detail})
+            finally:
+                await db.close()
+    except WebSocketDisconnect:
+        return
+
+
+async def _handle_command(
+    connection: ClientConnection,
+    command: WebSocketCommand,
+    websocket_service: WebSocketService,
+) -> None:
+    """
+    Apply one client command.
+    :param connection: Client connection
+    :param command: Validated command
+    :param websocket_service: Service instance handling authorization
+    """
+    if command.action == "ping":
+        await presence_service.heartbeat(connection.user_id)
+        connection.enqueue({"type": "pong"})
+        return
+
+    if command.channel is None or command.id is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'channel' and 'id' are required",
+        )
+
+    if command.action == "unsubscribe":
+        channel = f"{command.channel}:{command.id}"
+        connection_manager.unsubscribe(connection, channel)
+        connection.enqueue({"type": "unsubscribed", "channel": channel})
+        return
+
+    channel, user = await websocket_service.authorize_subscription(
+        connection.user_id, command.channel, command.id
+    )
+    connection.preferred_language = (
+        user.preferred_language.upper() if user.preferred_language else None
+    )
+    connection_manager.subscribe(connection, channel)
+    connection.enqueue({"type": "subscribed", "channel": channel})
@@ -1,7 +1,10 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.database import get_db
 from app.core.jwt_utils import get_user_from_token
+from app.core.read_routing import bind_user
 from app.models.user import User
 from app.repositories.user_repository import IUserRepository
 from app.repositories.repository_dependencies import get_user_repository
@@ -30,16 +33,18 @@ async def get_token(
 async def get_current_user(
     token: str = Depends(get_token),
     user_repo: IUserRepository = Depends(get_user_repository),
+    db: AsyncSession = Depends(get_db),
 ) -> User:
     """
     Get current authenticated user from JWT token.
     :param token: JWT token string
     :param user_repo: User repository instance
+    :param db: Request database session, bound to the user for read routing
     :return: Current user object
     """
     username = get_user_from_token(token)
 
-    user = user_repo.get_by_username(username)
+    user = await user_repo.get_authenticated_user(username)
 
     if not user:
         raise HTTPException(
@@ -48,6 +53,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    bind_user(db, user.id)
     return user
 
 
@@ -1,7 +1,16 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import HTTPException, status
 from passlib.context import CryptContext
 
+from app.core.config import settings
+
 
-pwd_context = CryptContext(schemes=["bcrypt"])
+pwd_context = CryptContext(
+    schemes=["bcrypt"], bcrypt__rounds=settings.password_hash_rounds
+)
 
 
 def hash_password(password: str) -> str:
@@ -21,3 +30,118 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     :return: True if password matches, else False.
     """
     return pwd_context.verify(plain_password, hashed_password)
+
+
+class PasswordHashExecutor:
+    """
+    Bounded thread pool running bcrypt off the event loop.
+
+    bcrypt releases the GIL while hashing, so worker threads use spare cores
+    while the loop keeps serving other requests. At most max_pending calls
+    may wait or run at once; further calls are rejected instead of queueing
+    without limit.
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 64):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: ThreadPoolExecutor | None = None
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.queue_wait_total = 0.0
+        self.queue_wait_max = 0.0
+
+    async def run(self, func, *args):
+        """
+        Run a blocking hash function in the pool.
+        :param func: hash_password or verify_password
+        :param args: Arguments passed to func
+        :return: Result of func
+        """
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many authentication requests, try again later",
+                headers={"Retry-After": "1"},
+            )
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="password-hash"
+            )
+
+        submitted_at = time.perf_counter()
+        self.pending += 1
+        try:
+            wait, result = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._timed_call, submitted_at, func, *args
+            )
+        finally:
+            self.pending -= 1
+
+        self.completed += 1
+        self.queue_wait_total += wait
+        self.queue_wait_max = max(self.queue_wait_max, wait)
+        return result
+
+    @staticmethod
+    def _timed_call(submitted_at: float, func, *args) -> tuple[float, object]:
+        """
+        Call func in a worker thread.
+        :return: Tuple of (seconds spent waiting for a free worker, result)
+        """
+        wait = time.perf_counter() - submitted_at
+        return wait, func(*args)
+
+    def shutdown(self) -> None:
+        """Stop worker threads on application shutdown."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        """
+        Get pool counters.
+        :return: Dictionary with limits, pending/completed/rejected calls and
+            queue wait times in milliseconds
+        """
+        return {
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "queue_wait_avg_ms": (
+                self.queue_wait_total / self.completed * 1000 if self.completed else 0.0
+            ),
+            "queue_wait_max_ms": self.queue_wait_max * 1000,
+        }
+
+
+password_hash_executor = PasswordHashExecutor(
+    max_workers=settings.password_hash_workers,
+    max_pending=settings.password_hash_max_pending,
+)
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password in the password hash pool.
+    :param password: Plain text password
+    :return: Hashed password
+    """
+    return await password_hash_executor.run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password in the password hash pool.
+    :param plain_password: Plain text password
+    :param hashed_password: Hashed password
+    :return: True if password matches, else False.
+    """
+    return await password_hash_executor.run(
+        verify_password, plain_password, hashed_password
+    )
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -5,6 +7,24 @@ class Settings(BaseSettings):
     """Application settings"""
 
     database_url: str
+    # Streaming replicas for read-only queries, as JSON list (empty: primary)
+    database_replica_urls: list[str] = []
+    # Seconds a user reads from the primary after committing a write, must
+    # exceed the replication lag
+    database_replica_sticky_window: float = 5.0
+
+    # Connections kept open per engine and worker, and extra ones allowed
+    # under load before checkouts wait up to database_pool_timeout seconds
+    database_pool_size: int = 5
+    database_max_overflow: int = 10
+    database_pool_timeout: float = 30.0
+    database_pool_recycle: int = 3600
+    # Reuse the most recently returned connection, so surplus ones idle out
+    database_pool_use_lifo: bool = True
+    # Liveness check on checkout: every time, only after
+    # database_pool_ping_idle_seconds in the pool, or never
+    database_pool_pre_ping: Literal["always", "idle", "never"] = "idle"
+    database_pool_ping_idle_seconds: float = 30.0
 
     secret_key: str
     algorithm: str
@@ -12,9 +32,62 @@ class Settings(BaseSettings):
 
     app_name: str
     debug: bool
+    # Startup profile: dev migrates and seeds sample data, test migrates,
+    # prod only checks the schema version (see app/core/startup.py)
+    environment: Literal["dev", "test", "prod"] = "dev"
 
     deepl_api_key: str
 
+    translation_worker_count: int = 2
+    translation_max_concurrency: int = 8
+    translation_batch_size: int = 20
+    translation_batch_window: float = 0.05
+    translation_max_attempts: int = 5
+    translation_retry_base_delay: float = 2.0
+    translation_retry_max_delay: float = 300.0
+    # Processing jobs whose claim is older are taken over by another worker;
+    # jobs left behind are also looked for at this interval
+    translation_job_claim_timeout: float = 600.0
+
+    translation_cache_max_entries: int = 10000
+    translation_cache_ttl: float = 2592000.0
+    translation_cache_max_rows: int = 200000
+    translation_cache_prune_interval: float = 3600.0
+
+    event_backplane: str = "memory"
+
+    identity_cache_max_entries: int = 10000
+    identity_cache_ttl: float = 30.0
+
+    password_hash_rounds: int = 12
+    password_hash_workers: int = 2
+    password_hash_max_pending: int = 64
+
+    # Seconds between message retention sweeps (0 disables sweeping)
+    message_retention_interval: float = 300.0
+    message_retention_batch_size: int = 500
+    # Age limit of rooms/conversations without own policy (None: no limit)
+    message_retention_max_age_days: int | None = None
+
+    # Seconds between room occupancy reconciliations (0 disables them)
+    room_occupancy_reconcile_interval: float = 600.0
+
+    # Seconds without heartbeat until a user in a room turns AWAY
+    presence_idle_timeout: float = 300.0
+    # Seconds between idle expiry sweeps (0 disables them)
+    presence_sweep_interval: float = 15.0
+    # Minimum seconds between heartbeats of a user forwarded to other workers
+    presence_broadcast_interval: float = 60.0
+
+    # Seconds between flushes of buffered status/last_active updates, i.e.
+    # the loss window on a crash (0 disables periodic flushing)
+    user_activity_flush_interval: float = 5.0
+    # Buffered users triggering an early flush
+    user_activity_max_pending: int = 10000
+
+    # Seconds between DiceBear style catalog refreshes (0 disables refreshing)
+    avatar_style_refresh_interval: float = 86400.0
+
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", case_sensitive=False, extra="ignore"
     )
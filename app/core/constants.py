@@ -16,3 +16,7 @@ SUPPORTED_LANGUAGES = {
 CORE_TRANSLATION_LANGUAGES = ["EN", "DE", "FR", "ES", "IT"]
 
 MAX_ROOM_MESSAGES = 100
+
+MAX_CONVERSATION_MESSAGES = 1000
+
+MAX_MESSAGE_PAGE_SIZE = 100
@@ -1,42 +1,235 @@
-from sqlalchemy import create_engine
-from sqlalchemy.exc import IntegrityError, OperationalError
-from sqlalchemy.orm import declarative_base, sessionmaker
+import time
+
+from fastapi import Depends
+from sqlalchemy import event
+from sqlalchemy.exc import (
+    DisconnectionError,
+    IntegrityError,
+    OperationalError,
+    TimeoutError as PoolTimeoutError,
+)
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 
 from app.core.config import settings
+from app.core.read_routing import ReadRouter, RoutedReadSession
+from app.core.unit_of_work import UnitOfWork, transaction
+
+
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def get_async_database_url(database_url: str) -> str:
+    """
+    Rewrite a database URL to use its asyncio driver.
+    :param database_url: Configured database URL (e.g. postgresql://...)
+    :return: URL with async driver (e.g. postgresql+asyncpg://...)
+    """
+    scheme, separator, rest = database_url.partition("://")
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}{separator}{rest}"
+
+
+class MeteredQueuePool(AsyncAdaptedQueuePool):
+    """
+    Connection pool counting checkouts and the time spent waiting for a
+    free connection (including opening a new one).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            connection_record = super()._do_get()
+        except PoolTimeoutError:
+            self.timeouts += 1
+            raise
+
+        wait = time.perf_counter() - started_at
+        self.checkouts += 1
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+        return connection_record
+
+    def stats(self) -> dict:
+        """
+        Get pool gauges and counters.
+        :return: Dictionary with size, connections in use, overflow and
+            checkout wait times in milliseconds
+        """
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_avg_ms": (
+                self.wait_total / self.checkouts * 1000 if self.checkouts else 0.0
+            ),
+            "wait_max_ms": self.wait_max * 1000,
+        }
+
+
+def ping_idle_connections(engine: AsyncEngine, idle_seconds: float) -> None:
+    """
+    Ping connections on checkout only when they sat idle in the pool for
+    idle_seconds, instead of one extra round-trip on every checkout. Busy
+    connections were in use moments ago and skip the check.
+    :param engine: Database engine
+    :param idle_seconds: Idle time after which a connection is pinged
+    """
 
+    @event.listens_for(engine.sync_engine, "checkin")
+    def stamp_checkin(dbapi_connection, connection_record):
+        connection_record.info["checked_in_at"] = time.monotonic()
 
-engine = create_engine(
-    settings.database_url, pool_pre_ping=True, pool_recycle=3600, echo=settings.debug
+    @event.listens_for(engine.sync_engine, "checkout")
+    def ping_if_idle(dbapi_connection, connection_record, connection_proxy):
+        checked_in_at = connection_record.info.get("checked_in_at")
+        if checked_in_at is None or time.monotonic() - checked_in_at < idle_seconds:
+            return
+        try:
+            engine.dialect.do_ping(dbapi_connection)
+        except Exception as e:
+            # The pool discards the connection and checks out another one
+            raise DisconnectionError(f"Idle connection is gone: {e}") from e
+
+
+def create_database_engine(database_url: str) -> AsyncEngine:
+    """
+    Create async engine with the pool configured in settings.
+    SQLite keeps SQLAlchemy's default pool.
+    :param database_url: Configured database URL
+    :return: AsyncEngine instance
+    """
+    async_url = get_async_database_url(database_url)
+    if async_url.startswith("sqlite"):
+        return create_async_engine(async_url, echo=settings.debug)
+
+    database_engine = create_async_engine(
+        async_url,
+        poolclass=MeteredQueuePool,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout,
+        pool_recycle=settings.database_pool_recycle,
+        pool_use_lifo=settings.database_pool_use_lifo,
+        pool_pre_ping=settings.database_pool_pre_ping == "always",
+        echo=settings.debug,
+    )
+    if settings.database_pool_pre_ping == "idle":
+        ping_idle_connections(database_engine, settings.database_pool_ping_idle_seconds)
+    return database_engine
+
+
+def get_pool_stats(database_engine: AsyncEngine) -> dict:
+    """
+    Get connection pool metrics of an engine.
+    :param database_engine: Database engine
+    :return: Dictionary of pool metrics, zeros for pools without metering
+    """
+    pool = database_engine.sync_engine.pool
+    if isinstance(pool, MeteredQueuePool):
+        return {"pool_class": type(pool).__name__, **pool.stats()}
+    return {
+        "pool_class": type(pool).__name__,
+        "size": 0,
+        "checked_out": 0,
+        "overflow": 0,
+        "max_overflow": 0,
+        "checkouts": 0,
+        "timeouts": 0,
+        "wait_avg_ms": 0.0,
+        "wait_max_ms": 0.0,
+    }
+
+
+engine = create_database_engine(settings.database_url)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Streaming replicas serving read-only repository queries
+replica_engines = [
+    create_database_engine(replica_url)
+    for replica_url in settings.database_replica_urls
+]
+
+read_router = ReadRouter(
+    replica_session_factories=[
+        async_sessionmaker(
+            bind=replica_engine,
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+        for replica_engine in replica_engines
+    ],
+    sticky_window=settings.database_replica_sticky_window,
+)
 
 Base = declarative_base()
 
 
-def get_db():
-    """Database session dependency"""
-    db = SessionLocal()
-    try:
+async def get_db():
+    """
+    Database session dependency and unit of work of the request:
+    committed once after the endpoint returned, rolled back on error.
+    """
+    async with AsyncSessionLocal() as db, transaction(db) as unit_of_work:
+        unit_of_work.after_commit(lambda: read_router.record_writes(db))
         yield db
+
+
+async def get_read_db(db: AsyncSession = Depends(get_db)):
+    """
+    Database session dependency for read-only repository queries, routed
+    to a replica or, for read-your-writes, to the request session.
+    :param db: Request database session
+    """
+    read_db = RoutedReadSession(read_router, db)
+    try:
+        yield read_db
     finally:
-        db.close()
+        await read_db.close()
 
 
-def create_tables():
-    """Create all database tables"""
-    Base.metadata.create_all(bind=engine)
-    print("All tables created")
+def get_unit_of_work(db: AsyncSession = Depends(get_db)) -> UnitOfWork:
+    """
+    Get unit of work of the request session.
+    :param db: Request database session
+    :return: UnitOfWork instance
+    """
+    return UnitOfWork.of(db)
 
 
-def drop_tables():
+async def drop_tables():
     """Drop all database tables"""
     try:
-        Base.metadata.drop_all(bind=engine, checkfirst=True)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all, checkfirst=True)
     except (IntegrityError, OperationalError) as e:
         print(f"FK constraint issue, using reflect method: {e}")
-        Base.metadata.reflect(bind=engine)
-        Base.metadata.drop_all(bind=engine)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.reflect)
+            await conn.run_sync(Base.metadata.drop_all)
 
     print("All tables dropped")
@@ -0,0 +1,144 @@
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.lru_cache import TTLLRUCache
+from app.core.unit_of_work import UnitOfWork
+from app.models.user import User
+
+
+# Backplane event telling every worker to drop cached users
+USERS_CHANGED_EVENT = "identity.users_changed"
+
+# User IDs per event, keeping the payload well below the NOTIFY limit
+INVALIDATION_BATCH_SIZE = 500
+
+
+class IdentityCache:
+    """
+    Short-lived cache of authenticated users keyed by token subject (username).
+
+    Stores column snapshots instead of ORM instances, so a cached user can
+    never carry changes of another request. Entries are dropped on every
+    write through UserRepository; once the write committed, the other
+    worker processes drop them too through the event backplane.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 30.0):
+        self._entries = TTLLRUCache(max_entries=max_entries, ttl=ttl)
+        self._usernames_by_id: dict[int, str] = {}
+        self._backplane = None
+        self.invalidations = 0
+
+    def attach(self, backplane) -> None:
+        """
+        Share invalidations with the other workers over the event backplane.
+        :param backplane: Event backplane of the connection manager
+        """
+        if self._backplane is backplane:
+            return
+        self._backplane = backplane
+        backplane.add_listener(self.handle_event)
+
+    def get(self, username: str) -> dict | None:
+        """
+        Get column values of a cached user.
+        :param username: Token subject
+        :return: Column values or None on miss
+        """
+        return self._entries.get(username)
+
+    def put(self, user: User, generation: int | None = None) -> None:
+        """
+        Cache snapshot of a freshly loaded user.
+        :param user: Loaded user
+        :param generation: Value of invalidations before the user was loaded;
+            the snapshot is skipped if an invalidation happened since
+        """
+        if generation is not None and generation != self.invalidations:
+            return
+
+        values = {
+            attribute.key: getattr(user, attribute.key)
+            for attribute in inspect(User).column_attrs
+        }
+        self._entries.put(user.username, values)
+        self._usernames_by_id[user.id] = user.username
+
+    def invalidate(self, user_id: int) -> None:
+        """
+        Drop cached user after a write.
+        :param user_id: ID of the changed user
+        """
+        self.invalidations += 1
+        username = self._usernames_by_id.pop(user_id, None)
+        if username is not None:
+            self._entries.pop(username)
+
+    async def publish_invalidation(self, user_ids: list[int]) -> None:
+        """
+        Drop committed changes of users here and on every other worker.
+        :param user_ids: IDs of the changed users
+        """
+        for user_id in user_ids:
+            self.invalidate(user_id)
+        if self._backplane is None:
+            return
+
+        for start in range(0, len(user_ids), INVALIDATION_BATCH_SIZE):
+            batch = user_ids[start : start + INVALIDATION_BATCH_SIZE]
+            try:
+                await self._backplane.publish(
+                    {"type": USERS_CHANGED_EVENT, "user_ids": batch}
+                )
+            except Exception as e:
+                print(f"Failed to publish {USERS_CHANGED_EVENT} event: {e}")
+
+    def handle_event(self, event: dict) -> None:
+        """
+        Apply an invalidation received from the backplane.
+        :param event: Event dictionary
+        """
+        if event.get("type") == USERS_CHANGED_EVENT:
+            for user_id in event["user_ids"]:
+                self.invalidate(user_id)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        self._entries.clear()
+        self._usernames_by_id.clear()
+        self.invalidations = 0
+
+    def stats(self) -> dict:
+        """
+        Get cache counters.
+        :return: Dictionary with size, hits, misses, evictions, expirations
+            and invalidations
+        """
+        return {**self._entries.stats(), "invalidations": self.invalidations}
+
+
+identity_cache = IdentityCache(
+    max_entries=settings.identity_cache_max_entries,
+    ttl=settings.identity_cache_ttl,
+)
+
+
+def invalidate_on_commit(session: AsyncSession, user_ids: list[int]) -> None:
+    """
+    Drop cached users changed in session now and again on every worker once
+    the change is committed, so a concurrent request cannot re-cache the old
+    row in between.
+    :param session: Session holding the uncommitted change
+    :param user_ids: IDs of the changed users
+    """
+    if not user_ids:
+        return
+
+    for user_id in user_ids:
+        identity_cache.invalidate(user_id)
+
+    user_ids = list(user_ids)
+    UnitOfWork.of(session).after_commit(
+        lambda: identity_cache.publish_invalidation(user_ids)
+    )
@@ -0,0 +1,91 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class TTLLRUCache:
+    """
+    In-process LRU cache whose entries expire after ttl seconds.
+
+    The least recently used entry is evicted once max_entries is exceeded.
+    Not thread-safe; meant to be used from the event loop only.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 86400.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any | None:
+        """
+        Get cached value and mark it as recently used.
+        :param key: Cache key
+        :return: Cached value or None on miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store value, evicting least recently used entries if full.
+        :param key: Cache key
+        :param value: Value to cache
+        """
+        if self.max_entries <= 0:
+            return
+
+        self._entries[key] = (value, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key: Hashable) -> Any | None:
+        """
+        Remove entry.
+        :param key: Cache key
+        :return: Removed value or None
+        """
+        entry = self._entries.pop(key, None)
+        return entry[0] if entry else None
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def stats(self) -> dict:
+        """
+        Get cache counters.
+        :return: Dictionary with size, hits, misses, evictions and expirations
+        """
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
@@ -0,0 +1,304 @@
+import importlib
+import pkgutil
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from types import ModuleType
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    String,
+    Table,
+    func,
+    insert,
+    inspect,
+    select,
+    text,
+)
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.core.database import Base
+
+
+MIGRATIONS_PACKAGE = "app.migrations"
+
+# Key of the PostgreSQL advisory lock held while migrating
+MIGRATION_LOCK_KEY = 7_310_021
+
+schema_migrations = Table(
+    "schema_migrations",
+    Base.metadata,
+    Column("version", Integer, primary_key=True),
+    Column("name", String(100), nullable=False),
+    Column("applied_at", DateTime(timezone=True), server_default=func.now()),
+)
+
+
+@dataclass
+class Migration:
+    """
+    One versioned upgrade script of app/migrations.
+
+    Scripts are named v<version>_<name>.py and define
+    `async def upgrade(conn: AsyncConnection) -> None`. They must be
+    idempotent (IF NOT EXISTS / IF EXISTS), because databases created
+    before versioned migrations may already have some of their changes.
+    Table definitions are frozen in the scripts, never taken from the
+    models, so a revision always applies the same schema change.
+
+    Scripts setting TRANSACTIONAL = False run in autocommit mode, which
+    online index builds (CREATE INDEX CONCURRENTLY) require; a failure
+    leaves their earlier statements applied, so the rerun must cope.
+    """
+
+    version: int
+    name: str
+    upgrade: Callable[[AsyncConnection], Awaitable[None]]
+    transactional: bool = True
+
+
+def _load_migration(module: ModuleType, module_name: str) -> Migration:
+    """
+    Build migration from an upgrade script module.
+    :param module: Imported script module
+    :param module_name: Module name, e.g. v002_hot_query_indexes
+    :return: Migration instance
+    """
+    version, _, name = module_name[1:].partition("_")
+    return Migration(
+        version=int(version),
+        name=name,
+        upgrade=module.upgrade,
+        transactional=getattr(module, "TRANSACTIONAL", True),
+    )
+
+
+def load_migrations(package: str = MIGRATIONS_PACKAGE) -> list[Migration]:
+    """
+    Discover upgrade scripts ordered by version.
+    :param package: Package holding the scripts
+    :return: List of migrations
+    """
+    scripts = importlib.import_module(package)
+    migrations = [
+        _load_migration(importlib.import_module(f"{package}.{info.name}"), info.name)
+        for info in pkgutil.iter_modules(scripts.__path__)
+        if info.name.startswith("v") and info.name[1:4].isdigit()
+    ]
+    migrations.sort(key=lambda migration: migration.version)
+
+    versions = [migration.version for migration in migrations]
+    if len(set(versions)) != len(versions):
+        raise RuntimeError(f"Duplicate migration versions in {package}: {versions}")
+    return migrations
+
+
+async def get_applied_versions(conn: AsyncConnection) -> set[int]:
+    """
+    Get versions recorded in schema_migrations.
+    :param conn: Database connection
+    :return: Set of applied versions
+    """
+    await conn.run_sync(schema_migrations.create, checkfirst=True)
+    result = await conn.execute(select(schema_migrations.c.version))
+    return set(result.scalars().all())
+
+
+async def get_pending_versions(
+    engine: AsyncEngine, migrations: list[Migration] | None = None
+) -> list[int]:
+    """
+    Get versions not applied yet, without issuing DDL.
+    :param engine: Database engine
+    :param migrations: Known migrations (default: all scripts)
+    :return: List of pending versions
+    """
+    if migrations is None:
+        migrations = load_migrations()
+
+    async with engine.connect() as conn:
+        if await conn.run_sync(
+            lambda sync_conn: inspect(sync_conn).has_table(schema_migrations.name)
+        ):
+            result = await conn.execute(select(schema_migrations.c.version))
+            applied = set(result.scalars().all())
+        else:
+            applied = set()
+    return [m.version for m in migrations if m.version not in applied]
+
+
+async def check_schema(engine: AsyncEngine) -> None:
+    """
+    Make sure the migrate command brought the database up to date.
+    :param engine: Database engine
+    :raises RuntimeError: If migrations are pending
+    """
+    pending = await get_pending_versions(engine)
+    if pending:
+        raise RuntimeError(
+            f"Database schema is behind, pending migrations: {pending}. "
+            "Run `python migrate.py` first."
+        )
+
+
+async def migrate(
+    engine: AsyncEngine, migrations: list[Migration] | None = None
+) -> list[int]:
+    """
+    Apply pending migrations in version order. Transactional scripts commit
+    together with their schema_migrations row; the others are recorded
+    once they completed. On PostgreSQL an advisory lock keeps concurrent
+    runs from applying the same scripts.
+    :param engine: Database engine
+    :param migrations: Migrations to apply (default: all scripts)
+    :return: Versions applied by this run
+    """
+    if migrations is None:
+        migrations = load_migrations()
+
+    async with engine.connect() as lock_conn:
+        if engine.dialect.name == "postgresql":
+            await lock_conn.execute(
+                text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY}
+            )
+            await lock_conn.commit()
+        try:
+            return await _apply_pending(engine, migrations)
+        finally:
+            if engine.dialect.name == "postgresql":
+                await lock_conn.execute(
+                    text("SELECT pg_advisory_unlock(:key)"),
+                    {"key": MIGRATION_LOCK_KEY},
+                )
+                await lock_conn.commit()
+
+
+async def _apply_pending(engine: AsyncEngine, migrations: list[Migration]) -> list[int]:
+    """
+    Apply migrations missing from schema_migrations.
+    :param engine: Database engine
+    :param migrations: Known migrations
+    :return: Versions applied
+    """
+    async with engine.begin() as conn:
+        applied = await get_applied_versions(conn)
+
+    newly_applied = []
+    for migration in migrations:
+        if migration.version in applied:
+            continue
+        record = insert(schema_migrations).values(
+            version=migration.version, name=migration.name
+        )
+        if migration.transactional:
+            async with engine.begin() as conn:
+                await migration.upgrade(conn)
+                await conn.execute(record)
+        else:
+            async with engine.connect() as conn:
+                conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+                await migration.upgrade(conn)
+                await conn.execute(record)
+        print(f"Applied migration {migration.version:03d} {migration.name}")
+        newly_applied.append(migration.version)
+    return newly_applied
+
+
+def _sql_true(conn: AsyncConnection) -> str:
+    """
+    Boolean true literal as SQLAlchemy renders it in `column IS true`,
+    so partial index predicates match the predicates of the queries.
+    :param conn: Database connection
+    :return: SQL literal
+    """
+    return "1" if conn.dialect.name == "sqlite" else "true"
+
+
+def _concurrently(conn: AsyncConnection, concurrently: bool) -> str:
+    """
+    CONCURRENTLY keyword where the dialect builds indexes online.
+    :param conn: Database connection
+    :param concurrently: Whether an online build was requested
+    :return: SQL keyword with trailing space, or empty string
+    """
+    return "CONCURRENTLY " if concurrently and conn.dialect.name == "postgresql" else ""
+
+
+async def create_index(
+    conn: AsyncConnection,
+    name: str,
+    table: str,
+    columns: list[str],
+    where: str | None = None,
+    unique: bool = False,
+    concurrently: bool = False,
+) -> None:
+    """
+    Create index unless it exists.
+    :param conn: Database connection
+    :param name: Index name
+    :param table: Table name
+    :param columns: Indexed columns
+    :param where: Partial index predicate, {true} is replaced by the
+        dialect's boolean literal (e.g. "is_active IS {true}")
+    :param unique: Create unique index
+    :param concurrently: Build without blocking writes on PostgreSQL;
+        needs an autocommit connection (TRANSACTIONAL = False)
+    """
+    keyword = _concurrently(conn, concurrently)
+    if keyword:
+        # An interrupted online build leaves an invalid index behind,
+        # which IF NOT EXISTS would take for a finished one
+        result = await conn.execute(
+            text(
+                "SELECT 1 FROM pg_index JOIN pg_class ON pg_class.oid = indexrelid "
+                "WHERE relname = :name AND NOT indisvalid"
+            ),
+            {"name": name},
+        )
+        if result.first() is not None:
+            await drop_index(conn, name, concurrently=True)
+
+    statement = (
+        f"CREATE {'UNIQUE ' if unique else ''}INDEX {keyword}IF NOT EXISTS {name} "
+        f"ON {table} ({', '.join(columns)})"
+    )
+    if where:
+        statement += f" WHERE {where.format(true=_sql_true(conn))}"
+    await conn.execute(text(statement))
+
+
+async def drop_index(
+    conn: AsyncConnection, name: str, concurrently: bool = False
+) -> None:
+    """
+    Drop index if it exists.
+    :param conn: Database connection
+    :param name: Index name
+    :param concurrently: Drop without blocking queries on PostgreSQL;
+        needs an autocommit connection (TRANSACTIONAL = False)
+    """
+    keyword = _concurrently(conn, concurrently)
+    await conn.execute(text(f"DROP INDEX {keyword}IF EXISTS {name}"))
+
+
+async def add_column(conn: AsyncConnection, table: str, column: str, ddl: str) -> bool:
+    """
+    Add column unless it exists.
+    :param conn: Database connection
+    :param table: Table name
+    :param column: Column name
+    :param ddl: Column type and constraints, e.g. "INTEGER NOT NULL DEFAULT 0"
+    :return: True if the column was added
+    """
+    existing = await conn.run_sync(
+        lambda sync_conn: {
+            existing_column["name"]
+            for existing_column in inspect(sync_conn).get_columns(table)
+        }
+    )
+    if column in existing:
+        return False
+    await conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}"))
+    return True
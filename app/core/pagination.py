@@ -0,0 +1,28 @@
+from fastapi import Response
+
+from app.models.message import Message
+
+
+def set_message_page_headers(
+    response: Response,
+    messages: list[Message],
+    has_more: bool,
+    total_count: int | None = None,
+) -> None:
+    """
+    Expose keyset pagination state of a message history page as headers.
+    Messages are ordered newest first, so the last message is the cursor for
+    older messages (?before=) and the first one for newer messages (?after=).
+    :param response: Outgoing response
+    :param messages: Messages of the current page
+    :param has_more: Whether more messages exist in the paging direction
+    :param total_count: Total number of messages if requested
+    """
+    response.headers["X-Has-More"] = "true" if has_more else "false"
+
+    if messages:
+        response.headers["X-Before-Cursor"] = str(messages[-1].id)
+        response.headers["X-After-Cursor"] = str(messages[0].id)
+
+    if total_count is not None:
+        response.headers["X-Total-Count"] = str(total_count)
@@ -0,0 +1,229 @@
+import itertools
+import time
+from collections.abc import Sequence
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+
+# Backplane event telling every worker that a user just committed a write
+USER_WROTE_EVENT = "db.user_wrote"
+
+
+@event.listens_for(Session, "after_flush")
+def _flag_flushed_writes(session, flush_context):
+    """Flag sessions that flushed pending ORM changes."""
+    session.info["has_writes"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _flag_executed_writes(orm_execute_state):
+    """
+    Flag sessions whose INSERT, UPDATE or DELETE statements changed rows.
+    Statements run with execution option read_your_writes=False, such as
+    read watermarks, never make the user sticky.
+    """
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return None
+    if not orm_execute_state.execution_options.get("read_your_writes", True):
+        return None
+    if orm_execute_state.is_insert:
+        orm_execute_state.session.info["has_writes"] = True
+        return None
+
+    result = orm_execute_state.invoke_statement()
+    # RETURNING results carry no rowcount; count them as writes
+    if getattr(result, "rowcount", None) != 0:
+        orm_execute_state.session.info["has_writes"] = True
+    return result
+
+
+def bind_user(session: AsyncSession, user_id: int) -> None:
+    """
+    Remember the authenticated user of a request session, whose writes
+    make the user's following reads sticky to the primary.
+    :param session: Request database session
+    :param user_id: Authenticated user ID
+    """
+    session.info["user_id"] = user_id
+
+
+class ReadRouter:
+    """
+    Chooses the database of read-only repository queries.
+
+    Reads go to the replicas in turn. A user whose own write committed less
+    than sticky_window seconds ago reads from the primary, so replication
+    lag never hides what the user just wrote (read-your-writes). Writes are
+    announced on the event backplane, keeping the user sticky on whichever
+    worker serves the next request.
+    """
+
+    def __init__(
+        self,
+        replica_session_factories: Sequence[async_sessionmaker[AsyncSession]] = (),
+        sticky_window: float = 5.0,
+    ):
+        self.replica_session_factories = list(replica_session_factories)
+        self.sticky_window = sticky_window
+        self._replicas = itertools.cycle(self.replica_session_factories)
+        self._written_at: dict[int, float] = {}
+        self._backplane = None
+
+        self.replica_reads = 0
+        self.primary_reads = 0
+        self.sticky_reads = 0
+
+    def attach(self, backplane) -> None:
+        """
+        Share write marks with the other workers over the event backplane.
+        :param backplane: Event backplane of the connection manager
+        """
+        if self._backplane is backplane:
+            return
+        self._backplane = backplane
+        backplane.add_listener(self.handle_event)
+
+    def route(self, session: AsyncSession) -> async_sessionmaker[AsyncSession] | None:
+        """
+        Pick the database for the reads of a request.
+        :param session: Request session on the primary
+        :return: Replica session factory, or None to read from the primary
+        """
+        if not self.replica_session_factories:
+            self.primary_reads += 1
+            return None
+
+        if session.info.get("has_writes") or self.is_sticky(
+            session.info.get("user_id")
+        ):
+            self.sticky_reads += 1
+            return None
+
+        self.replica_reads += 1
+        return next(self._replicas)
+
+    def is_sticky(self, user_id: int | None) -> bool:
+        """
+        Check whether a user committed a write within the sticky window.
+        :param user_id: User ID or None for anonymous requests
+        :return: True if the user must read from the primary
+        """
+        written_at = self._written_at.get(user_id)
+        if written_at is None:
+            return False
+        if time.monotonic() - written_at < self.sticky_window:
+            return True
+        del self._written_at[user_id]
+        return False
+
+    async def record_writes(self, session: AsyncSession) -> None:
+        """
+        Make the user of a committed session sticky if the session wrote.
+        Other workers are told at most twice per window and user.
+        :param session: Committed request session
+        """
+        user_id = session.info.get("user_id")
+        if not session.info.pop("has_writes", False) or user_id is None:
+            return
+        if not self.replica_session_factories:
+            return
+
+        now = time.monotonic()
+        last_written_at = self._written_at.get(user_id)
+        self._written_at[user_id] = now
+        if self._backplane is None or (
+            last_written_at is not None
+            and now - last_written_at < self.sticky_window / 2
+        ):
+            return
+
+        try:
+            await self._backplane.publish(
+                {"type": USER_WROTE_EVENT, "user_id": user_id}
+            )
+        except Exception as e:
+            print(f"Failed to publish {USER_WROTE_EVENT} event: {e}")
+
+    def handle_event(self, event: dict) -> None:
+        """
+        Apply a write mark received from the backplane.
+        :param event: Event dictionary
+        """
+        if event.get("type") == USER_WROTE_EVENT:
+            self._written_at[event["user_id"]] = time.monotonic()
+
+    def prune(self) -> None:
+        """Forget users whose sticky window ended."""
+        cutoff = time.monotonic() - self.sticky_window
+        self._written_at = {
+            user_id: written_at
+            for user_id, written_at in self._written_at.items()
+            if written_at > cutoff
+        }
+
+    def stats(self) -> dict:
+        """
+        Get routing counters since process start.
+        :return: Dictionary of counters
+        """
+        self.prune()
+        return {
+            "replicas": len(self.replica_session_factories),
+            "sticky_window": self.sticky_window,
+            "sticky_users": len(self._written_at),
+            "replica_reads": self.replica_reads,
+            "sticky_reads": self.sticky_reads,
+            "primary_reads": self.primary_reads,
+        }
+
+
+class RoutedReadSession:
+    """
+    Session of the read-only repository queries of one request.
+
+    The target database is chosen on the first query, when authentication
+    already bound the user to the request session, and kept for the rest
+    of the request so all its reads see one snapshot.
+    """
+
+    def __init__(self, router: ReadRouter, primary: AsyncSession):
+        self.router = router
+        self.primary = primary
+        self._session: AsyncSession | None = None
+
+    @property
+    def session(self) -> AsyncSession:
+        """
+        Get session reads are sent to, routing on first access.
+        :return: Replica or primary session
+        """
+        if self._session is None:
+            session_factory = self.router.route(self.primary)
+            self._session = (
+                self.primary if session_factory is None else session_factory()
+            )
+        return self._session
+
+    async def execute(self, statement, *args, **kwargs):
+        """Execute statement on the routed session."""
+        return await self.session.execute(statement, *args, **kwargs)
+
+    async def scalar(self, statement, *args, **kwargs):
+        """Execute statement on the routed session and return a scalar."""
+        return await self.session.scalar(statement, *args, **kwargs)
+
+    async def scalars(self, statement, *args, **kwargs):
+        """Execute statement on the routed session and return scalars."""
+        return await self.session.scalars(statement, *args, **kwargs)
+
+    async def close(self) -> None:
+        """Close replica session; the primary belongs to the request."""
+        if self._session is not None and self._session is not self.primary:
+            await self._session.close()
+        self._session = None
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class StartupProfile:
+    """
+    Work a worker process does on startup before serving requests,
+    selected by the ENVIRONMENT setting.
+    """
+
+    name: str
+    # Apply pending migrations instead of only checking the schema version
+    migrate: bool
+    # Create sample users and rooms (bcrypt hashing, several queries)
+    seed: bool
+    # Recount room occupancy now instead of on the first periodic pass
+    reconcile_occupancy: bool
+
+
+STARTUP_PROFILES = {
+    "dev": StartupProfile("dev", migrate=True, seed=True, reconcile_occupancy=True),
+    "test": StartupProfile("test", migrate=True, seed=False, reconcile_occupancy=True),
+    "prod": StartupProfile(
+        "prod", migrate=False, seed=False, reconcile_occupancy=False
+    ),
+}
+
+
+def get_startup_profile(environment: str) -> StartupProfile:
+    """
+    Get startup profile of an environment.
+    :param environment: Environment name (dev, test or prod)
+    :return: StartupProfile instance
+    :raises ValueError: If the environment is unknown
+    """
+    try:
+        return STARTUP_PROFILES[environment]
+    except KeyError:
+        raise ValueError(
+            f"Unknown environment '{environment}', "
+            f"expected one of {sorted(STARTUP_PROFILES)}"
+        ) from None
@@ -0,0 +1,88 @@
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+AfterCommitCallback = Callable[[], Awaitable[None]]
+
+
+class UnitOfWork:
+    """
+    Transaction boundary of one request or background job.
+
+    Repositories only flush; the owner of the session commits once at the
+    end. Side effects that must not be observed before the data is durable
+    (job hand-off, WebSocket events, cache invalidation) are registered with
+    after_commit and run once the commit succeeded.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self._after_commit: list[AfterCommitCallback] = []
+
+    @classmethod
+    def of(cls, session: AsyncSession) -> "UnitOfWork":
+        """
+        Get unit of work bound to session, creating it on first use.
+        :param session: Database session
+        :return: UnitOfWork instance
+        """
+        unit_of_work = session.info.get("unit_of_work")
+        if unit_of_work is None:
+            unit_of_work = session.info["unit_of_work"] = cls(session)
+        return unit_of_work
+
+    def after_commit(self, callback: AfterCommitCallback) -> None:
+        """
+        Run callback after the next successful commit.
+        :param callback: Coroutine function without arguments
+        """
+        self._after_commit.append(callback)
+
+    async def commit(self) -> None:
+        """Commit session, then run registered callbacks."""
+        await self.session.commit()
+
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            try:
+                await callback()
+            except Exception as e:
+                print(f"After-commit callback failed: {e}")
+
+    async def rollback(self) -> None:
+        """Roll back session and drop registered callbacks."""
+        self._after_commit = []
+        await self.session.rollback()
+
+
+@asynccontextmanager
+async def transaction(session: AsyncSession) -> AsyncIterator[UnitOfWork]:
+    """
+    Commit session on success, roll back on error.
+    :param session: Database session
+    :return: Unit of work of the session
+    """
+    unit_of_work = UnitOfWork.of(session)
+    try:
+        yield unit_of_work
+    except BaseException:
+        await unit_of_work.rollback()
+        raise
+    await unit_of_work.commit()
+
+
+async def run_after_commit(
+    unit_of_work: UnitOfWork | None, callback: AfterCommitCallback
+) -> None:
+    """
+    Defer callback until the unit of work commits, or run it right away
+    when there is no unit of work (e.g. in unit tests).
+    :param unit_of_work: Unit of work or None
+    :param callback: Coroutine function without arguments
+    """
+    if unit_of_work is None:
+        await callback()
+    else:
+        unit_of_work.after_commit(callback)
@@ -0,0 +1,3 @@
+"""
+Versioned schema upgrade scripts, applied in order by app.core.migrations.
+"""
@@ -0,0 +1,161 @@
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    func,
+)
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+
+# Tables of the first release, frozen here so that model changes never alter
+# this revision; later revisions bring them up to date
+metadata = MetaData()
+
+Table(
+    "rooms",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String(100), unique=True, nullable=False),
+    Column("description", Text, nullable=True),
+    Column("max_users", Integer, nullable=True),
+    Column("is_translation_enabled", Boolean, nullable=False),
+    Column("is_active", Boolean, nullable=False),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+)
+
+Table(
+    "users",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("email", String(255), unique=True, nullable=False, index=True),
+    Column("username", String(100), unique=True, nullable=False, index=True),
+    Column("password_hash", String(255), nullable=False),
+    Column("avatar_url", String(500), nullable=True),
+    Column("preferred_language", String(5), nullable=True),
+    Column(
+        "status", Enum("AVAILABLE", "BUSY", "AWAY", name="userstatus"), nullable=False
+    ),
+    Column("is_active", Boolean, nullable=False),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("last_active", DateTime(timezone=True), server_default=func.now()),
+    Column("is_admin", Boolean, nullable=False),
+    Column(
+        "current_room_id",
+        Integer,
+        ForeignKey("rooms.id", ondelete="SET NULL"),
+        nullable=True,
+    ),
+)
+
+Table(
+    "conversations",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column(
+        "room_id", Integer, ForeignKey("rooms.id", ondelete="SET NULL"), nullable=False
+    ),
+    Column(
+        "conversation_type",
+        Enum("PRIVATE", "GROUP", name="conversationtype"),
+        nullable=False,
+    ),
+    Column("max_participants", Integer, nullable=True),
+    Column("is_active", Boolean, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+)
+
+Table(
+    "conversation_participants",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column(
+        "conversation_id",
+        Integer,
+        ForeignKey("conversations.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column(
+        "user_id", Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=False
+    ),
+    Column(
+        "joined_at",
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    ),
+    Column("left_at", DateTime(timezone=True), nullable=True),
+    Index("idx_conversation_user_unique", "conversation_id", "user_id", unique=True),
+    Index("idx_user_participation_history", "user_id", "joined_at"),
+)
+
+Table(
+    "messages",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column(
+        "sender_id",
+        Integer,
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=False,
+    ),
+    Column("content", Text, nullable=False),
+    Column("message_type", Enum("TEXT", "SYSTEM", name="messagetype"), nullable=False),
+    Column(
+        "sent_at", DateTime(timezone=True), nullable=False, server_default=func.now()
+    ),
+    Column(
+        "room_id", Integer, ForeignKey("rooms.id", ondelete="SET NULL"), nullable=True
+    ),
+    Column(
+        "conversation_id", Integer, ForeignKey("conversations.id", ondelete="CASCADE")
+    ),
+    CheckConstraint(
+        "(room_id is NULL) != (conversation_id IS NULL)",
+        name="message_xor_room_conversation",
+    ),
+    Index("idx_conversation_messages", "conversation_id", "sent_at"),
+    Index("idx_room_messages", "room_id", "sent_at"),
+    Index("idx_user_messages", "sender_id", "sent_at"),
+)
+
+Table(
+    "message_translation",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column(
+        "message_id",
+        Integer,
+        ForeignKey("messages.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column("target_language", String(5), nullable=False),
+    Column("content", Text, nullable=False),
+    Column(
+        "created_at",
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    ),
+    Index("idx_message_language_unique", "message_id", "target_language", unique=True),
+    Index("idx_message_translations", "message_id"),
+    Index("idx_language_translations", "target_language"),
+)
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    """
+    Create the tables of the first release that are missing from the
+    database. Databases created before versioned migrations keep their
+    tables; columns, indexes and tables added since come with later revisions.
+    :param conn: Database connection
+    """
+    await conn.run_sync(metadata.create_all)
@@ -0,0 +1,70 @@
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.migrations import create_index, drop_index
+
+
+# Online index builds cannot run inside a transaction
+TRANSACTIONAL = False
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    """
+    Index the filters of the repository hot paths: active room conversations,
+    current participations, room members and history pages.
+    Indexes are built and dropped concurrently, so the tables stay writable,
+    and the replacements exist before the indexes they supersede go away.
+    :param conn: Database connection
+    """
+    await create_index(
+        conn,
+        "idx_active_room_conversations",
+        "conversations",
+        ["room_id"],
+        where="is_active IS {true}",
+        concurrently=True,
+    )
+    await create_index(
+        conn,
+        "idx_active_participations",
+        "conversation_participants",
+        ["user_id", "conversation_id"],
+        where="left_at IS NULL",
+        concurrently=True,
+    )
+    await create_index(
+        conn,
+        "ix_users_current_room_id",
+        "users",
+        ["current_room_id"],
+        concurrently=True,
+    )
+    await create_index(
+        conn,
+        "idx_room_members",
+        "users",
+        ["current_room_id", "username"],
+        where="is_active IS {true}",
+        concurrently=True,
+    )
+    await create_index(
+        conn,
+        "idx_conversation_message_history",
+        "messages",
+        ["conversation_id", "sent_at", "id"],
+        concurrently=True,
+    )
+    await create_index(
+        conn,
+        "idx_room_message_history",
+        "messages",
+        ["room_id", "sent_at", "id"],
+        concurrently=True,
+    )
+
+    await drop_index(conn, "idx_conversation_messages", concurrently=True)
+    await drop_index(conn, "idx_room_messages", concurrently=True)
+    # Prefix of idx_message_language_unique
+    await drop_index(conn, "idx_message_translations", concurrently=True)
+    # No query orders participations by joined_at; lookups by user are
+    # served by idx_active_participations
+    await drop_index(conn, "idx_user_participation_history", concurrently=True)
@@ -0,0 +1,40 @@
+from sqlalchemy import Enum, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.migrations import add_column
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    """
+    Add the columns introduced since the first release: room occupancy
+    counters, retention policies of rooms and conversations and
+    the unread watermark of participants. Counters are backfilled from the
+    rooms users are currently in.
+    :param conn: Database connection
+    """
+    retention_mode = Enum("DELETE", "ARCHIVE", name="retentionmode")
+    await conn.run_sync(retention_mode.create, checkfirst=True)
+    retention_mode_ddl = retention_mode.compile(dialect=conn.dialect)
+
+    await add_column(conn, "rooms", "user_count", "INTEGER NOT NULL DEFAULT 0")
+    for table in ("rooms", "conversations"):
+        await add_column(conn, table, "message_retention_count", "INTEGER")
+        await add_column(conn, table, "message_retention_days", "INTEGER")
+        await add_column(
+            conn,
+            table,
+            "message_retention_mode",
+            f"{retention_mode_ddl} NOT NULL DEFAULT 'DELETE'",
+        )
+    await add_column(
+        conn, "conversation_participants", "last_read_message_id", "INTEGER"
+    )
+
+    await conn.execute(
+        text(
+            "UPDATE rooms SET user_count = ("
+            "SELECT count(users.id) FROM users "
+            "WHERE users.current_room_id = rooms.id AND users.is_active = :active)"
+        ),
+        {"active": True},
+    )
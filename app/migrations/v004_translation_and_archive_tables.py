@@ -0,0 +1,129 @@
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    func,
+)
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+
+# Frozen like the tables of revision 1
+metadata = MetaData()
+
+# Referenced by foreign keys, created by revision 1
+messages = Table("messages", metadata, Column("id", Integer, primary_key=True))
+
+translation_jobs = Table(
+    "translation_jobs",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column(
+        "message_id",
+        Integer,
+        ForeignKey("messages.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column("source_language", String(5), nullable=True),
+    Column("target_languages", String(100), nullable=False),
+    Column(
+        "status",
+        Enum(
+            "PENDING",
+            "PROCESSING",
+            "COMPLETED",
+            "FAILED",
+            name="translationjobstatus",
+        ),
+        nullable=False,
+    ),
+    Column("attempts", Integer, nullable=False),
+    Column("last_error", Text, nullable=True),
+    Column("next_attempt_at", DateTime(timezone=True), nullable=True),
+    Column(
+        "created_at",
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    ),
+    Column(
+        "updated_at",
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    ),
+    Index("idx_translation_job_message", "message_id", unique=True),
+    Index("idx_translation_job_status", "status", "next_attempt_at"),
+)
+
+translation_cache = Table(
+    "translation_cache",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("content_hash", String(64), nullable=False),
+    Column("source_language", String(5), nullable=False),
+    Column("target_language", String(5), nullable=False),
+    Column("translated_content", Text, nullable=False),
+    Column("hit_count", Integer, nullable=False),
+    Column(
+        "created_at",
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    ),
+    Column(
+        "last_used_at",
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    ),
+    Column("expires_at", DateTime(timezone=True), nullable=False),
+    Index(
+        "idx_translation_cache_key",
+        "content_hash",
+        "source_language",
+        "target_language",
+        unique=True,
+    ),
+    Index("idx_translation_cache_last_used", "last_used_at"),
+    Index("idx_translation_cache_expires", "expires_at"),
+)
+
+message_archive = Table(
+    "message_archive",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("message_id", Integer, nullable=False),
+    Column("sender_id", Integer, nullable=True),
+    Column("content", Text, nullable=False),
+    Column("message_type", Enum("TEXT", "SYSTEM", name="messagetype"), nullable=False),
+    Column("sent_at", DateTime(timezone=True), nullable=False),
+    Column("room_id", Integer, nullable=True),
+    Column("conversation_id", Integer, nullable=True),
+    Column(
+        "archived_at",
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    ),
+    Index("idx_archive_room", "room_id", "sent_at"),
+    Index("idx_archive_conversation", "conversation_id", "sent_at"),
+)
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    """
+    Create the tables added since the first release: translation jobs, the
+    persistent translation memory and the retention archive.
+    :param conn: Database connection
+    """
+    await conn.run_sync(
+        metadata.create_all,
+        tables=[translation_jobs, translation_cache, message_archive],
+    )
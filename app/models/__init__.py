@@ -4,6 +4,9 @@ from .room import Room
 from .conversation import Conversation, ConversationType
 from .conversation_participant import ConversationParticipant
 from .message import Message, MessageType
+from .message_archive import ArchivedMessage, RetentionMode
+from .translation_job import TranslationJob, TranslationJobStatus
+from .translation_cache import TranslationCacheEntry
 
 __all__ = [
     "Base",
@@ -12,7 +15,12 @@ __all__ = [
     "Conversation",
     "ConversationParticipant",
     "Message",
+    "ArchivedMessage",
+    "TranslationJob",
+    "TranslationCacheEntry",
     "UserStatus",
     "ConversationType",
     "MessageType",
+    "RetentionMode",
+    "TranslationJobStatus",
 ]
@@ -1,5 +1,6 @@
 from app.core.database import Base
-from sqlalchemy import Column, Integer, DateTime, Boolean, Enum, ForeignKey
+from app.models.message_archive import RetentionMode
+from sqlalchemy import Column, Integer, DateTime, Boolean, Enum, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -28,6 +29,13 @@ class Conversation(Base):
         Integer, nullable=True
     )  # 2 for private, NULL for group chat
 
+    # Message retention policy (None: server default)
+    message_retention_count = Column(Integer, nullable=True)
+    message_retention_days = Column(Integer, nullable=True)
+    message_retention_mode = Column(
+        Enum(RetentionMode), nullable=False, default=RetentionMode.DELETE
+    )
+
     is_active = Column(Boolean, nullable=False, default=True)
     created_at = Column(DateTime(timezone=True), nullable=False, default=func.now())
 
@@ -37,5 +45,14 @@ class Conversation(Base):
     )
     messages = relationship("Message", back_populates="conversation", lazy="dynamic")
 
+    __table_args__ = (
+        Index(
+            "idx_active_room_conversations",
+            "room_id",
+            postgresql_where=is_active.is_(True),
+            sqlite_where=is_active.is_(True),
+        ),
+    )
+
     def __repr__(self):
         return f"<Conversation(id={self.id}, type={self.conversation_type}, room_id={self.room_id})>"
@@ -30,6 +30,8 @@ class ConversationParticipant(Base):
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
     left_at = Column(DateTime(timezone=True), nullable=True)
+    # Newest message the participant has loaded (unread counter watermark)
+    last_read_message_id = Column(Integer, nullable=True)
 
     conversation = relationship("Conversation", back_populates="participants")
     user = relationship("User", back_populates="conversation_participations")
@@ -38,7 +40,15 @@ class ConversationParticipant(Base):
         Index(
             "idx_conversation_user_unique", "conversation_id", "user_id", unique=True
         ),
-        Index("idx_user_participation_history", "user_id", "joined_at"),
+        # Current memberships of a user; lookups by conversation are served
+        # by idx_conversation_user_unique
+        Index(
+            "idx_active_participations",
+            "user_id",
+            "conversation_id",
+            postgresql_where=left_at.is_(None),
+            sqlite_where=left_at.is_(None),
+        ),
     )
 
     def __repr__(self):
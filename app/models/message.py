@@ -62,13 +62,17 @@ class Message(Base):
         "MessageTranslation", back_populates="message", lazy="dynamic"
     )
 
+    # Reader's translation, loaded alongside history queries (not mapped)
+    translated_content = None
+
     __table_args__ = (
         CheckConstraint(
             "(room_id is NULL) != (conversation_id IS NULL)",
             name="message_xor_room_conversation",
         ),
-        Index("idx_conversation_messages", "conversation_id", "sent_at"),
-        Index("idx_room_messages", "room_id", "sent_at"),
+        # History pages are keyed on (sent_at, id)
+        Index("idx_conversation_message_history", "conversation_id", "sent_at", "id"),
+        Index("idx_room_message_history", "room_id", "sent_at", "id"),
         Index("idx_user_messages", "sender_id", "sent_at"),
     )
 
@@ -84,6 +88,14 @@ class Message(Base):
         )
         return f"<Message(id={self.id}, {target}, sender={self.sender_id})>"
 
+    @property
+    def display_content(self):
+        """
+        Get content shown to the reader.
+        :return: Loaded translation if available, else original content
+        """
+        return self.translated_content or self.content
+
     @property
     def is_room_message(self):
         """
@@ -110,14 +122,3 @@ class Message(Base):
             return {"type": "room", "id": self.room_id}
         else:
             return {"type": "conversation", "id": self.conversation_id}
-
-    def get_translation(self, target_language: str) -> str | None:
-        """
-        Get translated content for specific language
-        :param target_language: Target language (EN, DE, FR, etc.)
-        :return: Translated content or None if not found
-        """
-        translation = self.translations.filter_by(
-            target_language=target_language
-        ).first()
-        return translation.content if translation else None
@@ -0,0 +1,43 @@
+import enum
+
+from sqlalchemy import Column, Integer, Enum, Text, DateTime, Index
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+from app.models.message import MessageType
+
+
+class RetentionMode(enum.Enum):
+    """What happens to messages outside the retention policy"""
+
+    DELETE = "delete"
+    ARCHIVE = "archive"
+
+
+class ArchivedMessage(Base):
+    """
+    Messages moved out of the live messages table by retention.
+    Translations are not archived; they can be recreated from the original.
+    """
+
+    __tablename__ = "message_archive"
+
+    id = Column(Integer, primary_key=True)
+    message_id = Column(Integer, nullable=False)
+    sender_id = Column(Integer, nullable=True)
+    content = Column(Text, nullable=False)
+    message_type = Column(Enum(MessageType), nullable=False)
+    sent_at = Column(DateTime(timezone=True), nullable=False)
+    room_id = Column(Integer, nullable=True)
+    conversation_id = Column(Integer, nullable=True)
+    archived_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    __table_args__ = (
+        Index("idx_archive_room", "room_id", "sent_at"),
+        Index("idx_archive_conversation", "conversation_id", "sent_at"),
+    )
+
+    def __repr__(self):
+        return f"<ArchivedMessage(message_id={self.message_id})>"
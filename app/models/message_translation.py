@@ -26,7 +26,6 @@ class MessageTranslation(Base):
         Index(
             "idx_message_language_unique", "message_id", "target_language", unique=True
         ),
-        Index("idx_message_translations", "message_id"),
         Index("idx_language_translations", "target_language"),
     )
 
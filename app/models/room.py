@@ -1,8 +1,9 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Enum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.core.database import Base
+from app.models.message_archive import RetentionMode
 
 
 class Room(Base):
@@ -14,6 +15,14 @@ class Room(Base):
     name = Column(String(100), unique=True, nullable=False)
     description = Column(Text, nullable=True)
     max_users = Column(Integer, nullable=True)
+    # Seats taken, maintained with the row lock of conditional UPDATEs
+    user_count = Column(Integer, nullable=False, default=0, server_default="0")
+    # Message retention policy (None: server default)
+    message_retention_count = Column(Integer, nullable=True)
+    message_retention_days = Column(Integer, nullable=True)
+    message_retention_mode = Column(
+        Enum(RetentionMode), nullable=False, default=RetentionMode.DELETE
+    )
 
     is_translation_enabled = Column(Boolean, nullable=False, default=False)
     is_active = Column(Boolean, nullable=False, default=True)
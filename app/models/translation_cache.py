@@ -0,0 +1,50 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class TranslationCacheEntry(Base):
+    """
+    Persistent translation memory shared by all messages.
+
+    Business Rules:
+    - Keyed by SHA-256 of the normalized content plus the language pair
+    - source_language is 'AUTO' when DeepL detected the source language
+    - Entries expire after expires_at and the least recently used ones
+      are evicted once the table exceeds its configured size
+    """
+
+    __tablename__ = "translation_cache"
+
+    id = Column(Integer, primary_key=True)
+    content_hash = Column(String(64), nullable=False)
+    source_language = Column(String(5), nullable=False)
+    target_language = Column(String(5), nullable=False)
+    translated_content = Column(Text, nullable=False)
+    hit_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    last_used_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index(
+            "idx_translation_cache_key",
+            "content_hash",
+            "source_language",
+            "target_language",
+            unique=True,
+        ),
+        Index("idx_translation_cache_last_used", "last_used_at"),
+        Index("idx_translation_cache_expires", "expires_at"),
+    )
+
+    def __repr__(self):
+        return (
+            f"<TranslationCacheEntry(hash={self.content_hash[:8]}, "
+            f"{self.source_language}->{self.target_language})>"
+        )
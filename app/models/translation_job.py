@@ -0,0 +1,73 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+import enum
+
+from app.core.database import Base
+
+
+class TranslationJobStatus(enum.Enum):
+    """Lifecycle states of a background translation job"""
+
+    PENDING = "pending"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class TranslationJob(Base):
+    """
+    Background translation job for a single message.
+
+    Business Rules:
+    - One job per message, created when the message is persisted
+    - target_languages holds the requested languages (comma separated);
+      a retry only re-requests those without a stored translation yet
+    - Jobs are retried with exponential backoff until max attempts is reached
+    """
+
+    __tablename__ = "translation_jobs"
+
+    id = Column(Integer, primary_key=True)
+    message_id = Column(
+        Integer, ForeignKey("messages.id", ondelete="CASCADE"), nullable=False
+    )
+    source_language = Column(String(5), nullable=True)
+    target_languages = Column(String(100), nullable=False)
+    status = Column(
+        Enum(TranslationJobStatus),
+        nullable=False,
+        default=TranslationJobStatus.PENDING,
+    )
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+    next_attempt_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    message = relationship("Message")
+
+    __table_args__ = (
+        Index("idx_translation_job_message", "message_id", unique=True),
+        Index("idx_translation_job_status", "status", "next_attempt_at"),
+    )
+
+    def __repr__(self):
+        return f"<TranslationJob(id={self.id}, message_id={self.message_id}, status={self.status})>"
+
+    @property
+    def requested_languages(self) -> list[str]:
+        """
+        Get target languages requested for this job.
+        :return: List of language codes
+        """
+        if not self.target_languages:
+            return []
+        return self.target_languages.split(",")
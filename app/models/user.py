@@ -1,6 +1,15 @@
 import enum
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum, ForeignKey
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Boolean,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+)
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -33,7 +42,7 @@ class User(Base):
     is_admin = Column(Boolean, nullable=False, default=False)
 
     current_room_id = Column(
-        Integer, ForeignKey("rooms.id", ondelete="SET NULL"), nullable=True
+        Integer, ForeignKey("rooms.id", ondelete="SET NULL"), nullable=True, index=True
     )
     current_room = relationship("Room", back_populates="users")
     conversation_participations = relationship(
@@ -41,5 +50,16 @@ class User(Base):
     )
     sent_messages = relationship("Message", back_populates="sender", lazy="dynamic")
 
+    __table_args__ = (
+        # Room member lists, already in username order
+        Index(
+            "idx_room_members",
+            "current_room_id",
+            "username",
+            postgresql_where=is_active.is_(True),
+            sqlite_where=is_active.is_(True),
+        ),
+    )
+
     def __repr__(self):
         return f"<User (id={self.id}, username='{self.username}')>"
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import Generic, TypeVar, Optional, List
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 T = TypeVar("T")
 
@@ -8,15 +8,18 @@ T = TypeVar("T")
 class BaseRepository(ABC, Generic[T]):
     """Abstract base repository providing common CRUD operations."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession, read_db: Optional[AsyncSession] = None):
         """
         Initialize repository with database session.
-        :param db: SQLAlchemy database session
+        :param db: SQLAlchemy async database session
+        :param read_db: Session for history reads, e.g. on a replica
+            (default: db)
         """
         self.db = db
+        self.read_db = read_db or db
 
     @abstractmethod
-    def get_by_id(self, id: int) -> Optional[T]:
+    async def get_by_id(self, id: int) -> Optional[T]:
         """
         Get entity by ID.
         :param id: Entity ID
@@ -25,7 +28,7 @@ class BaseRepository(ABC, Generic[T]):
         pass
 
     @abstractmethod
-    def get_all(self, limit: int = 100, offset: int = 0) -> List[T]:
+    async def get_all(self, limit: int = 100, offset: int = 0) -> List[T]:
         """
         Get all entities with pagination.
         :param limit: Maximum number of entities to return
@@ -35,7 +38,7 @@ class BaseRepository(ABC, Generic[T]):
         pass
 
     @abstractmethod
-    def create(self, entity: T) -> T:
+    async def create(self, entity: T) -> T:
         """
         Create new entity
         :param entity: Entity to create
@@ -44,7 +47,7 @@ class BaseRepository(ABC, Generic[T]):
         pass
 
     @abstractmethod
-    def update(self, entity: T) -> T:
+    async def update(self, entity: T) -> T:
         """
         Update existing entity.
         :param entity: Entity to update
@@ -53,7 +56,7 @@ class BaseRepository(ABC, Generic[T]):
         pass
 
     @abstractmethod
-    def delete(self, id: int) -> bool:
+    async def delete(self, id: int) -> bool:
         """
         Delete entity by ID.
         :param id: Entity ID to delete
@@ -62,7 +65,7 @@ class BaseRepository(ABC, Generic[T]):
         pass
 
     @abstractmethod
-    def exists(self, id: int) -> bool:
+    async def exists(self, id: int) -> bool:
         """
         Check if entity exists by ID.
         :param id: Entity ID to check
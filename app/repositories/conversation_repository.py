@@ -1,10 +1,13 @@
 from abc import abstractmethod
 from typing import Optional, List
-from sqlalchemy.orm import Session
-from sqlalchemy import select, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, joinedload
+from sqlalchemy import select, and_, or_, func, update
 
 from app.models.conversation import Conversation, ConversationType
 from app.models.conversation_participant import ConversationParticipant
+from app.models.message import Message
+from app.models.message_archive import RetentionMode
 from app.models.user import User
 from app.repositories.base_repository import BaseRepository
 
@@ -13,48 +16,70 @@ class IConversationRepository(BaseRepository[Conversation]):
     """Abstract interface for Conversation repository."""
 
     @abstractmethod
-    def create_private_conversation(
-        self, room_id: int, participant_ids: List[int]
+    async def create_private_conversation(
+        self,
+        room_id: int,
+        participant_ids: List[int],
+        message_retention_count: int | None = None,
+        message_retention_days: int | None = None,
+        message_retention_mode: RetentionMode = RetentionMode.DELETE,
     ) -> Conversation:
         """Create a private conversation (2 participants)."""
         pass
 
     @abstractmethod
-    def create_group_conversation(
-        self, room_id: int, participant_ids: List[int]
+    async def create_group_conversation(
+        self,
+        room_id: int,
+        participant_ids: List[int],
+        message_retention_count: int | None = None,
+        message_retention_days: int | None = None,
+        message_retention_mode: RetentionMode = RetentionMode.DELETE,
     ) -> Conversation:
         """Create a group conversation (3+ participants)."""
         pass
 
     @abstractmethod
-    def add_participant(
+    async def add_participant(
         self, conversation_id: int, user_id: int
     ) -> ConversationParticipant:
         """Add participant to conversation."""
         pass
 
     @abstractmethod
-    def remove_participant(self, conversation_id: int, user_id: int) -> bool:
+    async def remove_participant(self, conversation_id: int, user_id: int) -> bool:
         """Remove participant from conversation (set left_at)."""
         pass
 
     @abstractmethod
-    def is_participant(self, conversation_id: int, user_id: int) -> bool:
+    async def is_participant(self, conversation_id: int, user_id: int) -> bool:
         """Check if user is active participant in conversation."""
         pass
 
     @abstractmethod
-    def get_participants(self, conversation_id: int) -> List[User]:
+    async def get_participants(self, conversation_id: int) -> List[User]:
         """Get all active participants in conversation."""
         pass
 
     @abstractmethod
-    def get_user_conversations(self, user_id: int) -> List[Conversation]:
+    async def get_user_conversations(self, user_id: int) -> List[Conversation]:
         """Get all active conversations for a user."""
         pass
 
     @abstractmethod
-    def get_room_conversations(self, room_id: int) -> List[Conversation]:
+    async def get_user_conversation_summaries(self, user_id: int) -> List[dict]:
+        """Get active conversations of a user with participants, last message and unread count."""
+        pass
+
+    @abstractmethod
+    async def mark_read(
+        self, conversation_id: int, user_id: int, message_id: int
+    ) -> None:
+        """Advance the read watermark of a participant."""
+        pass
+
+    @abstractmethod
+    async def get_room_conversations(self, room_id: int) -> List[Conversation]:
         """Get all active conversations in a room."""
         pass
 
@@ -62,23 +87,31 @@ class IConversationRepository(BaseRepository[Conversation]):
 class ConversationRepository(IConversationRepository):
     """SQLAlchemy implementation of Conversation repository."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession, read_db: Optional[AsyncSession] = None):
         """
         Initialize with database session.
-        :param db: SQLAlchemy database session
+        :param db: SQLAlchemy async database session
+        :param read_db: Session for conversation lists (default: db)
         """
-        super().__init__(db)
+        super().__init__(db, read_db)
 
-    def get_by_id(self, id: int) -> Optional[Conversation]:
+    async def get_by_id(self, id: int) -> Optional[Conversation]:
         """Get conversation by ID."""
-        query = select(Conversation).where(
-            and_(Conversation.id == id, Conversation.is_active.is_(True))
+        query = (
+            select(Conversation)
+            .options(joinedload(Conversation.room))
+            .where(and_(Conversation.id == id, Conversation.is_active.is_(True)))
         )
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
-    def create_private_conversation(
-        self, room_id: int, participant_ids: List[int]
+    async def create_private_conversation(
+        self,
+        room_id: int,
+        participant_ids: List[int],
+        message_retention_count: int | None = None,
+        message_retention_days: int | None = None,
+        message_retention_mode: RetentionMode = RetentionMode.DELETE,
     ) -> Conversation:
         """Create a private conversation (2 participants)."""
         if len(participant_ids) != 2:
@@ -88,10 +121,13 @@ class ConversationRepository(IConversationRepository):
             room_id=room_id,
             conversation_type=ConversationType.PRIVATE,
             max_participants=2,
+            message_retention_count=message_retention_count,
+            message_retention_days=message_retention_days,
+            message_retention_mode=message_retention_mode,
         )
 
         self.db.add(new_conversation)
-        self.db.flush()
+        await self.db.flush()
 
         # Add participants
         for user_id in participant_ids:
@@ -100,12 +136,16 @@ class ConversationRepository(IConversationRepository):
             )
             self.db.add(participant)
 
-        self.db.commit()
-        self.db.refresh(new_conversation)
+        await self.db.flush()
         return new_conversation
 
-    def create_group_conversation(
-        self, room_id: int, participant_ids: List[int]
+    async def create_group_conversation(
+        self,
+        room_id: int,
+        participant_ids: List[int],
+        message_retention_count: int | None = None,
+        message_retention_days: int | None = None,
+        message_retention_mode: RetentionMode = RetentionMode.DELETE,
     ) -> Conversation:
         """Create a group conversation (3+ participants)."""
         if len(participant_ids) < 2:
@@ -115,10 +155,13 @@ class ConversationRepository(IConversationRepository):
             room_id=room_id,
             conversation_type=ConversationType.GROUP,
             max_participants=None,
+            message_retention_count=message_retention_count,
+            message_retention_days=message_retention_days,
+            message_retention_mode=message_retention_mode,
         )
 
         self.db.add(new_conversation)
-        self.db.flush()
+        await self.db.flush()
 
         # Add participants
         for user_id in participant_ids:
@@ -127,15 +170,14 @@ class ConversationRepository(IConversationRepository):
             )
             self.db.add(participant)
 
-        self.db.commit()
-        self.db.refresh(new_conversation)
+        await self.db.flush()
         return new_conversation
 
-    def add_participant(
+    async def add_participant(
         self, conversation_id: int, user_id: int
     ) -> ConversationParticipant:
         """Add participant to conversation."""
-        if self.is_participant(conversation_id, user_id):
+        if await self.is_participant(conversation_id, user_id):
             raise ValueError("User is already a participant in this conversation")
 
         participant = ConversationParticipant(
@@ -143,11 +185,10 @@ class ConversationRepository(IConversationRepository):
         )
 
         self.db.add(participant)
-        self.db.commit()
-        self.db.refresh(participant)
+        await self.db.flush()
         return participant
 
-    def remove_participant(self, conversation_id: int, user_id: int) -> bool:
+    async def remove_participant(self, conversation_id: int, user_id: int) -> bool:
         """Remove participant from conversation (set left_at)."""
         participant_query = select(ConversationParticipant).where(
             and_(
@@ -156,18 +197,18 @@ class ConversationRepository(IConversationRepository):
                 ConversationParticipant.left_at.is_(None),
             )
         )
-        result = self.db.execute(participant_query)
+        result = await self.db.execute(participant_query)
         participant = result.scalar_one_or_none()
 
         if participant:
             from datetime import datetime
 
             participant.left_at = datetime.now()
-            self.db.commit()
+            await self.db.flush()
             return True
         return False
 
-    def is_participant(self, conversation_id: int, user_id: int) -> bool:
+    async def is_participant(self, conversation_id: int, user_id: int) -> bool:
         """Check if user is active participant in conversation."""
         participant_query = select(ConversationParticipant).where(
             and_(
@@ -176,11 +217,11 @@ class ConversationRepository(IConversationRepository):
                 ConversationParticipant.left_at.is_(None),
             )
         )
-        result = self.db.execute(participant_query)
+        result = await self.db.execute(participant_query)
         participant = result.scalar_one_or_none()
         return participant is not None
 
-    def get_participants(self, conversation_id: int) -> List[User]:
+    async def get_participants(self, conversation_id: int) -> List[User]:
         """Get all active participants in conversation."""
         participants_query = (
             select(User)
@@ -195,10 +236,10 @@ class ConversationRepository(IConversationRepository):
             .where(User.is_active.is_(True))
         )
 
-        result = self.db.execute(participants_query)
+        result = await self.db.execute(participants_query)
         return list(result.scalars().all())
 
-    def get_user_conversations(self, user_id: int) -> List[Conversation]:
+    async def get_user_conversations(self, user_id: int) -> List[Conversation]:
         """Get all active conversations for a user."""
         conversations_query = (
             select(Conversation)
@@ -213,46 +254,179 @@ class ConversationRepository(IConversationRepository):
             .where(Conversation.is_active.is_(True))
         )
 
-        result = self.db.execute(conversations_query)
+        result = await self.db.execute(conversations_query)
         return list(result.scalars().all())
 
-    def get_room_conversations(self, room_id: int) -> List[Conversation]:
+    async def get_user_conversation_summaries(self, user_id: int) -> List[dict]:
+        """
+        Get active conversations of a user with participants, last message
+        and unread count in one query. Rows come back once per active
+        participant and are folded per conversation.
+        :param user_id: User ID
+        :return: List of summaries, most recently active first
+        """
+        membership = aliased(ConversationParticipant)
+        member = aliased(ConversationParticipant)
+        participant = aliased(User)
+        last_sender = aliased(User)
+        last_message = aliased(Message)
+
+        message_stats = (
+            select(
+                Message.conversation_id,
+                func.max(Message.id).label("last_message_id"),
+                func.count(Message.id)
+                .filter(
+                    Message.id > func.coalesce(membership.last_read_message_id, 0),
+                    Message.sender_id != user_id,
+                )
+                .label("unread_count"),
+            )
+            .join(
+                membership,
+                and_(
+                    membership.conversation_id == Message.conversation_id,
+                    membership.user_id == user_id,
+                    membership.left_at.is_(None),
+                ),
+            )
+            .group_by(Message.conversation_id)
+            .subquery()
+        )
+
+        query = (
+            select(
+                Conversation,
+                participant.id,
+                participant.username,
+                message_stats.c.unread_count,
+                last_message.id,
+                last_message.content,
+                last_message.sent_at,
+                last_sender.username,
+            )
+            .join(
+                membership,
+                and_(
+                    membership.conversation_id == Conversation.id,
+                    membership.user_id == user_id,
+                    membership.left_at.is_(None),
+                ),
+            )
+            .join(
+                member,
+                and_(
+                    member.conversation_id == Conversation.id,
+                    member.left_at.is_(None),
+                ),
+            )
+            .join(
+                participant,
+                and_(participant.id == member.user_id, participant.is_active.is_(True)),
+            )
+            .outerjoin(
+                message_stats, message_stats.c.conversation_id == Conversation.id
+            )
+            .outerjoin(last_message, last_message.id == message_stats.c.last_message_id)
+            .outerjoin(last_sender, last_sender.id == last_message.sender_id)
+            .where(Conversation.is_active.is_(True))
+            .order_by(
+                func.coalesce(message_stats.c.last_message_id, 0).desc(),
+                Conversation.id.desc(),
+                participant.id,
+            )
+        )
+        result = await self.read_db.execute(query)
+
+        summaries: dict[int, dict] = {}
+        for (
+            conversation,
+            participant_id,
+            participant_username,
+            unread_count,
+            last_message_id,
+            last_message_content,
+            last_message_sent_at,
+            last_sender_username,
+        ) in result.all():
+            summary = summaries.get(conversation.id)
+            if summary is None:
+                summary = summaries[conversation.id] = {
+                    "conversation": conversation,
+                    "participants": [],
+                    "unread_count": unread_count or 0,
+                    "last_message": None,
+                }
+                if last_message_id is not None:
+                    summary["last_message"] = {
+                        "id": last_message_id,
+                        "content": last_message_content,
+                        "sent_at": last_message_sent_at,
+                        "sender_username": last_sender_username,
+                    }
+            summary["participants"].append((participant_id, participant_username))
+
+        return list(summaries.values())
+
+    async def mark_read(
+        self, conversation_id: int, user_id: int, message_id: int
+    ) -> None:
+        """
+        Advance the read watermark of a participant, never moving it back.
+        Reading a conversation does not make the user sticky to the primary.
+        :param conversation_id: Conversation ID
+        :param user_id: Participant user ID
+        :param message_id: Newest message the participant has loaded
+        """
+        await self.db.execute(
+            update(ConversationParticipant)
+            .where(
+                ConversationParticipant.conversation_id == conversation_id,
+                ConversationParticipant.user_id == user_id,
+                or_(
+                    ConversationParticipant.last_read_message_id.is_(None),
+                    ConversationParticipant.last_read_message_id < message_id,
+                ),
+            )
+            .values(last_read_message_id=message_id)
+            .execution_options(synchronize_session=False, read_your_writes=False)
+        )
+
+    async def get_room_conversations(self, room_id: int) -> List[Conversation]:
         """Get all active conversations in a room."""
         query = select(Conversation).where(
             and_(Conversation.room_id == room_id, Conversation.is_active.is_(True))
         )
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         return list(result.scalars().all())
 
-    def get_all(self, limit: int = 100, offset: int = 0) -> List[Conversation]:
+    async def get_all(self, limit: int = 100, offset: int = 0) -> List[Conversation]:
         """Get all conversations with pagination."""
         query = select(Conversation).limit(limit).offset(offset)
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         return list(result.scalars().all())
 
-    def create(self, conversation: Conversation) -> Conversation:
+    async def create(self, conversation: Conversation) -> Conversation:
         """Create new conversation."""
         self.db.add(conversation)
-        self.db.commit()
-        self.db.refresh(conversation)
+        await self.db.flush()
         return conversation
 
-    def update(self, conversation: Conversation) -> Conversation:
+    async def update(self, conversation: Conversation) -> Conversation:
         """Update existing conversation."""
-        self.db.commit()
-        self.db.refresh(conversation)
+        await self.db.flush()
         return conversation
 
-    def delete(self, id: int) -> bool:
+    async def delete(self, id: int) -> bool:
         """Soft delete conversation (set inactive)."""
-        conversation = self.get_by_id(id)
+        conversation = await self.get_by_id(id)
         if conversation:
             conversation.is_active = False
-            self.db.commit()
+            await self.db.flush()
             return True
         return False
 
-    def exists(self, id: int) -> bool:
+    async def exists(self, id: int) -> bool:
         """Check if conversation exists by ID."""
-        conversation = self.get_by_id(id)
+        conversation = await self.get_by_id(id)
         return conversation is not None
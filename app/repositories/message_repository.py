@@ -1,8 +1,19 @@
 from abc import abstractmethod
-from sqlalchemy.orm import Session
-from sqlalchemy import select, and_, func, desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import (
+    ColumnElement,
+    ScalarSelect,
+    Select,
+    select,
+    and_,
+    or_,
+    func,
+    desc,
+    null,
+)
 
 from app.models.message import Message, MessageType
+from app.models.message_translation import MessageTranslation
 from app.models.user import User
 from app.repositories.base_repository import BaseRepository
 
@@ -11,70 +22,90 @@ class IMessageRepository(BaseRepository[Message]):
     """Abstract interface for Message repository."""
 
     @abstractmethod
-    def create_room_message(
+    async def get_by_ids(self, message_ids: list[int]) -> list[Message]:
+        """Get several messages in one query."""
+        pass
+
+    @abstractmethod
+    async def create_room_message(
         self, sender_id: int, room_id: int, content: str
     ) -> Message:
         """Create a room-wide message."""
         pass
 
     @abstractmethod
-    def create_conversation_message(
+    async def create_conversation_message(
         self, sender_id: int, conversation_id: int, content: str
     ) -> Message:
         """Create a conversation message (private/group)."""
         pass
 
     @abstractmethod
-    def get_room_messages(
-        self, room_id: int, page: int = 1, page_size: int = 50
-    ) -> tuple[list[Message], int]:
-        """Get room messages with pagination."""
+    async def get_room_messages(
+        self,
+        room_id: int,
+        page_size: int = 50,
+        before: int | None = None,
+        after: int | None = None,
+        user_language: str | None = None,
+        include_total: bool = False,
+    ) -> tuple[list[Message], bool, int | None]:
+        """Get room messages with keyset pagination."""
         pass
 
     @abstractmethod
-    def get_conversation_messages(
+    async def get_conversation_messages(
         self,
         conversation_id: int,
-        page: int = 1,
         page_size: int = 50,
+        before: int | None = None,
+        after: int | None = None,
         user_language: str | None = None,
-    ) -> tuple[list[Message], int]:
-        """Get conversation messages with pagination."""
+        include_total: bool = False,
+    ) -> tuple[list[Message], bool, int | None]:
+        """Get conversation messages with keyset pagination."""
         pass
 
     @abstractmethod
-    def get_user_messages(self, user_id: int, limit: int = 50) -> list[Message]:
+    async def get_user_messages(self, user_id: int, limit: int = 50) -> list[Message]:
         """Get messages sent by a specific user."""
         pass
 
     @abstractmethod
-    def get_latest_room_messages(self, room_id: int, limit: int = 10) -> list[Message]:
+    async def get_latest_room_messages(
+        self, room_id: int, limit: int = 10
+    ) -> list[Message]:
         """Get latest messages from a room."""
         pass
 
-    @abstractmethod
-    def cleanup_old_room_messages(self, room_id: int, keep_count: int = 100) -> int:
-        """Delete old room messages, keeping only the most recent ones"""
-        pass
-
 
 class MessageRepository(IMessageRepository):
     """SQLAlchemy implementation of Message repository."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession, read_db: AsyncSession | None = None):
         """
         Initialize with database session.
-        :param db: SQLAlchemy database session
+        :param db: SQLAlchemy async database session
+        :param read_db: Session for history pages (default: db)
         """
-        super().__init__(db)
+        super().__init__(db, read_db)
 
-    def get_by_id(self, id: int) -> Message | None:
+    async def get_by_id(self, id: int) -> Message | None:
         """Get message by ID."""
         query = select(Message).where(Message.id == id)
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
-    def create_room_message(
+    async def get_by_ids(self, message_ids: list[int]) -> list[Message]:
+        """Get several messages in one query."""
+        if not message_ids:
+            return []
+
+        query = select(Message).where(Message.id.in_(message_ids))
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def create_room_message(
         self, sender_id: int, room_id: int, content: str
     ) -> Message:
         """Create a room-wide message."""
@@ -87,11 +118,10 @@ class MessageRepository(IMessageRepository):
         )
 
         self.db.add(new_message)
-        self.db.commit()
-        self.db.refresh(new_message)
+        await self.db.flush()
         return new_message
 
-    def create_conversation_message(
+    async def create_conversation_message(
         self, sender_id: int, conversation_id: int, content: str
     ) -> Message:
         """Create a conversation message (private/group)."""
@@ -104,88 +134,105 @@ class MessageRepository(IMessageRepository):
         )
 
         self.db.add(new_message)
-        self.db.commit()
-        self.db.refresh(new_message)
+        await self.db.flush()
         return new_message
 
-    def get_room_messages(
+    async def get_room_messages(
         self,
         room_id: int,
-        page: int = 1,
         page_size: int = 50,
+        before: int | None = None,
+        after: int | None = None,
         user_language: str | None = None,
-    ) -> tuple[list[Message], int]:
-        """Get room messages with pagination."""
-        count_query = select(func.count(Message.id)).where(
-            and_(Message.room_id == room_id, Message.conversation_id.is_(None))
-        )
-        result = self.db.execute(count_query)
-        total_count = result.scalar() or 0
-
-        offset = (page - 1) * page_size
-        messages_query = (
-            select(Message, User.username)
-            .join(User, Message.sender_id == User.id)
-            .where(and_(Message.room_id == room_id, Message.conversation_id.is_(None)))
-            .order_by(desc(Message.sent_at))
-            .offset(offset)
-            .limit(page_size)
+        include_total: bool = False,
+    ) -> tuple[list[Message], bool, int | None]:
+        """Get room messages with keyset pagination."""
+        scope = and_(Message.room_id == room_id, Message.conversation_id.is_(None))
+        return await self._get_message_page(
+            scope, page_size, before, after, user_language, include_total
         )
 
-        result = self.db.execute(messages_query)
-        message_rows = result.all()
-
-        # Add sender_username to message objects
-        messages = []
-        for message_object, username in message_rows:
-            message_object.sender_username = username
-            messages.append(message_object)
-
-        messages = self._apply_translations_to_messages(messages, user_language)
-        return messages, total_count
-
-    def get_conversation_messages(
+    async def get_conversation_messages(
         self,
         conversation_id: int,
-        page: int = 1,
         page_size: int = 50,
+        before: int | None = None,
+        after: int | None = None,
         user_language: str | None = None,
-    ) -> tuple[list[Message], int]:
-        """Get conversation messages with pagination."""
-        count_query = select(func.count(Message.id)).where(
-            and_(Message.conversation_id == conversation_id, Message.room_id.is_(None))
+        include_total: bool = False,
+    ) -> tuple[list[Message], bool, int | None]:
+        """Get conversation messages with keyset pagination."""
+        scope = and_(
+            Message.conversation_id == conversation_id, Message.room_id.is_(None)
+        )
+        return await self._get_message_page(
+            scope, page_size, before, after, user_language, include_total
         )
-        result = self.db.execute(count_query)
-        total_count = result.scalar() or 0
 
-        offset = (page - 1) * page_size
-        messages_query = (
-            select(Message, User.username)
-            .join(User, Message.sender_id == User.id)
-            .where(
-                and_(
-                    Message.conversation_id == conversation_id,
-                    Message.room_id.is_(None),
+    async def _get_message_page(
+        self,
+        scope: ColumnElement[bool],
+        page_size: int,
+        before: int | None,
+        after: int | None,
+        user_language: str | None,
+        include_total: bool,
+    ) -> tuple[list[Message], bool, int | None]:
+        """
+        Get one page of message history, newest first, keyed on (sent_at, id).
+        The cursor message's sent_at is resolved inside the query, so every
+        page is a range scan on the (room_id|conversation_id, sent_at, id) index.
+        :param scope: Filter selecting room or conversation messages
+        :param page_size: Maximum number of messages
+        :param before: Return messages older than this message ID
+        :param after: Return messages newer than this message ID
+        :param user_language: Preferred language of the reader
+        :param include_total: Whether to count all messages in scope
+        :return: Tuple of (messages, has_more in paging direction, total or None)
+        """
+        query = self._history_query(user_language).where(scope)
+
+        if after is not None:
+            cursor_sent_at = self._cursor_sent_at(after)
+            query = query.where(
+                Message.sent_at >= cursor_sent_at,
+                or_(Message.sent_at > cursor_sent_at, Message.id > after),
+            ).order_by(Message.sent_at.asc(), Message.id.asc())
+        else:
+            if before is not None:
+                cursor_sent_at = self._cursor_sent_at(before)
+                query = query.where(
+                    Message.sent_at <= cursor_sent_at,
+                    or_(Message.sent_at < cursor_sent_at, Message.id < before),
                 )
-            )
-            .order_by(desc(Message.sent_at))
-            .offset(offset)
-            .limit(page_size)
-        )
+            query = query.order_by(Message.sent_at.desc(), Message.id.desc())
 
-        result = self.db.execute(messages_query)
-        message_rows = result.all()
+        result = await self.read_db.execute(query.limit(page_size + 1))
+        messages = self._rows_to_messages(result.all())
 
-        # Add sender_username to message objects
-        messages = []
-        for message_object, username in message_rows:
-            message_object.sender_username = username
-            messages.append(message_object)
+        has_more = len(messages) > page_size
+        messages = messages[:page_size]
+        if after is not None:
+            messages.reverse()
 
-        messages = self._apply_translations_to_messages(messages, user_language)
-        return messages, total_count
+        total_count = None
+        if include_total:
+            count_query = select(func.count(Message.id)).where(scope)
+            result = await self.read_db.execute(count_query)
+            total_count = result.scalar() or 0
 
-    def get_user_messages(self, user_id: int, limit: int = 50) -> list[Message]:
+        return messages, has_more, total_count
+
+    @staticmethod
+    def _cursor_sent_at(message_id: int) -> ScalarSelect:
+        """
+        Build scalar subquery for the sent_at of a cursor message.
+        :param message_id: ID of the cursor message
+        :return: Scalar subquery
+        """
+        return select(Message.sent_at).where(Message.id == message_id).scalar_subquery()
+
+    async def get_user_messages(self, user_id: int, limit: int = 50) -> list[Message]:
         """Get messages sent by a specific user."""
         query = (
             select(Message)
@@ -194,120 +241,96 @@ class MessageRepository(IMessageRepository):
             .limit(limit)
         )
 
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         return list(result.scalars().all())
 
-    def get_latest_room_messages(self, room_id: int, limit: int = 10) -> list[Message]:
+    async def get_latest_room_messages(
+        self, room_id: int, limit: int = 10
+    ) -> list[Message]:
         """Get latest messages from a room."""
         query = (
-            select(Message, User.username)
-            .join(User, Message.sender_id == User.id)
+            self._history_query()
             .where(and_(Message.room_id == room_id, Message.conversation_id.is_(None)))
             .order_by(desc(Message.sent_at))
             .limit(limit)
         )
 
-        result = self.db.execute(query)
-        message_rows = result.all()
-
-        # Add sender_username to message objects
-        messages = []
-        for message_object, username in message_rows:
-            message_object.sender_username = username
-            messages.append(message_object)
+        result = await self.db.execute(query)
+        return self._rows_to_messages(result.all())
 
-        return messages
-
-    def get_all(self, limit: int = 100, offset: int = 0) -> list[Message]:
+    async def get_all(self, limit: int = 100, offset: int = 0) -> list[Message]:
         """Get all messages with pagination."""
         query = (
             select(Message).limit(limit).offset(offset).order_by(desc(Message.sent_at))
         )
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         return list(result.scalars().all())
 
-    def _apply_translations_to_messages(
-        self, messages: list[Message], user_language: str | None = None
-    ) -> list[Message]:
-        """Apply translations to messages based on User's preferred language"""
+    def _history_query(self, user_language: str | None = None) -> Select:
+        """
+        Build message history query returning sender username and the
+        translation for user_language in the same round-trip.
+        :param user_language: Preferred language of the reader (None for original)
+        :return: Select of (Message, username, translated content)
+        """
         if not user_language:
-            return messages
-
-        for message in messages:
-            translated_content = message.get_translation(user_language.upper())
-            if translated_content:
-                message.content = translated_content
-
-        return messages
-
-    def cleanup_old_room_messages(self, room_id: int, keep_count: int = 100) -> int:
-        """Delete old room messages, keeping only the most recent ones"""
-        try:
-            threshold_query = (
-                select(Message.sent_at)
-                .where(
-                    and_(Message.room_id == room_id, Message.conversation_id.is_(None))
-                )
-                .order_by(Message.sent_at.desc())
-                .offset(keep_count - 1)
-                .limit(1)
+            return select(
+                Message, User.username, null().label("translated_content")
+            ).join(User, Message.sender_id == User.id)
+
+        return (
+            select(
+                Message,
+                User.username,
+                MessageTranslation.content.label("translated_content"),
             )
-
-            threshold_result = self.db.execute(threshold_query).scalar_one_or_none()
-
-            if not threshold_result:
-                return 0
-
-            old_messages_query = select(Message.id).where(
+            .join(User, Message.sender_id == User.id)
+            .outerjoin(
+                MessageTranslation,
                 and_(
-                    Message.room_id == room_id,
-                    Message.conversation_id.is_(None),
-                    Message.sent_at < threshold_result,
-                )
+                    MessageTranslation.message_id == Message.id,
+                    MessageTranslation.target_language == user_language.upper(),
+                ),
             )
+        )
 
-            old_messages = self.db.execute(old_messages_query)
-
-            deleted_count = 0
-            for message in old_messages:
-                self.db.delete(message)
-                deleted_count += 1
-
-            self.db.commit()
-
-            if deleted_count > 0:
-                print(f"Cleaned up {deleted_count} old messages from room {room_id}")
-
-            return deleted_count
-
-        except Exception as e:
-            print(f"Error cleaning up room messages: {e}")
-            self.db.rollback()
-            return 0
+    @staticmethod
+    def _rows_to_messages(rows) -> list[Message]:
+        """
+        Attach sender username and translation to message objects.
+        Mapped content stays untouched so a later commit never persists
+        a translation over the original text.
+        :param rows: Rows of (Message, username, translated content)
+        :return: List of messages
+        """
+        messages = []
+        for message_object, username, translated_content in rows:
+            message_object.sender_username = username
+            message_object.translated_content = translated_content
+            messages.append(message_object)
+        return messages
 
-    def create(self, message: Message) -> Message:
+    async def create(self, message: Message) -> Message:
         """Create new message."""
         self.db.add(message)
-        self.db.commit()
-        self.db.refresh(message)
+        await self.db.flush()
         return message
 
-    def update(self, message: Message) -> Message:
+    async def update(self, message: Message) -> Message:
         """Update existing message."""
-        self.db.commit()
-        self.db.refresh(message)
+        await self.db.flush()
         return message
 
-    def delete(self, id: int) -> bool:
+    async def delete(self, id: int) -> bool:
         """Delete message by ID."""
-        message = self.get_by_id(id)
+        message = await self.get_by_id(id)
         if message:
-            self.db.delete(message)
-            self.db.commit()
+            await self.db.delete(message)
+            await self.db.flush()
             return True
         return False
 
-    def exists(self, id: int) -> bool:
+    async def exists(self, id: int) -> bool:
         """Check if message exists by ID."""
-        message = self.get_by_id(id)
+        message = await self.get_by_id(id)
         return message is not None
@@ -0,0 +1,338 @@
+from abc import abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import ColumnElement, select, and_, or_, func, delete, insert, text
+
+from app.models.conversation import Conversation
+from app.models.message import Message
+from app.models.message_archive import ArchivedMessage, RetentionMode
+from app.models.message_translation import MessageTranslation
+from app.models.room import Room
+from app.models.translation_job import TranslationJob
+from app.repositories.base_repository import BaseRepository
+
+
+ROOM_SCOPE = "room"
+CONVERSATION_SCOPE = "conversation"
+
+# Key of the PostgreSQL advisory lock held by the worker running a sweep
+RETENTION_SWEEP_LOCK_KEY = 7_310_013
+
+
+@dataclass
+class RetentionTarget:
+    """Room or conversation holding messages outside its retention policy."""
+
+    scope: str
+    id: int
+    keep_count: int
+    max_age_days: int | None
+    mode: RetentionMode
+    message_count: int
+
+    def cutoff(self, now: datetime) -> datetime | None:
+        """
+        Get oldest sent_at still kept by the age limit.
+        :param now: Current time
+        :return: Cutoff datetime or None without age limit
+        """
+        if self.max_age_days is None:
+            return None
+        return now - timedelta(days=self.max_age_days)
+
+
+class IMessageRetentionRepository(BaseRepository[ArchivedMessage]):
+    """Abstract interface for message retention and the message archive."""
+
+    @abstractmethod
+    async def try_lock_sweep(self) -> bool:
+        """Take the sweep lock for the current transaction unless it is held."""
+        pass
+
+    @abstractmethod
+    async def get_max_message_id(self) -> int | None:
+        """Get ID of the newest message."""
+        pass
+
+    @abstractmethod
+    async def get_retention_targets(
+        self,
+        scope: str,
+        default_keep_count: int,
+        default_max_age_days: int | None,
+        now: datetime,
+        since_message_id: int | None = None,
+    ) -> List[RetentionTarget]:
+        """Get rooms or conversations with messages outside their policy."""
+        pass
+
+    @abstractmethod
+    async def expire_messages(
+        self, target: RetentionTarget, now: datetime, batch_size: int
+    ) -> int:
+        """Delete or archive one batch of messages outside the policy."""
+        pass
+
+
+class MessageRetentionRepository(IMessageRetentionRepository):
+    """SQLAlchemy implementation of message retention and archive repository."""
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize with database session.
+        :param db: SQLAlchemy async database session
+        """
+        super().__init__(db)
+
+    async def get_by_id(self, id: int) -> Optional[ArchivedMessage]:
+        """Get archived message by ID."""
+        query = select(ArchivedMessage).where(ArchivedMessage.id == id)
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none()
+
+    async def try_lock_sweep(self) -> bool:
+        """
+        Take the sweep lock until the current transaction ends, so only one
+        worker process sweeps at a time. Other databases have one process.
+        :return: True if this session holds the lock
+        """
+        if self.db.bind.dialect.name != "postgresql":
+            return True
+        result = await self.db.execute(
+            text("SELECT pg_try_advisory_xact_lock(:key)"),
+            {"key": RETENTION_SWEEP_LOCK_KEY},
+        )
+        return bool(result.scalar())
+
+    async def get_max_message_id(self) -> int | None:
+        """
+        Get ID of the newest message (a primary key lookup).
+        :return: Message ID or None without messages
+        """
+        result = await self.db.execute(select(func.max(Message.id)))
+        return result.scalar()
+
+    async def get_retention_targets(
+        self,
+        scope: str,
+        default_keep_count: int,
+        default_max_age_days: int | None,
+        now: datetime,
+        since_message_id: int | None = None,
+    ) -> List[RetentionTarget]:
+        """
+        Get rooms or conversations with messages outside their policy,
+        using one grouped query over the candidates' messages.
+
+        With since_message_id only owners that received messages after it,
+        or have an own policy (which may have changed), are candidates: the
+        others still comply with the default limit since the sweep that saw
+        that message.
+        :param scope: ROOM_SCOPE or CONVERSATION_SCOPE
+        :param default_keep_count: Count limit where no own policy is set
+        :param default_max_age_days: Age limit where no own policy is set
+        :param now: Current time
+        :param since_message_id: Newest message ID of the last complete
+            sweep (None: check every owner)
+        :return: List of retention targets
+        """
+        owner = Room if scope == ROOM_SCOPE else Conversation
+        query = (
+            select(
+                owner.id,
+                owner.message_retention_count,
+                owner.message_retention_days,
+                owner.message_retention_mode,
+                func.count(Message.id),
+                func.min(Message.sent_at),
+            )
+            .join(Message, self._owner_join(scope))
+            .group_by(
+                owner.id,
+                owner.message_retention_count,
+                owner.message_retention_days,
+                owner.message_retention_mode,
+            )
+        )
+        # A default age limit makes every owner a candidate
+        if since_message_id is not None and default_max_age_days is None:
+            owner_id = (
+                Message.room_id if scope == ROOM_SCOPE else Message.conversation_id
+            )
+            query = query.where(
+                or_(
+                    owner.id.in_(
+                        select(owner_id).where(
+                            Message.id > since_message_id, owner_id.is_not(None)
+                        )
+                    ),
+                    owner.message_retention_count.is_not(None),
+                    owner.message_retention_days.is_not(None),
+                )
+            )
+        result = await self.db.execute(query)
+
+        targets = []
+        for owner_id, count, days, mode, message_count, oldest in result.all():
+            target = RetentionTarget(
+                scope=scope,
+                id=owner_id,
+                keep_count=count or default_keep_count,
+                max_age_days=days or default_max_age_days,
+                mode=mode or RetentionMode.DELETE,
+                message_count=message_count,
+            )
+            cutoff = target.cutoff(now)
+            if oldest is not None and oldest.tzinfo is None:
+                oldest = oldest.replace(tzinfo=timezone.utc)
+            if message_count > target.keep_count or (
+                cutoff is not None and oldest is not None and oldest < cutoff
+            ):
+                targets.append(target)
+        return targets
+
+    async def expire_messages(
+        self, target: RetentionTarget, now: datetime, batch_size: int
+    ) -> int:
+        """
+        Delete or archive the oldest batch of messages outside the policy:
+        older than the keep_count-th newest (sent_at, id) or the age cutoff.
+        Translations and translation jobs of the batch are deleted with it.
+        :param target: Retention target
+        :param now: Current time
+        :param batch_size: Maximum number of messages handled
+        :return: Number of expired messages (0 when the target complies)
+        """
+        scope = self._message_scope(target)
+        expired_conditions = []
+
+        threshold_query = (
+            select(Message.id)
+            .where(scope)
+            .order_by(Message.sent_at.desc(), Message.id.desc())
+            .offset(target.keep_count - 1)
+            .limit(1)
+        )
+        threshold_id = (await self.db.execute(threshold_query)).scalar_one_or_none()
+        if threshold_id is not None:
+            threshold_sent_at = (
+                select(Message.sent_at)
+                .where(Message.id == threshold_id)
+                .scalar_subquery()
+            )
+            expired_conditions.append(
+                and_(
+                    Message.sent_at <= threshold_sent_at,
+                    or_(Message.sent_at < threshold_sent_at, Message.id < threshold_id),
+                )
+            )
+
+        cutoff = target.cutoff(now)
+        if cutoff is not None:
+            expired_conditions.append(Message.sent_at < cutoff)
+
+        if not expired_conditions:
+            return 0
+
+        batch_query = (
+            select(Message.id)
+            .where(scope, or_(*expired_conditions))
+            .order_by(Message.sent_at.asc(), Message.id.asc())
+            .limit(batch_size)
+        )
+        message_ids = list((await self.db.execute(batch_query)).scalars().all())
+        if not message_ids:
+            return 0
+
+        if target.mode == RetentionMode.ARCHIVE:
+            await self.db.execute(
+                insert(ArchivedMessage).from_select(
+                    [
+                        "message_id",
+                        "sender_id",
+                        "content",
+                        "message_type",
+                        "sent_at",
+                        "room_id",
+                        "conversation_id",
+                    ],
+                    select(
+                        Message.id,
+                        Message.sender_id,
+                        Message.content,
+                        Message.message_type,
+                        Message.sent_at,
+                        Message.room_id,
+                        Message.conversation_id,
+                    ).where(Message.id.in_(message_ids)),
+                )
+            )
+
+        await self.db.execute(
+            delete(MessageTranslation).where(
+                MessageTranslation.message_id.in_(message_ids)
+            )
+        )
+        await self.db.execute(
+            delete(TranslationJob).where(TranslationJob.message_id.in_(message_ids))
+        )
+        await self.db.execute(
+            delete(Message)
+            .where(Message.id.in_(message_ids))
+            .execution_options(synchronize_session=False)
+        )
+        return len(message_ids)
+
+    @staticmethod
+    def _owner_join(scope: str) -> ColumnElement[bool]:
+        """Join condition between a room/conversation and its messages."""
+        if scope == ROOM_SCOPE:
+            return and_(Message.room_id == Room.id, Message.conversation_id.is_(None))
+        return and_(
+            Message.conversation_id == Conversation.id, Message.room_id.is_(None)
+        )
+
+    @staticmethod
+    def _message_scope(target: RetentionTarget) -> ColumnElement[bool]:
+        """Filter selecting the messages of a retention target."""
+        if target.scope == ROOM_SCOPE:
+            return and_(Message.room_id == target.id, Message.conversation_id.is_(None))
+        return and_(Message.conversation_id == target.id, Message.room_id.is_(None))
+
+    async def get_all(self, limit: int = 100, offset: int = 0) -> List[ArchivedMessage]:
+        """Get archived messages with pagination."""
+        query = (
+            select(ArchivedMessage)
+            .order_by(ArchivedMessage.archived_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def create(self, archived: ArchivedMessage) -> ArchivedMessage:
+        """Create new archived message."""
+        self.db.add(archived)
+        await self.db.flush()
+        return archived
+
+    async def update(self, archived: ArchivedMessage) -> ArchivedMessage:
+        """Update existing archived message."""
+        await self.db.flush()
+        return archived
+
+    async def delete(self, id: int) -> bool:
+        """Delete archived message by ID."""
+        archived = await self.get_by_id(id)
+        if archived:
+            await self.db.delete(archived)
+            await self.db.flush()
+            return True
+        return False
+
+    async def exists(self, id: int) -> bool:
+        """Check if archived message exists by ID."""
+        archived = await self.get_by_id(id)
+        return archived is not None
@@ -1,6 +1,6 @@
 from abc import abstractmethod
 from typing import Optional, List
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
 
 from app.models.message_translation import MessageTranslation
@@ -11,54 +11,61 @@ class IMessageTranslationRepository(BaseRepository[MessageTranslation]):
     """Abstract interface for MessageTranslation repository."""
 
     @abstractmethod
-    def create_translation(
+    async def create_translation(
         self, message_id: int, target_language: str, content: str
     ) -> MessageTranslation:
         """Create a new message translation."""
         pass
 
     @abstractmethod
-    def get_by_message_and_language(
+    async def get_by_message_and_language(
         self, message_id: int, target_language: str
     ) -> Optional[MessageTranslation]:
         """Get translation for specific message and language."""
         pass
 
     @abstractmethod
-    def get_by_message_id(self, message_id: int) -> List[MessageTranslation]:
+    async def get_by_message_id(self, message_id: int) -> List[MessageTranslation]:
         """Get all translations for a message."""
         pass
 
     @abstractmethod
-    def delete_by_message_id(self, message_id: int) -> int:
+    async def get_by_message_ids(
+        self, message_ids: List[int]
+    ) -> List[MessageTranslation]:
+        """Get all translations for several messages in one query."""
+        pass
+
+    @abstractmethod
+    async def delete_by_message_id(self, message_id: int) -> int:
         """Delete all translations for a message."""
         pass
 
     @abstractmethod
-    def bulk_create_translations(
+    async def bulk_create_translations(
         self, translations: List[MessageTranslation]
     ) -> List[MessageTranslation]:
-        """Create multiple translations in one transaction."""
+        """Create multiple translations in one savepoint."""
         pass
 
 
 class MessageTranslationRepository(IMessageTranslationRepository):
     """SQLAlchemy implementation of MessageTranslation repository."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         """
         Initialize with database session.
-        :param db: SQLAlchemy database session
+        :param db: SQLAlchemy async database session
         """
         super().__init__(db)
 
-    def get_by_id(self, id: int) -> Optional[MessageTranslation]:
+    async def get_by_id(self, id: int) -> Optional[MessageTranslation]:
         """Get message translation by ID."""
         query = select(MessageTranslation).where(MessageTranslation.id == id)
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
-    def create_translation(
+    async def create_translation(
         self, message_id: int, target_language: str, content: str
     ) -> MessageTranslation:
         """Create a new message translation."""
@@ -69,11 +76,10 @@ class MessageTranslationRepository(IMessageTranslationRepository):
         )
 
         self.db.add(new_translation)
-        self.db.commit()
-        self.db.refresh(new_translation)
+        await self.db.flush()
         return new_translation
 
-    def get_by_message_and_language(
+    async def get_by_message_and_language(
         self, message_id: int, target_language: str
     ) -> Optional[MessageTranslation]:
         """Get translation for specific message and language."""
@@ -83,57 +89,64 @@ class MessageTranslationRepository(IMessageTranslationRepository):
                 MessageTranslation.target_language == target_language.upper(),
             )
         )
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
-    def get_by_message_id(self, message_id: int) -> List[MessageTranslation]:
+    async def get_by_message_id(self, message_id: int) -> List[MessageTranslation]:
         """Get all translations for a message."""
         query = (
             select(MessageTranslation)
             .where(MessageTranslation.message_id == message_id)
             .order_by(MessageTranslation.target_language)
         )
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         return list(result.scalars().all())
 
-    def delete_by_message_id(self, message_id: int) -> int:
+    async def get_by_message_ids(
+        self, message_ids: List[int]
+    ) -> List[MessageTranslation]:
+        """Get all translations for several messages in one query."""
+        if not message_ids:
+            return []
+
+        query = select(MessageTranslation).where(
+            MessageTranslation.message_id.in_(message_ids)
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def delete_by_message_id(self, message_id: int) -> int:
         """Delete all translations for a message."""
-        translations = self.get_by_message_id(message_id)
+        translations = await self.get_by_message_id(message_id)
         deleted_count = len(translations)
 
         for translation in translations:
-            self.db.delete(translation)
+            await self.db.delete(translation)
 
         if deleted_count > 0:
-            self.db.commit()
+            await self.db.flush()
 
         return deleted_count
 
-    def bulk_create_translations(
+    async def bulk_create_translations(
         self, translations: List[MessageTranslation]
     ) -> List[MessageTranslation]:
-        """Create multiple translations in one transaction."""
+        """Create multiple translations in one savepoint."""
         if not translations:
             return []
 
         try:
-            for translation in translations:
-                self.db.add(translation)
-
-            self.db.commit()
-
-            # Refresh all objects
-            for translation in translations:
-                self.db.refresh(translation)
-
+            async with self.db.begin_nested():
+                self.db.add_all(translations)
             return translations
 
         except Exception as e:
-            self.db.rollback()
             print(f"Failed to bulk create translations: {e}")
             return []
 
-    def get_all(self, limit: int = 100, offset: int = 0) -> List[MessageTranslation]:
+    async def get_all(
+        self, limit: int = 100, offset: int = 0
+    ) -> List[MessageTranslation]:
         """Get all message translations with pagination."""
         query = (
             select(MessageTranslation)
@@ -141,32 +154,30 @@ class MessageTranslationRepository(IMessageTranslationRepository):
             .offset(offset)
             .order_by(MessageTranslation.created_at.desc())
         )
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         return list(result.scalars().all())
 
-    def create(self, translation: MessageTranslation) -> MessageTranslation:
+    async def create(self, translation: MessageTranslation) -> MessageTranslation:
         """Create new message translation."""
         self.db.add(translation)
-        self.db.commit()
-        self.db.refresh(translation)
+        await self.db.flush()
         return translation
 
-    def update(self, translation: MessageTranslation) -> MessageTranslation:
+    async def update(self, translation: MessageTranslation) -> MessageTranslation:
         """Update existing message translation."""
-        self.db.commit()
-        self.db.refresh(translation)
+        await self.db.flush()
         return translation
 
-    def delete(self, id: int) -> bool:
+    async def delete(self, id: int) -> bool:
         """Delete message translation by ID."""
-        translation = self.get_by_id(id)
+        translation = await self.get_by_id(id)
         if translation:
-            self.db.delete(translation)
-            self.db.commit()
+            await self.db.delete(translation)
+            await self.db.flush()
             return True
         return False
 
-    def exists(self, id: int) -> bool:
+    async def exists(self, id: int) -> bool:
         """Check if message translation exists by ID."""
-        translation = self.get_by_id(id)
+        translation = await self.get_by_id(id)
         return translation is not None
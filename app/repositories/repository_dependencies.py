@@ -1,7 +1,7 @@
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.repositories.user_repository import UserRepository, IUserRepository
 from app.repositories.room_repository import RoomRepository, IRoomRepository
 from app.repositories.message_repository import MessageRepository, IMessageRepository
@@ -13,9 +13,17 @@ from app.repositories.conversation_repository import (
     ConversationRepository,
     IConversationRepository,
 )
+from app.repositories.translation_job_repository import (
+    TranslationJobRepository,
+    ITranslationJobRepository,
+)
+from app.repositories.translation_cache_repository import (
+    TranslationCacheRepository,
+    ITranslationCacheRepository,
+)
 
 
-def get_user_repository(db: Session = Depends(get_db)) -> IUserRepository:
+def get_user_repository(db: AsyncSession = Depends(get_db)) -> IUserRepository:
     """
     Create UserRepository instance with database session.
     :param db: Database session from get_db dependency
@@ -24,37 +32,47 @@ def get_user_repository(db: Session = Depends(get_db)) -> IUserRepository:
     return UserRepository(db)
 
 
-def get_room_repository(db: Session = Depends(get_db)) -> IRoomRepository:
+def get_room_repository(
+    db: AsyncSession = Depends(get_db),
+    read_db: AsyncSession = Depends(get_read_db),
+) -> IRoomRepository:
     """
-    Create RoomRepository instance with database session.
+    Create RoomRepository instance with database sessions.
     :param db: Database session from get_db dependency
+    :param read_db: Read-only query session from get_read_db dependency
     :return: RoomRepository instance
     """
-    return RoomRepository(db)
+    return RoomRepository(db, read_db)
 
 
-def get_message_repository(db: Session = Depends(get_db)) -> IMessageRepository:
+def get_message_repository(
+    db: AsyncSession = Depends(get_db),
+    read_db: AsyncSession = Depends(get_read_db),
+) -> IMessageRepository:
     """
-    Create MessageRepository instance with database session.
+    Create MessageRepository instance with database sessions.
     :param db: Database session from get_db dependency
+    :param read_db: Read-only query session from get_read_db dependency
     :return: MessageRepository instance
     """
-    return MessageRepository(db)
+    return MessageRepository(db, read_db)
 
 
 def get_conversation_repository(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    read_db: AsyncSession = Depends(get_read_db),
 ) -> IConversationRepository:
     """
-    Create ConversationRepository instance with database session.
+    Create ConversationRepository instance with database sessions.
     :param db: Database session from get_db dependency
+    :param read_db: Read-only query session from get_read_db dependency
     :return: ConversationRepository instance
     """
-    return ConversationRepository(db)
+    return ConversationRepository(db, read_db)
 
 
 def get_message_translation_repository(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> IMessageTranslationRepository:
     """
     Create MessageTranslationRepository instance with database session.
@@ -62,3 +80,25 @@ def get_message_translation_repository(
     :return: MessageTranslationRepository instance
     """
     return MessageTranslationRepository(db)
+
+
+def get_translation_job_repository(
+    db: AsyncSession = Depends(get_db),
+) -> ITranslationJobRepository:
+    """
+    Create TranslationJobRepository instance with database session.
+    :param db: Database session from get_db dependency
+    :return: TranslationJobRepository instance
+    """
+    return TranslationJobRepository(db)
+
+
+def get_translation_cache_repository(
+    db: AsyncSession = Depends(get_db),
+) -> ITranslationCacheRepository:
+    """
+    Create TranslationCacheRepository instance with database session.
+    :param db: Database session from get_db dependency
+    :return: TranslationCacheRepository instance
+    """
+    return TranslationCacheRepository(db)
@@ -1,10 +1,12 @@
 from abc import abstractmethod
 from typing import Optional, List
-from sqlalchemy.orm import Session
-from sqlalchemy import select, and_, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, and_, or_, func, update
 
+from app.core.identity_cache import invalidate_on_commit
+from app.models.conversation import Conversation
 from app.models.room import Room
-from app.models.user import User
+from app.models.user import User, UserStatus
 from app.repositories.base_repository import BaseRepository
 
 
@@ -12,84 +14,142 @@ class IRoomRepository(BaseRepository[Room]):
     """Abstract interface for Room repository."""
 
     @abstractmethod
-    def get_active_rooms(self) -> List[Room]:
+    async def get_active_rooms(self) -> List[Room]:
         """Get all active rooms."""
         pass
 
     @abstractmethod
-    def get_by_name(self, name: str) -> Optional[Room]:
+    async def get_by_name(self, name: str) -> Optional[Room]:
         """Get room by name."""
         pass
 
     @abstractmethod
-    def name_exists(self, name: str, exclude_room_id: Optional[int] = None) -> bool:
+    async def name_exists(
+        self, name: str, exclude_room_id: Optional[int] = None
+    ) -> bool:
         """Check if room name already exists."""
         pass
 
     @abstractmethod
-    def get_user_count(self, room_id: int) -> int:
+    async def get_user_count(self, room_id: int) -> int:
         """Get count of users currently in room."""
         pass
 
     @abstractmethod
-    def get_users_in_room(self, room_id: int) -> List[User]:
+    async def reserve_seat(self, room_id: int) -> Optional[Room]:
+        """Take a seat in an active room unless it is full."""
+        pass
+
+    @abstractmethod
+    async def release_seat(self, room_id: int) -> None:
+        """Give back a seat taken with reserve_seat."""
+        pass
+
+    @abstractmethod
+    async def get_users_in_room(self, room_id: int) -> List[User]:
         """Get all users currently in a specific room."""
         pass
 
     @abstractmethod
-    def soft_delete(self, room_id: int) -> bool:
+    async def soft_delete(self, room_id: int) -> bool:
         """Soft delete room (set inactive)."""
         pass
 
+    @abstractmethod
+    async def close_room(self, room_id: int) -> tuple[int, int]:
+        """Deactivate room, move out its users and deactivate its conversations."""
+        pass
+
+    @abstractmethod
+    async def reconcile_user_counts(self) -> int:
+        """Repair drifted occupancy counters of active rooms."""
+        pass
+
 
 class RoomRepository(IRoomRepository):
     """SQLAlchemy implementation of Room repository."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession, read_db: Optional[AsyncSession] = None):
         """
         Initialize with database session.
-        :param db: SQLAlchemy database session
+        :param db: SQLAlchemy async database session
+        :param read_db: Session for room listings (default: db)
         """
-        super().__init__(db)
+        super().__init__(db, read_db)
 
-    def get_by_id(self, id: int) -> Optional[Room]:
+    async def get_by_id(self, id: int) -> Optional[Room]:
         """Get room by ID."""
         query = select(Room).where(and_(Room.id == id, Room.is_active.is_(True)))
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
-    def get_active_rooms(self) -> List[Room]:
+    async def get_active_rooms(self) -> List[Room]:
         """Get all active rooms."""
         query = select(Room).where(Room.is_active.is_(True))
-        result = self.db.execute(query)
+        result = await self.read_db.execute(query)
         return list(result.scalars().all())
 
-    def get_by_name(self, name: str) -> Optional[Room]:
+    async def get_by_name(self, name: str) -> Optional[Room]:
         """Get room by name."""
         query = select(Room).where(and_(Room.name == name, Room.is_active.is_(True)))
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
-    def name_exists(self, name: str, exclude_room_id: Optional[int] = None) -> bool:
+    async def name_exists(
+        self, name: str, exclude_room_id: Optional[int] = None
+    ) -> bool:
         """Check if room name already exists."""
         query = select(Room).where(and_(Room.name == name, Room.is_active.is_(True)))
 
         if exclude_room_id:
             query = query.where(Room.id != exclude_room_id)
 
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         existing_room = result.scalar_one_or_none()
         return existing_room is not None
 
-    def get_user_count(self, room_id: int) -> int:
+    async def get_user_count(self, room_id: int) -> int:
         """Get count of users currently in room."""
         user_count_query = select(func.count(User.id)).where(
             User.current_room_id == room_id
         )
-        result = self.db.execute(user_count_query)
+        result = await self.db.execute(user_count_query)
         return result.scalar() or 0
 
-    def get_users_in_room(self, room_id: int) -> List[User]:
+    async def reserve_seat(self, room_id: int) -> Optional[Room]:
+        """
+        Take a seat with one conditional UPDATE. The row lock serializes
+        concurrent joins and the capacity guard is re-checked against the
+        latest counter, so a full room can never be overshot.
+        :param room_id: Room ID
+        :return: Room with new user_count, None if full or not found
+        """
+        result = await self.db.execute(
+            update(Room)
+            .where(
+                Room.id == room_id,
+                Room.is_active.is_(True),
+                or_(Room.max_users.is_(None), Room.user_count < Room.max_users),
+            )
+            .values(user_count=Room.user_count + 1)
+            .returning(Room)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
+    async def release_seat(self, room_id: int) -> None:
+        """
+        Give back a seat taken with reserve_seat.
+        :param room_id: Room ID
+        """
+        await self.db.execute(
+            update(Room)
+            .where(Room.id == room_id, Room.user_count > 0)
+            .values(user_count=Room.user_count - 1)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def get_users_in_room(self, room_id: int) -> List[User]:
         """Get all users currently in a specific room."""
         query = (
             select(User)
@@ -97,47 +157,97 @@ class RoomRepository(IRoomRepository):
             .order_by(User.username)
         )
 
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         return list(result.scalars().all())
 
-    def get_all(self, limit: int = 100, offset: int = 0) -> List[Room]:
+    async def get_all(self, limit: int = 100, offset: int = 0) -> List[Room]:
         """Get all rooms with pagination."""
         query = select(Room).limit(limit).offset(offset)
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         return list(result.scalars().all())
 
-    def create(self, room: Room) -> Room:
+    async def create(self, room: Room) -> Room:
         """Create new room."""
         self.db.add(room)
-        self.db.commit()
-        self.db.refresh(room)
+        await self.db.flush()
         return room
 
-    def update(self, room: Room) -> Room:
+    async def update(self, room: Room) -> Room:
         """Update existing room."""
-        self.db.commit()
-        self.db.refresh(room)
+        await self.db.flush()
         return room
 
-    def delete(self, id: int) -> bool:
+    async def delete(self, id: int) -> bool:
         """Hard delete room by ID."""
-        room = self.get_by_id(id)
+        room = await self.get_by_id(id)
         if room:
-            self.db.delete(room)
-            self.db.commit()
+            await self.db.delete(room)
+            await self.db.flush()
             return True
         return False
 
-    def soft_delete(self, room_id: int) -> bool:
+    async def soft_delete(self, room_id: int) -> bool:
         """Soft delete room (set inactive)."""
-        room = self.get_by_id(room_id)
+        room = await self.get_by_id(room_id)
         if room:
             room.is_active = False
-            self.db.commit()
+            await self.db.flush()
             return True
         return False
 
-    def exists(self, id: int) -> bool:
+    async def close_room(self, room_id: int) -> tuple[int, int]:
+        """
+        Deactivate room, move out its users and deactivate its conversations
+        with set-based UPDATEs.
+        :param room_id: Room ID
+        :return: Tuple of (users moved out, conversations deactivated)
+        """
+        user_result = await self.db.execute(
+            update(User)
+            .where(User.current_room_id == room_id)
+            .values(current_room_id=None, status=UserStatus.AWAY)
+            .returning(User.id)
+            .execution_options(synchronize_session=False)
+        )
+        kicked_user_ids = list(user_result.scalars().all())
+
+        conversation_result = await self.db.execute(
+            update(Conversation)
+            .where(Conversation.room_id == room_id, Conversation.is_active.is_(True))
+            .values(is_active=False)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.execute(
+            update(Room)
+            .where(Room.id == room_id)
+            .values(is_active=False, user_count=0)
+            .execution_options(synchronize_session=False)
+        )
+        invalidate_on_commit(self.db, kicked_user_ids)
+
+        return len(kicked_user_ids), conversation_result.rowcount or 0
+
+    async def reconcile_user_counts(self) -> int:
+        """
+        Reset user_count of active rooms to the number of active users in
+        them, in one set-based UPDATE touching only drifted rows.
+        :return: Number of repaired rooms
+        """
+        occupancy = (
+            select(func.count(User.id))
+            .where(User.current_room_id == Room.id, User.is_active.is_(True))
+            .correlate(Room)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            update(Room)
+            .where(Room.is_active.is_(True), Room.user_count != occupancy)
+            .values(user_count=occupancy)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount or 0
+
+    async def exists(self, id: int) -> bool:
         """Check if room exists by ID."""
-        room = self.get_by_id(id)
+        room = await self.get_by_id(id)
         return room is not None
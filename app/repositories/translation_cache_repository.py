@@ -0,0 +1,171 @@
+from abc import abstractmethod
+from datetime import datetime
+from typing import Optional, List
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, delete
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.models.translation_cache import TranslationCacheEntry
+from app.repositories.base_repository import BaseRepository
+
+
+class ITranslationCacheRepository(BaseRepository[TranslationCacheEntry]):
+    """Abstract interface for TranslationCacheEntry repository."""
+
+    @abstractmethod
+    async def get_valid_entries(
+        self, content_hashes: List[str], now: datetime
+    ) -> List[TranslationCacheEntry]:
+        """Get non-expired entries for several content hashes in one query."""
+        pass
+
+    @abstractmethod
+    async def upsert_entries(self, entries: List[dict]) -> int:
+        """Insert or refresh cache entries in one statement."""
+        pass
+
+    @abstractmethod
+    async def record_hits(self, entry_ids: List[int], now: datetime) -> None:
+        """Increment hit counters and last_used_at of entries."""
+        pass
+
+    @abstractmethod
+    async def delete_expired(self, now: datetime) -> int:
+        """Delete expired entries."""
+        pass
+
+    @abstractmethod
+    async def evict_least_recently_used(self, keep_count: int) -> int:
+        """Delete least recently used entries beyond keep_count."""
+        pass
+
+
+class TranslationCacheRepository(ITranslationCacheRepository):
+    """SQLAlchemy implementation of TranslationCacheEntry repository."""
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize with database session.
+        :param db: SQLAlchemy async database session
+        """
+        super().__init__(db)
+
+    async def get_by_id(self, id: int) -> Optional[TranslationCacheEntry]:
+        """Get cache entry by ID."""
+        query = select(TranslationCacheEntry).where(TranslationCacheEntry.id == id)
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none()
+
+    async def get_valid_entries(
+        self, content_hashes: List[str], now: datetime
+    ) -> List[TranslationCacheEntry]:
+        """Get non-expired entries for several content hashes in one query."""
+        if not content_hashes:
+            return []
+
+        query = select(TranslationCacheEntry).where(
+            TranslationCacheEntry.content_hash.in_(set(content_hashes)),
+            TranslationCacheEntry.expires_at > now,
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def upsert_entries(self, entries: List[dict]) -> int:
+        """Insert or refresh cache entries in one statement."""
+        if not entries:
+            return 0
+
+        dialect = self.db.get_bind().dialect.name
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+
+        statement = insert(TranslationCacheEntry).values(entries)
+        statement = statement.on_conflict_do_update(
+            index_elements=["content_hash", "source_language", "target_language"],
+            set_={
+                "translated_content": statement.excluded.translated_content,
+                "expires_at": statement.excluded.expires_at,
+                "last_used_at": statement.excluded.last_used_at,
+            },
+        )
+
+        try:
+            async with self.db.begin_nested():
+                await self.db.execute(statement)
+            return len(entries)
+        except Exception as e:
+            print(f"Failed to store translation cache entries: {e}")
+            return 0
+
+    async def record_hits(self, entry_ids: List[int], now: datetime) -> None:
+        """Increment hit counters and last_used_at of entries."""
+        if not entry_ids:
+            return
+
+        statement = (
+            update(TranslationCacheEntry)
+            .where(TranslationCacheEntry.id.in_(entry_ids))
+            .values(
+                hit_count=TranslationCacheEntry.hit_count + 1,
+                last_used_at=now,
+            )
+        )
+        await self.db.execute(statement)
+
+    async def delete_expired(self, now: datetime) -> int:
+        """Delete expired entries."""
+        statement = delete(TranslationCacheEntry).where(
+            TranslationCacheEntry.expires_at <= now
+        )
+        result = await self.db.execute(statement)
+        return result.rowcount or 0
+
+    async def evict_least_recently_used(self, keep_count: int) -> int:
+        """Delete least recently used entries beyond keep_count."""
+        keep_query = (
+            select(TranslationCacheEntry.id)
+            .order_by(TranslationCacheEntry.last_used_at.desc())
+            .limit(keep_count)
+        )
+        statement = delete(TranslationCacheEntry).where(
+            TranslationCacheEntry.id.not_in(keep_query.scalar_subquery())
+        )
+        result = await self.db.execute(statement)
+        return result.rowcount or 0
+
+    async def get_all(
+        self, limit: int = 100, offset: int = 0
+    ) -> List[TranslationCacheEntry]:
+        """Get all cache entries with pagination."""
+        query = (
+            select(TranslationCacheEntry)
+            .order_by(TranslationCacheEntry.last_used_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def create(self, entry: TranslationCacheEntry) -> TranslationCacheEntry:
+        """Create new cache entry."""
+        self.db.add(entry)
+        await self.db.flush()
+        return entry
+
+    async def update(self, entry: TranslationCacheEntry) -> TranslationCacheEntry:
+        """Update existing cache entry."""
+        await self.db.flush()
+        return entry
+
+    async def delete(self, id: int) -> bool:
+        """Delete cache entry by ID."""
+        entry = await self.get_by_id(id)
+        if entry:
+            await self.db.delete(entry)
+            await self.db.flush()
+            return True
+        return False
+
+    async def exists(self, id: int) -> bool:
+        """Check if cache entry exists by ID."""
+        entry = await self.get_by_id(id)
+        return entry is not None
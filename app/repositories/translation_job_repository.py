@@ -0,0 +1,229 @@
+from abc import abstractmethod
+from datetime import datetime, timezone
+from typing import Optional, List
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, func, or_, select, update
+
+from app.models.translation_job import TranslationJob, TranslationJobStatus
+from app.repositories.base_repository import BaseRepository
+
+
+class ITranslationJobRepository(BaseRepository[TranslationJob]):
+    """Abstract interface for TranslationJob repository."""
+
+    @abstractmethod
+    async def create_job(
+        self,
+        message_id: int,
+        source_language: str | None,
+        target_languages: List[str],
+    ) -> TranslationJob:
+        """Create a pending translation job for a message."""
+        pass
+
+    @abstractmethod
+    async def get_by_message_id(self, message_id: int) -> Optional[TranslationJob]:
+        """Get translation job for a message."""
+        pass
+
+    @abstractmethod
+    async def get_by_ids(self, job_ids: List[int]) -> List[TranslationJob]:
+        """Get several translation jobs in one query."""
+        pass
+
+    @abstractmethod
+    async def bulk_update(self, jobs: List[TranslationJob]) -> List[TranslationJob]:
+        """Persist changes of several jobs in one transaction."""
+        pass
+
+    @abstractmethod
+    async def claim_jobs(
+        self, job_ids: List[int], stale_before: datetime
+    ) -> List[TranslationJob]:
+        """Atomically mark due jobs as processing and count the attempt."""
+        pass
+
+    @abstractmethod
+    async def get_recoverable_jobs(
+        self, stale_before: datetime, limit: int = 500, all_pending: bool = True
+    ) -> List[TranslationJob]:
+        """Get pending jobs and processing jobs whose claim went stale."""
+        pass
+
+
+class TranslationJobRepository(ITranslationJobRepository):
+    """SQLAlchemy implementation of TranslationJob repository."""
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize with database session.
+        :param db: SQLAlchemy async database session
+        """
+        super().__init__(db)
+
+    async def get_by_id(self, id: int) -> Optional[TranslationJob]:
+        """Get translation job by ID."""
+        query = select(TranslationJob).where(TranslationJob.id == id)
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none()
+
+    async def create_job(
+        self,
+        message_id: int,
+        source_language: str | None,
+        target_languages: List[str],
+    ) -> TranslationJob:
+        """Create a pending translation job for a message."""
+        new_job = TranslationJob(
+            message_id=message_id,
+            source_language=source_language,
+            target_languages=",".join(target_languages),
+            status=TranslationJobStatus.PENDING,
+            attempts=0,
+        )
+
+        self.db.add(new_job)
+        await self.db.flush()
+        return new_job
+
+    async def get_by_message_id(self, message_id: int) -> Optional[TranslationJob]:
+        """Get translation job for a message."""
+        query = select(TranslationJob).where(TranslationJob.message_id == message_id)
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none()
+
+    async def get_by_ids(self, job_ids: List[int]) -> List[TranslationJob]:
+        """Get several translation jobs in one query."""
+        if not job_ids:
+            return []
+
+        query = (
+            select(TranslationJob)
+            .where(TranslationJob.id.in_(job_ids))
+            .order_by(TranslationJob.id)
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def bulk_update(self, jobs: List[TranslationJob]) -> List[TranslationJob]:
+        """Persist changes of several jobs in one transaction."""
+        await self.db.flush()
+        return jobs
+
+    @staticmethod
+    def _stale_claim(stale_before: datetime):
+        """
+        Filter of processing jobs whose worker stopped updating them.
+        :param stale_before: Claims older than this are stale
+        :return: SQL condition
+        """
+        return and_(
+            TranslationJob.status == TranslationJobStatus.PROCESSING,
+            TranslationJob.updated_at < stale_before,
+        )
+
+    async def claim_jobs(
+        self, job_ids: List[int], stale_before: datetime
+    ) -> List[TranslationJob]:
+        """
+        Atomically move due pending jobs, and processing jobs with a stale
+        claim, to processing and count the attempt. The conditional UPDATE
+        takes the row lock, so a job delivered to several workers is
+        claimed by one of them only.
+        :param job_ids: IDs of the translation jobs
+        :param stale_before: Processing jobs updated before are taken over
+        :return: Claimed jobs
+        """
+        if not job_ids:
+            return []
+
+        now = datetime.now(timezone.utc)
+        query = (
+            update(TranslationJob)
+            .where(
+                TranslationJob.id.in_(job_ids),
+                or_(
+                    and_(
+                        TranslationJob.status == TranslationJobStatus.PENDING,
+                        or_(
+                            TranslationJob.next_attempt_at.is_(None),
+                            TranslationJob.next_attempt_at <= now,
+                        ),
+                    ),
+                    self._stale_claim(stale_before),
+                ),
+            )
+            .values(
+                status=TranslationJobStatus.PROCESSING,
+                attempts=TranslationJob.attempts + 1,
+                next_attempt_at=None,
+            )
+            .returning(TranslationJob)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await self.db.execute(query)
+        return sorted(result.scalars().all(), key=lambda job: job.id)
+
+    async def get_recoverable_jobs(
+        self, stale_before: datetime, limit: int = 500, all_pending: bool = True
+    ) -> List[TranslationJob]:
+        """
+        Get pending jobs and processing jobs whose claim went stale
+        (e.g. to recover after restart).
+        :param stale_before: Processing jobs updated before are stale
+        :param limit: Maximum number of jobs
+        :param all_pending: Whether to include every pending job, else only
+            those overdue since stale_before, whose publish or retry was lost
+        :return: List of jobs
+        """
+        pending = TranslationJob.status == TranslationJobStatus.PENDING
+        if not all_pending:
+            pending = and_(
+                pending,
+                func.coalesce(TranslationJob.next_attempt_at, TranslationJob.updated_at)
+                < stale_before,
+            )
+        query = (
+            select(TranslationJob)
+            .where(or_(pending, self._stale_claim(stale_before)))
+            .order_by(TranslationJob.id)
+            .limit(limit)
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def get_all(self, limit: int = 100, offset: int = 0) -> List[TranslationJob]:
+        """Get all translation jobs with pagination."""
+        query = (
+            select(TranslationJob)
+            .order_by(TranslationJob.id.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def create(self, job: TranslationJob) -> TranslationJob:
+        """Create new translation job."""
+        self.db.add(job)
+        await self.db.flush()
+        return job
+
+    async def update(self, job: TranslationJob) -> TranslationJob:
+        """Update existing translation job."""
+        await self.db.flush()
+        return job
+
+    async def delete(self, id: int) -> bool:
+        """Delete translation job by ID."""
+        job = await self.get_by_id(id)
+        if job:
+            await self.db.delete(job)
+            await self.db.flush()
+            return True
+        return False
+
+    async def exists(self, id: int) -> bool:
+        """Check if translation job exists by ID."""
+        job = await self.get_by_id(id)
+        return job is not None
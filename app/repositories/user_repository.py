@@ -1,42 +1,66 @@
 from abc import abstractmethod
+from datetime import datetime
 from typing import Optional, List
-from sqlalchemy.orm import Session
-from sqlalchemy import select, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, and_, bindparam, update
+from sqlalchemy.orm import make_transient_to_detached
 
-from app.models.user import User
+from app.core.identity_cache import identity_cache, invalidate_on_commit
+
+from app.models.user import User, UserStatus
 from .base_repository import BaseRepository
+from .room_repository import RoomRepository
+
+
+# Users written per executemany of update_activity
+ACTIVITY_UPDATE_CHUNK_SIZE = 1000
 
 
 class IUserRepository(BaseRepository[User]):
     """Abstract interface for User repository."""
 
     @abstractmethod
-    def get_by_email(self, email: str) -> Optional[User]:
+    async def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email address."""
         pass
 
     @abstractmethod
-    def get_by_username(self, username: str) -> Optional[User]:
+    async def get_by_username(self, username: str) -> Optional[User]:
         """Get user by username."""
         pass
 
     @abstractmethod
-    def get_active_users(self) -> List[User]:
+    async def get_authenticated_user(self, username: str) -> Optional[User]:
+        """Get user for a token subject, served from the identity cache if possible."""
+        pass
+
+    @abstractmethod
+    async def get_active_users(self) -> List[User]:
         """Get all active users."""
         pass
 
     @abstractmethod
-    def get_users_in_room(self, room_id: int) -> List[User]:
+    async def get_users_in_room(self, room_id: int) -> List[User]:
         """Get all users currently in a specific room."""
         pass
 
     @abstractmethod
-    def email_exists(self, email: str) -> bool:
+    async def update_activity(
+        self,
+        last_active: dict[int, datetime],
+        statuses: dict[int, UserStatus],
+        chunk_size: int = ACTIVITY_UPDATE_CHUNK_SIZE,
+    ) -> int:
+        """Write buffered last_active and status values of many users at once."""
+        pass
+
+    @abstractmethod
+    async def email_exists(self, email: str) -> bool:
         """Check if email already exists."""
         pass
 
     @abstractmethod
-    def username_exists(self, username: str) -> bool:
+    async def username_exists(self, username: str) -> bool:
         """Check if username already exists."""
         pass
 
@@ -44,84 +68,146 @@ class IUserRepository(BaseRepository[User]):
 class UserRepository(IUserRepository):
     """SQLAlchemy implementation of User repository."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         """
         Initialize with database session.
-        :param db: SQLAlchemy database session
+        :param db: SQLAlchemy async database session
         """
         super().__init__(db)
 
-    def get_by_id(self, id: int) -> Optional[User]:
+    async def get_by_id(self, id: int) -> Optional[User]:
         """Get user by ID."""
         query = select(User).where(User.id == id)
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
-    def get_by_email(self, email: str) -> Optional[User]:
+    async def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email address."""
         query = select(User).where(User.email == email)
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
-    def get_by_username(self, username: str) -> Optional[User]:
+    async def get_by_username(self, username: str) -> Optional[User]:
         """Get user by username."""
         query = select(User).where(User.username == username)
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
-    def get_all(self, limit: int = 100, offset: int = 0) -> List[User]:
+    async def get_authenticated_user(self, username: str) -> Optional[User]:
+        """Get user for a token subject, served from the identity cache if possible."""
+        values = identity_cache.get(username)
+        if values is not None:
+            cached_user = User(**values)
+            make_transient_to_detached(cached_user)
+            return await self.db.merge(cached_user, load=False)
+
+        generation = identity_cache.invalidations
+        user = await self.get_by_username(username)
+        if user:
+            identity_cache.put(user, generation)
+        return user
+
+    async def get_all(self, limit: int = 100, offset: int = 0) -> List[User]:
         """Get all users with pagination."""
         query = select(User).limit(limit).offset(offset)
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         return list(result.scalars().all())
 
-    def get_active_users(self) -> List[User]:
+    async def get_active_users(self) -> List[User]:
         """Get all active users."""
         query = select(User).where(User.is_active.is_(True))
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         return list(result.scalars().all())
 
-    def get_users_in_room(self, room_id: int) -> List[User]:
+    async def get_users_in_room(self, room_id: int) -> List[User]:
         """Get all users currently in a specific room."""
         query = select(User).where(
             and_(User.current_room_id == room_id, User.is_active.is_(True))
         )
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         return list(result.scalars().all())
 
-    def create(self, user: User) -> User:
+    async def update_activity(
+        self,
+        last_active: dict[int, datetime],
+        statuses: dict[int, UserStatus],
+        chunk_size: int = ACTIVITY_UPDATE_CHUNK_SIZE,
+    ) -> int:
+        """
+        Write last_active and status of many users with an UPDATE by primary
+        key, executed for chunk_size users at a time (executemany). Users
+        deleted in the meantime are skipped.
+        :param last_active: Dictionary mapping user IDs to last activity
+        :param statuses: Dictionary mapping user IDs to new status
+        :param chunk_size: Users per executemany
+        :return: Number of updated users
+        """
+        rows: dict[int, dict] = {}
+        for user_id, value in last_active.items():
+            rows.setdefault(user_id, {"user_id": user_id})["new_last_active"] = value
+        for user_id, value in statuses.items():
+            rows.setdefault(user_id, {"user_id": user_id})["new_status"] = value
+
+        # Every row of an executemany binds the same columns
+        batches: dict[tuple[str, ...], list[dict]] = {}
+        for row in rows.values():
+            batches.setdefault(
+                tuple(key for key in row if key != "user_id"), []
+            ).append(row)
+
+        users = User.__table__
+        updated = 0
+        for keys, batch in batches.items():
+            query = (
+                update(users)
+                .where(users.c.id == bindparam("user_id"))
+                .values({key.removeprefix("new_"): bindparam(key) for key in keys})
+            )
+            for start in range(0, len(batch), chunk_size):
+                chunk = batch[start : start + chunk_size]
+                result = await self.db.execute(query, chunk)
+                updated += result.rowcount if result.rowcount >= 0 else len(chunk)
+
+        # Cached users only go stale on status changes worth a reload
+        invalidate_on_commit(self.db, list(statuses))
+        return updated
+
+    async def create(self, user: User) -> User:
         """Create new user."""
         self.db.add(user)
-        self.db.commit()
-        self.db.refresh(user)
+        await self.db.flush()
         return user
 
-    def update(self, user: User) -> User:
+    async def update(self, user: User) -> User:
         """Update existing user."""
-        self.db.commit()
-        self.db.refresh(user)
+        await self.db.flush()
+        invalidate_on_commit(self.db, [user.id])
         return user
 
-    def delete(self, id: int) -> bool:
+    async def delete(self, id: int) -> bool:
         """Delete user by ID (soft delete - set inactive)."""
-        user = self.get_by_id(id)
+        user = await self.get_by_id(id)
         if user:
+            if user.current_room_id:
+                await RoomRepository(self.db).release_seat(user.current_room_id)
+                user.current_room_id = None
             user.is_active = False
-            self.db.commit()
+            await self.db.flush()
+            invalidate_on_commit(self.db, [user.id])
             return True
         return False
 
-    def exists(self, id: int) -> bool:
+    async def exists(self, id: int) -> bool:
         """Check if user exists by ID."""
-        user = self.get_by_id(id)
+        user = await self.get_by_id(id)
         return user is not None
 
-    def email_exists(self, email: str) -> bool:
+    async def email_exists(self, email: str) -> bool:
         """Check if email already exists."""
-        user = self.get_by_email(email)
+        user = await self.get_by_email(email)
         return user is not None
 
-    def username_exists(self, username: str) -> bool:
+    async def username_exists(self, username: str) -> bool:
         """Check if username already exists."""
-        user = self.get_by_username(username)
+        user = await self.get_by_username(username)
         return user is not None
@@ -0,0 +1,31 @@
+from pydantic import BaseModel, Field
+
+
+class DatabasePoolStatsResponse(BaseModel):
+    """
+    Connection pool of one database engine in this worker.
+    """
+
+    engine: str = Field(description="primary or replica-<n>")
+    pool_class: str
+    size: int = Field(description="Connections kept open")
+    checked_out: int = Field(description="Connections currently in use")
+    overflow: int = Field(description="Connections open beyond size")
+    max_overflow: int
+    checkouts: int
+    timeouts: int = Field(description="Checkouts given up after pool_timeout")
+    wait_avg_ms: float = Field(description="Average wait for a connection")
+    wait_max_ms: float
+
+
+class ReadRoutingStatsResponse(BaseModel):
+    """
+    Routing of read-only queries in this worker since process start.
+    """
+
+    replicas: int
+    sticky_window: float = Field(description="Seconds of read-your-writes")
+    sticky_users: int = Field(description="Users currently reading the primary")
+    replica_reads: int = Field(description="Requests reading from a replica")
+    sticky_reads: int = Field(description="Requests kept on the primary")
+    primary_reads: int = Field(description="Requests without replicas")
@@ -67,3 +67,31 @@ class UserUpdate(BaseModel):
     username: SanitizedUsername | None = Field(
         None, min_length=3, max_length=20, description="New username"
     )
+
+
+class IdentityCacheStatsResponse(BaseModel):
+    """
+    Counters of the authenticated-user cache since process start.
+    """
+
+    size: int
+    max_entries: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+
+
+class PasswordHashStatsResponse(BaseModel):
+    """
+    Load of the password hashing pool since process start.
+    """
+
+    max_workers: int
+    max_pending: int
+    pending: int
+    completed: int
+    rejected: int
+    queue_wait_avg_ms: float
+    queue_wait_max_ms: float
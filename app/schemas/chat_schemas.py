@@ -1,6 +1,7 @@
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import AliasChoices, BaseModel, Field, ConfigDict
 from datetime import datetime
 from app.core.validators import SanitizedString
+from app.models.message_archive import RetentionMode
 
 
 class MessageCreate(BaseModel):
@@ -21,7 +22,10 @@ class MessageResponse(BaseModel):
     id: int
     sender_id: int
     sender_username: str
-    content: str
+    content: str = Field(
+        validation_alias=AliasChoices("display_content", "content"),
+        description="Content in the reader's language if translated",
+    )
     sent_at: datetime
 
     room_id: int | None = Field(None, description="Room ID for room-wide chat")
@@ -32,6 +36,79 @@ class MessageResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class TranslationStatusResponse(BaseModel):
+    """
+    Background translation status of a message.
+    """
+
+    message_id: int
+    status: str = Field(
+        description="pending, processing, completed, failed or not_required"
+    )
+    attempts: int = 0
+    target_languages: list[str] = Field(
+        default_factory=list, description="Requested target languages"
+    )
+    completed_languages: list[str] = Field(
+        default_factory=list, description="Languages with a stored translation"
+    )
+    last_error: str | None = None
+    next_attempt_at: datetime | None = Field(
+        None, description="When the next retry is scheduled"
+    )
+
+
+class MemoryCacheStats(BaseModel):
+    """
+    Counters of the in-process translation cache tier.
+    """
+
+    size: int
+    max_entries: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+
+
+class PersistentCacheStats(BaseModel):
+    """
+    Counters of the database translation cache tier.
+    """
+
+    hits: int
+    misses: int
+
+
+class TranslationCacheStatsResponse(BaseModel):
+    """
+    Hit/miss counters of the translation memory since process start.
+    """
+
+    memory: MemoryCacheStats
+    persistent: PersistentCacheStats
+
+
+class MessageRetentionStatsResponse(BaseModel):
+    """
+    Progress of the current retention sweep and totals since process start.
+    """
+
+    running: bool
+    sweeps_completed: int
+    sweeps_skipped: int = Field(
+        description="Sweeps left to the worker holding the sweep lock"
+    )
+    targets_total: int = Field(description="Targets found by the last sweep")
+    targets_done: int = Field(description="Targets processed by the last sweep")
+    batches: int
+    messages_deleted: int
+    messages_archived: int
+    failures: int
+    last_sweep_at: datetime | None = None
+    last_sweep_duration_ms: float
+
+
 class ConversationCreate(BaseModel):
     """
     Schema for creating conversations.
@@ -45,6 +122,22 @@ class ConversationCreate(BaseModel):
     conversation_type: str = Field(
         description="'private' (2 users) or 'group' (2+ users)"
     )
+    message_retention_count: int | None = Field(
+        None,
+        ge=1,
+        le=100000,
+        description="Number of newest messages kept (default: server limit)",
+    )
+    message_retention_days: int | None = Field(
+        None,
+        ge=1,
+        le=3650,
+        description="Maximum message age in days (default: server limit)",
+    )
+    message_retention_mode: RetentionMode = Field(
+        RetentionMode.DELETE,
+        description="Delete or archive messages outside the retention policy",
+    )
 
 
 class ConversationResponse(BaseModel):
@@ -2,6 +2,7 @@ from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime
 
 from app.core.validators import SanitizedString
+from app.models.message_archive import RetentionMode
 
 
 class RoomResponse(BaseModel):
@@ -13,6 +14,10 @@ class RoomResponse(BaseModel):
     name: str
     description: str | None = None
     max_users: int | None = None
+    user_count: int = 0
+    message_retention_count: int | None = None
+    message_retention_days: int | None = None
+    message_retention_mode: RetentionMode
     is_translation_enabled: bool
     is_active: bool
     created_at: datetime
@@ -29,6 +34,34 @@ class RoomCreate(BaseModel):
     name: SanitizedString = Field(min_length=1, max_length=100)
     description: SanitizedString | None = Field(None, max_length=500)
     max_users: int | None = Field(None, ge=1, le=1000)
+    message_retention_count: int | None = Field(
+        None,
+        ge=1,
+        le=100000,
+        description="Number of newest messages kept (default: server limit)",
+    )
+    message_retention_days: int | None = Field(
+        None,
+        ge=1,
+        le=3650,
+        description="Maximum message age in days (default: server limit)",
+    )
+    message_retention_mode: RetentionMode = Field(
+        RetentionMode.DELETE,
+        description="Delete or archive messages outside the retention policy",
+    )
     is_translation_enabled: bool = Field(
         False, description="Enable automatic translation in this room"
     )
+
+
+class RoomOccupancyStatsResponse(BaseModel):
+    """
+    Totals of the room occupancy counter reconciliation since process start.
+    """
+
+    running: bool
+    runs_completed: int
+    rooms_repaired: int = Field(description="Rooms whose counter had drifted")
+    failures: int
+    last_run_at: datetime | None = None
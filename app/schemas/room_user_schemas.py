@@ -56,3 +56,28 @@ class UserStatusUpdate(BaseModel):
     """
 
     status: UserStatus = Field(description="New user status")
+
+
+class PresenceStatsResponse(BaseModel):
+    """
+    Size of the in-memory presence index and totals since process start.
+    """
+
+    running: bool
+    rooms: int = Field(description="Rooms held in the presence index")
+    users: int = Field(description="Users held in the presence index")
+    users_expired: int = Field(description="Users switched to AWAY when idle")
+    failures: int
+
+
+class UserActivityStatsResponse(BaseModel):
+    """
+    Write-behind buffer of status and last_active updates.
+    """
+
+    running: bool
+    pending_users: int = Field(description="Users with unflushed updates")
+    updates_recorded: int
+    flushes: int
+    rows_written: int = Field(description="User rows written by all flushes")
+    failures: int
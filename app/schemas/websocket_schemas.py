@@ -0,0 +1,15 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class WebSocketCommand(BaseModel):
+    """
+    Command sent by a client over the WebSocket gateway.
+    """
+
+    action: Literal["subscribe", "unsubscribe", "ping"]
+    channel: Literal["room", "conversation"] | None = Field(
+        None, description="Channel type for subscribe/unsubscribe"
+    )
+    id: int | None = Field(None, description="Room or conversation ID")
@@ -1,44 +1,119 @@
-import urllib.parse
-import requests
+import asyncio
 import random
+import time
+import urllib.parse
+
+import httpx
+
+from app.core.config import settings
+
+
+DICEBEAR_STYLES_URL = "https://api.dicebear.com/7.x/styles"
+
+# Bundled snapshot of the DiceBear style catalog, served until the first refresh
+BUNDLED_AVATAR_STYLES = (
+    "bottts",
+    "avataaars",
+    "big-smile",
+    "identicon",
+    "initials",
+    "pixel-art",
+    "adventurer",
+    "big-ears",
+    "croodles",
+    "fun-emoji",
+    "lorelei",
+    "micah",
+    "miniavs",
+    "open-peeps",
+    "personas",
+    "rings",
+    "shapes",
+)
+
+
+class AvatarStyleCatalog:
+    """
+    In-memory DiceBear style catalog.
+
+    Starts from the bundled snapshot and is refreshed from the DiceBear API
+    by a background task every ttl seconds, so lookups never wait on the
+    network. A failed refresh keeps the current catalog.
+    """
+
+    def __init__(self, styles=BUNDLED_AVATAR_STYLES, ttl: float = 86400.0):
+        self.ttl = ttl
+        self.loaded_at: float | None = None
+        self._refresh_task: asyncio.Task | None = None
+        self._set_styles(styles)
+
+    def _set_styles(self, styles) -> None:
+        """Replace catalog content."""
+        self._styles = tuple(styles)
+        self._lookup = frozenset(style.lower() for style in self._styles)
+
+    @property
+    def styles(self) -> tuple[str, ...]:
+        """
+        Get available styles.
+        :return: Tuple of style IDs
+        """
+        return self._styles
+
+    def __contains__(self, style: str) -> bool:
+        return style.lower() in self._lookup
+
+    async def refresh(self) -> bool:
+        """
+        Reload catalog from the DiceBear API.
+        :return: True if the catalog was replaced, else False
+        """
+        try:
+            async with httpx.AsyncClient(timeout=5) as client:
+                response = await client.get(DICEBEAR_STYLES_URL)
+            response.raise_for_status()
+            styles = [style["id"] for style in response.json() if "id" in style]
+        except (httpx.HTTPError, KeyError, TypeError, ValueError) as e:
+            print(f"Could not refresh DiceBear styles: {e}")
+            return False
+
+        if not styles:
+            return False
+
+        self._set_styles(styles)
+        self.loaded_at = time.monotonic()
+        return True
+
+    async def start(self) -> None:
+        """Spawn background refresh task."""
+        if self._refresh_task is None and self.ttl > 0:
+            self._refresh_task = asyncio.create_task(
+                self._refresh_periodically(), name="avatar-style-refresh"
+            )
+
+    async def stop(self) -> None:
+        """Cancel background refresh task."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            await asyncio.gather(self._refresh_task, return_exceptions=True)
+            self._refresh_task = None
+
+    async def _refresh_periodically(self) -> None:
+        """Refresh catalog now and then every ttl seconds until cancelled."""
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.ttl)
+
+
+avatar_style_catalog = AvatarStyleCatalog(ttl=settings.avatar_style_refresh_interval)
 
 
 def get_available_avatar_styles() -> list[str]:
     """
-    Get list of available DiceBear avatar styles from API
-    with fallback of hardcoded list.
+    Get list of available DiceBear avatar styles from the cached catalog.
     :return: List of available styles.
     """
-    try:
-        response = requests.get("https://api.dicebear.com/7.x/styles", timeout=5)
-
-        if response.status_code == 200:
-            styles_data = response.json()
-            return [style["id"] for style in styles_data if "id" in style]
-
-    except (requests.RequestException, KeyError, ValueError) as e:
-        print(f"Could not fetch DiceBear styles from API : {e}")
-        print("Fallback to hardcoded style list")
-
-    return [
-        "bottts",
-        "avataaars",
-        "big-smile",
-        "identicon",
-        "initials",
-        "pixel-art",
-        "adventurer",
-        "big-ears",
-        "croodles",
-        "fun-emoji",
-        "lorelei",
-        "micah",
-        "miniavs",
-        "open-peeps",
-        "personas",
-        "rings",
-        "shapes",
-    ]
+    return list(avatar_style_catalog.styles)
 
 
 def get_random_avatar_style() -> str:
@@ -46,8 +121,7 @@ def get_random_avatar_style() -> str:
     Get a random avatar style from available styles.
     :return: Random style name
     """
-    styles = get_available_avatar_styles()
-    return random.choice(styles)
+    return random.choice(avatar_style_catalog.styles)
 
 
 def is_valid_avatar_style(style: str) -> bool:
@@ -56,10 +130,7 @@ def is_valid_avatar_style(style: str) -> bool:
     :param style: Style to validate
     :return: True if available, else False
     """
-    available_styles = get_available_avatar_styles()
-    return style.lower() in [
-        available_style.lower() for available_style in available_styles
-    ]
+    return style in avatar_style_catalog
 
 
 def generate_avatar_url(username: str, style: str = "bottts") -> str:
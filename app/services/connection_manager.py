@@ -0,0 +1,296 @@
+import asyncio
+
+from fastapi import WebSocket
+
+from app.models.message import Message
+from app.schemas.chat_schemas import MessageResponse
+from app.services.event_backplane import (
+    IEventBackplane,
+    InMemoryEventBackplane,
+    create_event_backplane,
+)
+
+
+def room_channel(room_id: int) -> str:
+    """
+    Channel name of a room chat.
+    :param room_id: Room ID
+    :return: Channel name
+    """
+    return f"room:{room_id}"
+
+
+def conversation_channel(conversation_id: int) -> str:
+    """
+    Channel name of a private/group conversation.
+    :param conversation_id: Conversation ID
+    :return: Channel name
+    """
+    return f"conversation:{conversation_id}"
+
+
+def message_channel(message: Message) -> str:
+    """
+    Channel a message is delivered on.
+    :param message: Room or conversation message
+    :return: Channel name
+    """
+    if message.room_id is not None:
+        return room_channel(message.room_id)
+    return conversation_channel(message.conversation_id)
+
+
+class ClientConnection:
+    """
+    One authenticated WebSocket with its subscriptions.
+
+    Events are queued in a bounded outbox drained by a single sender task,
+    so a slow client never blocks fan-out to the others.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        user_id: int,
+        username: str,
+        preferred_language: str | None,
+        outbox_size: int = 100,
+    ):
+        self.websocket = websocket
+        self.user_id = user_id
+        self.username = username
+        self.preferred_language = (
+            preferred_language.upper() if preferred_language else None
+        )
+        self.channels: set[str] = set()
+        self.outbox: asyncio.Queue[dict] = asyncio.Queue(maxsize=outbox_size)
+        self.sender_task: asyncio.Task | None = None
+
+    def enqueue(self, event: dict) -> bool:
+        """
+        Queue event for delivery.
+        :param event: JSON-serializable event
+        :return: False if the outbox is full
+        """
+        try:
+            self.outbox.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    def start_sender(self) -> asyncio.Task:
+        """
+        Spawn the task delivering queued events.
+        :return: Sender task
+        """
+        self.sender_task = asyncio.create_task(self._send_events())
+        return self.sender_task
+
+    def stop_sender(self) -> None:
+        """Stop delivering events, e.g. after the outbox overflowed."""
+        if self.sender_task:
+            self.sender_task.cancel()
+
+    async def _send_events(self) -> None:
+        """Deliver queued events until the socket fails or the task is cancelled."""
+        while True:
+            event = await self.outbox.get()
+            await self.websocket.send_json(event)
+
+
+class ConnectionManager:
+    """
+    Registry of this process' WebSocket connections and channel subscriptions.
+
+    Events are published through the backplane and applied locally when
+    they come back from it, so clients connected to any worker process
+    receive them.
+    """
+
+    def __init__(self, backplane: IEventBackplane | None = None):
+        self.backplane = backplane or InMemoryEventBackplane()
+        self.backplane.add_listener(self.handle_event)
+        self._connections: set[ClientConnection] = set()
+        self._channels: dict[str, set[ClientConnection]] = {}
+
+    @property
+    def connection_count(self) -> int:
+        """
+        Number of connected clients.
+        :return: Connection count
+        """
+        return len(self._connections)
+
+    async def start(self) -> None:
+        """Start receiving events from the backplane."""
+        await self.backplane.start()
+
+    async def stop(self) -> None:
+        """Stop receiving events from the backplane."""
+        await self.backplane.stop()
+
+    def register(self, connection: ClientConnection) -> None:
+        """Track a newly accepted connection."""
+        self._connections.add(connection)
+
+    def unregister(self, connection: ClientConnection) -> None:
+        """Forget a connection and all of its subscriptions."""
+        for channel in list(connection.channels):
+            self.unsubscribe(connection, channel)
+        self._connections.discard(connection)
+
+    def subscribe(self, connection: ClientConnection, channel: str) -> None:
+        """Subscribe connection to channel."""
+        connection.channels.add(channel)
+        self._channels.setdefault(channel, set()).add(connection)
+
+    def unsubscribe(self, connection: ClientConnection, channel: str) -> None:
+        """Unsubscribe connection from channel."""
+        connection.channels.discard(channel)
+        subscribers = self._channels.get(channel)
+        if subscribers is None:
+            return
+        subscribers.discard(connection)
+        if not subscribers:
+            del self._channels[channel]
+
+    def subscribers(self, channel: str) -> list[ClientConnection]:
+        """
+        Get local connections subscribed to channel.
+        :param channel: Channel name
+        :return: List of connections
+        """
+        return list(self._channels.get(channel, ()))
+
+    async def publish_message(self, message: Message) -> None:
+        """
+        Push a newly sent message to subscribers of its room or conversation.
+        :param message: Created message with sender_username set
+        """
+        channel = message_channel(message)
+        await self._publish(
+            {
+                "type": "message.created",
+                "channel": channel,
+                "message": MessageResponse.model_validate(message).model_dump(
+                    mode="json"
+                ),
+            }
+        )
+
+    async def publish_translations(
+        self, message: Message, translations: dict[str, str]
+    ) -> None:
+        """
+        Push stored translations, each subscriber only in its own language.
+        :param message: Translated message
+        :param translations: Dictionary mapping language codes to translated content
+        """
+        await self._publish(
+            {
+                "type": "message.translated",
+                "channel": message_channel(message),
+                "message_id": message.id,
+                "translations": {
+                    language.upper(): content
+                    for language, content in translations.items()
+                },
+            }
+        )
+
+    async def publish_event(self, channel: str, event_type: str, **data) -> None:
+        """
+        Push a room or presence event to all subscribers of channel.
+        :param channel: Channel name
+        :param event_type: Event type (e.g. 'room.user_joined')
+        :param data: Additional JSON-serializable event fields
+        """
+        await self._publish({"type": event_type, "channel": channel, **data})
+
+    async def unsubscribe_user(self, user_id: int, channel: str) -> None:
+        """
+        Remove all connections of a user from channel (e.g. after leaving a room).
+        :param user_id: User ID
+        :param channel: Channel name
+        """
+        await self._publish(
+            {"type": "channel.unsubscribe_user", "channel": channel, "user_id": user_id}
+        )
+
+    async def close_channel(self, channel: str) -> None:
+        """
+        Notify and unsubscribe everyone from channel (e.g. room closed).
+        :param channel: Channel name
+        """
+        await self._publish({"type": "channel.closed", "channel": channel})
+
+    async def _publish(self, event: dict) -> None:
+        """
+        Hand event to the backplane. Push is best effort and never fails
+        the request that triggered it.
+        :param event: JSON-serializable event
+        """
+        try:
+            await self.backplane.publish(event)
+        except Exception as e:
+            print(f"Failed to publish {event['type']} event: {e}")
+
+    def handle_event(self, event: dict) -> None:
+        """
+        Apply an event received from the backplane to local connections.
+        :param event: Event dictionary
+        """
+        channel = event.get("channel")
+        event_type = event.get("type")
+        if channel not in self._channels:
+            return
+
+        if event_type == "message.translated":
+            translations = event["translations"]
+            self._deliver(
+                (
+                    connection,
+                    {
+                        "type": event_type,
+                        "channel": channel,
+                        "message_id": event["message_id"],
+                        "language": connection.preferred_language,
+                        "content": translations[connection.preferred_language],
+                    },
+                )
+                for connection in self.subscribers(channel)
+                if connection.preferred_language in translations
+            )
+        elif event_type == "channel.unsubscribe_user":
+            for connection in self.subscribers(channel):
+                if connection.user_id == event["user_id"]:
+                    self.unsubscribe(connection, channel)
+        elif event_type == "channel.closed":
+            self._deliver(
+                (connection, event) for connection in self.subscribers(channel)
+            )
+            for connection in self.subscribers(channel):
+                self.unsubscribe(connection, channel)
+        else:
+            self._deliver(
+                (connection, event) for connection in self.subscribers(channel)
+            )
+
+    def _deliver(self, deliveries) -> int:
+        """
+        Queue events and drop connections whose outbox overflowed.
+        :param deliveries: Iterable of (connection, event)
+        :return: Number of queued events
+        """
+        delivered = 0
+        for connection, event in deliveries:
+            if connection.enqueue(event):
+                delivered += 1
+            else:
+                print(f"Dropping slow WebSocket client of user {connection.user_id}")
+                self.unregister(connection)
+                connection.stop_sender()
+        return delivered
+
+
+connection_manager = ConnectionManager(create_event_backplane())
@@ -1,11 +1,15 @@
 from fastapi import HTTPException, status
 
+from app.core.unit_of_work import UnitOfWork, run_after_commit
 from app.models.message import Message
+from app.models.message_archive import RetentionMode
 from app.models.conversation import Conversation
 from app.models.user import User
 from app.repositories.conversation_repository import IConversationRepository
 from app.repositories.message_repository import IMessageRepository
 from app.repositories.user_repository import IUserRepository
+from app.services.connection_manager import ConnectionManager
+from app.services.presence_service import PresenceService
 from app.services.translation_service import TranslationService
 
 
@@ -18,23 +22,35 @@ class ConversationService:
         message_repo: IMessageRepository,
         user_repo: IUserRepository,
         translation_service: TranslationService,
+        connection_manager: ConnectionManager,
+        presence_service: PresenceService,
+        unit_of_work: UnitOfWork | None = None,
     ):
         self.conversation_repo = conversation_repo
         self.message_repo = message_repo
         self.user_repo = user_repo
         self.translation_service = translation_service
+        self.connection_manager = connection_manager
+        self.presence_service = presence_service
+        self.unit_of_work = unit_of_work
 
-    def create_conversation(
+    async def create_conversation(
         self,
         current_user: User,
         participant_usernames: list[str],
         conversation_type: str,
+        message_retention_count: int | None = None,
+        message_retention_days: int | None = None,
+        message_retention_mode: RetentionMode = RetentionMode.DELETE,
     ) -> Conversation:
         """
         Create private or group conversation with validation.
         :param current_user: User creating the conversation
         :param participant_usernames: List of participant usernames
         :param conversation_type: 'private' or 'group'
+        :param message_retention_count: Number of newest messages kept
+        :param message_retention_days: Maximum message age in days
+        :param message_retention_mode: Delete or archive expired messages
         :return: Created conversation
         """
         if not current_user.current_room_id:
@@ -55,7 +71,7 @@ class ConversationService:
                 detail="Group conversations require at least 1 other participant",
             )
 
-        participant_users = self._validate_participants(
+        participant_users = await self._validate_participants(
             participant_usernames, current_user.current_room_id
         )
 
@@ -63,18 +79,25 @@ class ConversationService:
             user.id for user in participant_users
         ]
 
+        retention = {
+            "message_retention_count": message_retention_count,
+            "message_retention_days": message_retention_days,
+            "message_retention_mode": message_retention_mode,
+        }
         if conversation_type == "private":
-            return self.conversation_repo.create_private_conversation(
+            return await self.conversation_repo.create_private_conversation(
                 room_id=current_user.current_room_id,
                 participant_ids=all_participant_ids,
+                **retention,
             )
         else:
-            return self.conversation_repo.create_group_conversation(
+            return await self.conversation_repo.create_group_conversation(
                 room_id=current_user.current_room_id,
                 participant_ids=all_participant_ids,
+                **retention,
             )
 
-    def send_message(
+    async def send_message(
         self, current_user: User, conversation_id: int, content: str
     ) -> Message:
         """
@@ -84,25 +107,29 @@ class ConversationService:
         :param content: Message content
         :return: Created message
         """
-        conversation = self.conversation_repo.get_by_id(conversation_id)
+        conversation = await self.conversation_repo.get_by_id(conversation_id)
         if not conversation:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found"
             )
 
-        if not self.conversation_repo.is_participant(conversation_id, current_user.id):
+        if not await self.conversation_repo.is_participant(
+            conversation_id, current_user.id
+        ):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="User is not a participant in this conversation",
             )
 
-        message = self.message_repo.create_conversation_message(
+        message = await self.message_repo.create_conversation_message(
             sender_id=current_user.id, conversation_id=conversation_id, content=content
         )
 
         room = conversation.room
         if room and room.is_translation_enabled:
-            participants = self.conversation_repo.get_participants(conversation_id)
+            participants = await self.conversation_repo.get_participants(
+                conversation_id
+            )
             target_languages = list(
                 set(
                     [
@@ -122,88 +149,146 @@ class ConversationService:
                     else None
                 )
 
-                self.translation_service.translate_and_store_message(
+                await self.translation_service.enqueue_message_translation(
                     message_id=message.id,
-                    content=content,
                     source_language=source_lang,
                     target_languages=target_languages,
                 )
 
         message.sender_username = current_user.username
+        await run_after_commit(
+            self.unit_of_work, lambda: self.connection_manager.publish_message(message)
+        )
         return message
 
-    def get_messages(
+    async def get_messages(
         self,
         current_user: User,
         conversation_id: int,
-        page: int = 1,
         page_size: int = 50,
-    ) -> tuple[list[Message], int]:
+        before: int | None = None,
+        after: int | None = None,
+        include_total: bool = False,
+    ) -> tuple[list[Message], bool, int | None]:
         """
-        Get conversation messages with validation and pagination.
+        Get conversation messages with validation and cursor pagination.
         :param current_user: User requesting messages
         :param conversation_id: Conversation ID
-        :param page: Page number
         :param page_size: Messages per page
-        :return: Tuple of (messages, total_count)
+        :param before: Return messages older than this message ID
+        :param after: Return messages newer than this message ID
+        :param include_total: Whether to count all conversation messages
+        :return: Tuple of (messages, has_more, total_count or None)
         """
-        self._validate_conversation_access(current_user.id, conversation_id)
+        if before is not None and after is not None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Use either 'before' or 'after' cursor, not both",
+            )
+
+        await self._validate_conversation_access(current_user.id, conversation_id)
 
-        return self.message_repo.get_conversation_messages(
+        (
+            messages,
+            has_more,
+            total_count,
+        ) = await self.message_repo.get_conversation_messages(
             conversation_id=conversation_id,
-            page=page,
             page_size=page_size,
+            before=before,
+            after=after,
             user_language=current_user.preferred_language,
+            include_total=include_total,
+        )
+
+        if before is None and messages:
+            await self.conversation_repo.mark_read(
+                conversation_id, current_user.id, messages[0].id
+            )
+
+        return messages, has_more, total_count
+
+    async def get_message_translation_status(
+        self, current_user: User, conversation_id: int, message_id: int
+    ) -> dict:
+        """
+        Get background translation status of a conversation message.
+        :param current_user: User requesting the status
+        :param conversation_id: Conversation ID
+        :param message_id: Message ID
+        :return: Translation status data
+        """
+        await self._validate_conversation_access(current_user.id, conversation_id)
+
+        message = await self.message_repo.get_by_id(message_id)
+        if not message or message.conversation_id != conversation_id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Message with id {message_id} not found in conversation",
+            )
+
+        translation_status = await self.translation_service.get_translation_status(
+            message_id
         )
+        return translation_status or {
+            "message_id": message_id,
+            "status": "not_required",
+        }
 
-    def get_user_conversations(self, user_id: int) -> list[dict]:
+    async def get_user_conversations(self, user_id: int) -> list[dict]:
         """
         Get all active conversations for user with formatted response.
         :param user_id: User ID
         :return: List of formatted conversation data
         """
-        conversations = self.conversation_repo.get_user_conversations(user_id)
-
-        conversation_list = []
-        for conv in conversations:
-            participants = self.conversation_repo.get_participants(conv.id)
-            participant_names = [p.username for p in participants if p.id != user_id]
-
-            conversation_list.append(
-                {
-                    "id": conv.id,
-                    "type": conv.conversation_type.value,
-                    "room_id": conv.room_id,
-                    "participants": participant_names,
-                    "participant_count": len(participants),
-                    "created_at": conv.created_at,
-                }
-            )
+        summaries = await self.conversation_repo.get_user_conversation_summaries(
+            user_id
+        )
 
-        return conversation_list
+        return [
+            {
+                "id": summary["conversation"].id,
+                "type": summary["conversation"].conversation_type.value,
+                "room_id": summary["conversation"].room_id,
+                "participants": [
+                    username
+                    for participant_id, username in summary["participants"]
+                    if participant_id != user_id
+                ],
+                "participant_count": len(summary["participants"]),
+                "created_at": summary["conversation"].created_at,
+                "last_message": summary["last_message"],
+                "unread_count": summary["unread_count"],
+            }
+            for summary in summaries
+        ]
 
-    def get_participants(self, current_user: User, conversation_id: int) -> list[dict]:
+    async def get_participants(
+        self, current_user: User, conversation_id: int
+    ) -> list[dict]:
         """
         Get conversation participants with validation.
         :param current_user: User requesting participants
         :param conversation_id: Conversation ID
         :return: List of formatted participant data
         """
-        self._validate_conversation_access(current_user.id, conversation_id)
+        await self._validate_conversation_access(current_user.id, conversation_id)
 
-        participants = self.conversation_repo.get_participants(conversation_id)
+        participants = await self.conversation_repo.get_participants(conversation_id)
 
         return [
             {
                 "id": user.id,
                 "username": user.username,
-                "status": user.status.value,
+                "status": self.presence_service.current_status(user).value,
                 "avatar_url": user.avatar_url,
             }
             for user in participants
         ]
 
-    def _validate_participants(self, usernames: list[str], room_id: int) -> list[User]:
+    async def _validate_participants(
+        self, usernames: list[str], room_id: int
+    ) -> list[User]:
         """
         Validate and return participant users.
         :param usernames: List of usernames to validate
@@ -212,7 +297,7 @@ class ConversationService:
         """
         participant_users = []
         for username in usernames:
-            user = self.user_repo.get_by_username(username)
+            user = await self.user_repo.get_by_username(username)
             if not user:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -232,7 +317,7 @@ class ConversationService:
 
         return participant_users
 
-    def _validate_conversation_access(
+    async def _validate_conversation_access(
         self, user_id: int, conversation_id: int
     ) -> Conversation:
         """
@@ -241,13 +326,13 @@ class ConversationService:
         :param conversation_id: Conversation ID
         :return: Conversation object
         """
-        conversation = self.conversation_repo.get_by_id(conversation_id)
+        conversation = await self.conversation_repo.get_by_id(conversation_id)
         if not conversation:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found"
             )
 
-        if not self.conversation_repo.is_participant(conversation_id, user_id):
+        if not await self.conversation_repo.is_participant(conversation_id, user_id):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="User is not a participant in this conversation",
@@ -0,0 +1,191 @@
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+
+import asyncpg
+
+from app.core.config import settings
+
+
+EventListener = Callable[[dict], None]
+
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more
+POSTGRES_MAX_PAYLOAD_BYTES = 7900
+
+
+class IEventBackplane(ABC):
+    """
+    Abstract pub/sub interface carrying message, presence and room events
+    between all worker processes.
+
+    Every published event is delivered to the listeners of every process,
+    including the publishing one, so local fan-out has a single code path.
+    """
+
+    def __init__(self):
+        self._listeners: list[EventListener] = []
+
+    def add_listener(self, listener: EventListener) -> None:
+        """
+        Register callback invoked for every received event.
+        :param listener: Callback receiving the event dictionary
+        """
+        self._listeners.append(listener)
+
+    def _dispatch(self, event: dict) -> None:
+        """Invoke listeners, isolating their failures from each other."""
+        for listener in self._listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                print(f"Event listener failed for {event.get('type')}: {e}")
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Open backplane resources and start receiving events."""
+        pass
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Release backplane resources on shutdown."""
+        pass
+
+    @abstractmethod
+    async def publish(self, event: dict) -> None:
+        """Send event to all processes."""
+        pass
+
+
+class InMemoryEventBackplane(IEventBackplane):
+    """Single-process backplane delivering events synchronously (dev and tests)."""
+
+    async def start(self) -> None:
+        """Nothing to open in-process."""
+        pass
+
+    async def stop(self) -> None:
+        """Nothing to release in-process."""
+        pass
+
+    async def publish(self, event: dict) -> None:
+        """Deliver event to local listeners."""
+        self._dispatch(event)
+
+
+class PostgresEventBackplane(IEventBackplane):
+    """
+    Backplane built on PostgreSQL LISTEN/NOTIFY.
+
+    Uses one dedicated asyncpg connection for listening and one for
+    publishing; both are re-opened on the next publish or by the reconnect
+    loop after the server drops them.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        channel: str = "thegathering_events",
+        reconnect_delay: float = 2.0,
+    ):
+        super().__init__()
+        self.dsn = dsn
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self._listen_connection: asyncpg.Connection | None = None
+        self._publish_connection: asyncpg.Connection | None = None
+        self._publish_lock = asyncio.Lock()
+        self._reconnect_task: asyncio.Task | None = None
+        self._running = False
+
+    async def start(self) -> None:
+        """Open listening connection and LISTEN on the event channel."""
+        self._running = True
+        await self._listen()
+
+    async def stop(self) -> None:
+        """Stop reconnecting and close both connections."""
+        self._running = False
+        if self._reconnect_task:
+            self._reconnect_task.cancel()
+            await asyncio.gather(self._reconnect_task, return_exceptions=True)
+            self._reconnect_task = None
+
+        for connection in (self._listen_connection, self._publish_connection):
+            if connection and not connection.is_closed():
+                await connection.close()
+        self._listen_connection = None
+        self._publish_connection = None
+
+    async def publish(self, event: dict) -> None:
+        """
+        NOTIFY all listening processes.
+        Oversized events are delivered to this process only.
+        """
+        payload = json.dumps(event, separators=(",", ":"))
+        if len(payload.encode("utf-8")) > POSTGRES_MAX_PAYLOAD_BYTES:
+            print(f"Event {event.get('type')} too large for NOTIFY - delivered locally")
+            self._dispatch(event)
+            return
+
+        async with self._publish_lock:
+            if self._publish_connection is None or self._publish_connection.is_closed():
+                self._publish_connection = await asyncpg.connect(self.dsn)
+            await self._publish_connection.execute(
+                "SELECT pg_notify($1, $2)", self.channel, payload
+            )
+
+    async def _listen(self) -> None:
+        """Connect and register the NOTIFY callback."""
+        connection = await asyncpg.connect(self.dsn)
+        connection.add_termination_listener(self._on_connection_lost)
+        await connection.add_listener(self.channel, self._on_notification)
+        self._listen_connection = connection
+
+    def _on_notification(self, connection, pid, channel, payload: str) -> None:
+        """Decode a NOTIFY payload and hand it to the listeners."""
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            print(f"Ignoring malformed event on {channel}")
+            return
+        self._dispatch(event)
+
+    def _on_connection_lost(self, connection) -> None:
+        """Schedule reconnect after the listening connection dropped."""
+        if self._running and not self._reconnect_task:
+            self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        """Re-open listening connection until it succeeds or the backplane stops."""
+        try:
+            while self._running:
+                await asyncio.sleep(self.reconnect_delay)
+                try:
+                    await self._listen()
+                    print("Event backplane reconnected")
+                    return
+                except (OSError, asyncpg.PostgresError) as e:
+                    print(f"Event backplane reconnect failed: {e}")
+        finally:
+            self._reconnect_task = None
+
+
+def get_postgres_dsn(database_url: str) -> str:
+    """
+    Strip SQLAlchemy driver suffix so asyncpg accepts the URL.
+    :param database_url: Configured database URL (e.g. postgresql+asyncpg://...)
+    :return: Plain postgresql:// DSN
+    """
+    scheme, separator, rest = database_url.partition("://")
+    return f"{scheme.split('+')[0]}{separator}{rest}"
+
+
+def create_event_backplane() -> IEventBackplane:
+    """
+    Create backplane configured by EVENT_BACKPLANE ('memory' or 'postgres').
+    :return: Event backplane instance
+    """
+    if settings.event_backplane == "postgres":
+        return PostgresEventBackplane(get_postgres_dsn(settings.database_url))
+    return InMemoryEventBackplane()
@@ -0,0 +1,191 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.constants import MAX_CONVERSATION_MESSAGES, MAX_ROOM_MESSAGES
+from app.core.database import AsyncSessionLocal
+from app.core.unit_of_work import transaction
+from app.models.message_archive import RetentionMode
+from app.repositories.message_retention_repository import (
+    CONVERSATION_SCOPE,
+    ROOM_SCOPE,
+    MessageRetentionRepository,
+    RetentionTarget,
+)
+
+
+class MessageRetentionSweeper:
+    """
+    Background task enforcing room and conversation retention policies
+    off the send path.
+
+    Every interval seconds it collects the rooms and conversations outside
+    their policy and expires their messages in batches of batch_size, each
+    batch in its own short transaction, yielding to the event loop between
+    batches. One worker process sweeps at a time, and after a complete
+    sweep only owners with new messages or an own policy are checked.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        interval: float = 300.0,
+        batch_size: int = 500,
+        room_keep_count: int = MAX_ROOM_MESSAGES,
+        conversation_keep_count: int = MAX_CONVERSATION_MESSAGES,
+        max_age_days: int | None = None,
+    ):
+        self.session_factory = session_factory
+        self.interval = interval
+        self.batch_size = batch_size
+        self.room_keep_count = room_keep_count
+        self.conversation_keep_count = conversation_keep_count
+        self.max_age_days = max_age_days
+        self._task: asyncio.Task | None = None
+        self._swept_message_id: int | None = None
+
+        self.sweeps_completed = 0
+        self.sweeps_skipped = 0
+        self.batches = 0
+        self.failures = 0
+        self.messages_deleted = 0
+        self.messages_archived = 0
+        self.targets_total = 0
+        self.targets_done = 0
+        self.last_sweep_at: datetime | None = None
+        self.last_sweep_duration = 0.0
+
+    async def start(self) -> None:
+        """Spawn periodic sweep task."""
+        if self._task is None and self.interval > 0:
+            self._task = asyncio.create_task(
+                self._sweep_periodically(), name="message-retention-sweeper"
+            )
+
+    async def stop(self) -> None:
+        """Cancel periodic sweep task."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def sweep(self) -> int:
+        """
+        Enforce retention policies of all rooms and conversations, unless
+        another worker is sweeping. The sweep lock is held by a session that
+        stays open until the sweep ends.
+        :return: Number of expired (deleted or archived) messages
+        """
+        started = time.perf_counter()
+        now = datetime.now(timezone.utc)
+
+        async with self.session_factory() as db:
+            repo = MessageRetentionRepository(db)
+            if not await repo.try_lock_sweep():
+                self.sweeps_skipped += 1
+                return 0
+
+            swept_message_id = await repo.get_max_message_id()
+            targets = await repo.get_retention_targets(
+                ROOM_SCOPE,
+                self.room_keep_count,
+                self.max_age_days,
+                now,
+                since_message_id=self._swept_message_id,
+            )
+            targets += await repo.get_retention_targets(
+                CONVERSATION_SCOPE,
+                self.conversation_keep_count,
+                self.max_age_days,
+                now,
+                since_message_id=self._swept_message_id,
+            )
+
+            self.targets_total = len(targets)
+            self.targets_done = 0
+            failures = self.failures
+            expired = 0
+            for target in targets:
+                try:
+                    expired += await self._expire_target(target, now)
+                except Exception as e:
+                    self.failures += 1
+                    print(f"Retention sweep failed for {target.scope} {target.id}: {e}")
+                self.targets_done += 1
+
+        # Failed targets are checked again until a sweep completes
+        if self.failures == failures:
+            self._swept_message_id = swept_message_id
+        self.sweeps_completed += 1
+        self.last_sweep_at = now
+        self.last_sweep_duration = time.perf_counter() - started
+        if expired:
+            print(f"Retention sweep expired {expired} messages")
+        return expired
+
+    async def _expire_target(self, target: RetentionTarget, now: datetime) -> int:
+        """
+        Expire messages of one target batch by batch until it complies.
+        :param target: Room or conversation outside its policy
+        :param now: Sweep start time
+        :return: Number of expired messages
+        """
+        expired = 0
+        while True:
+            async with self.session_factory() as db, transaction(db):
+                count = await MessageRetentionRepository(db).expire_messages(
+                    target, now, self.batch_size
+                )
+
+            self.batches += 1
+            if target.mode == RetentionMode.ARCHIVE:
+                self.messages_archived += count
+            else:
+                self.messages_deleted += count
+            expired += count
+
+            if count < self.batch_size:
+                return expired
+            await asyncio.sleep(0)
+
+    async def _sweep_periodically(self) -> None:
+        """Sweep every interval seconds until cancelled."""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.sweep()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failures += 1
+                print(f"Retention sweep failed: {e}")
+
+    def stats(self) -> dict:
+        """
+        Get sweep progress and totals since process start.
+        :return: Dictionary of counters
+        """
+        return {
+            "running": self._task is not None,
+            "sweeps_completed": self.sweeps_completed,
+            "sweeps_skipped": self.sweeps_skipped,
+            "targets_total": self.targets_total,
+            "targets_done": self.targets_done,
+            "batches": self.batches,
+            "messages_deleted": self.messages_deleted,
+            "messages_archived": self.messages_archived,
+            "failures": self.failures,
+            "last_sweep_at": self.last_sweep_at,
+            "last_sweep_duration_ms": self.last_sweep_duration * 1000,
+        }
+
+
+message_retention_sweeper = MessageRetentionSweeper(
+    session_factory=AsyncSessionLocal,
+    interval=settings.message_retention_interval,
+    batch_size=settings.message_retention_batch_size,
+    max_age_days=settings.message_retention_max_age_days,
+)
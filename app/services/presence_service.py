@@ -0,0 +1,354 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from app.core.config import settings
+from app.models.user import User, UserStatus
+from app.services.connection_manager import (
+    ConnectionManager,
+    connection_manager,
+    room_channel,
+)
+from app.services.user_activity_buffer import UserActivityBuffer, user_activity_buffer
+
+
+# Backplane channel of heartbeat refreshes, never delivered to clients
+PRESENCE_CHANNEL = "presence"
+
+RoomUsersLoader = Callable[[int], Awaitable[list[User]]]
+
+
+@dataclass
+class PresenceEntry:
+    """Live presence of one user in a room."""
+
+    user_id: int
+    username: str
+    avatar_url: str | None
+    status: UserStatus
+    last_active: datetime
+    # Set when the status was switched to AWAY by idle expiry
+    idle: bool = False
+
+
+def presence_fields(user: User) -> dict:
+    """
+    Presence data of a user carried by room and presence events.
+    :param user: User
+    :return: JSON-serializable event fields
+    """
+    return {
+        "user_id": user.id,
+        "username": user.username,
+        "avatar_url": user.avatar_url,
+        "status": user.status.value,
+        "last_active": user.last_active.isoformat() if user.last_active else None,
+    }
+
+
+def _room_id(channel: str | None) -> int | None:
+    """
+    Get room ID of a room channel.
+    :param channel: Channel name
+    :return: Room ID or None for other channels
+    """
+    if channel and channel.startswith("room:"):
+        return int(channel.split(":", 1)[1])
+    return None
+
+
+def _parse_time(value: str | None) -> datetime:
+    """
+    Parse event timestamp.
+    :param value: ISO timestamp or None
+    :return: Timezone-aware datetime, now if missing
+    """
+    if not value:
+        return datetime.now(timezone.utc)
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+class PresenceService:
+    """
+    In-memory presence index of the rooms this process serves.
+
+    A room is loaded from the database once, on its first read, and kept up
+    to date from the room and presence events of the backplane, so every
+    worker process sees joins, leaves and status changes of the others.
+    Heartbeats refresh last_active in memory; idle users expire to AWAY.
+    Database writes go through the write-behind activity buffer.
+    """
+
+    def __init__(
+        self,
+        connection_manager: ConnectionManager,
+        activity_buffer: UserActivityBuffer,
+        idle_timeout: float = 300.0,
+        sweep_interval: float = 15.0,
+        broadcast_interval: float = 60.0,
+    ):
+        self.connection_manager = connection_manager
+        self.activity_buffer = activity_buffer
+        self.idle_timeout = timedelta(seconds=idle_timeout)
+        self.sweep_interval = sweep_interval
+        self.broadcast_interval = timedelta(seconds=broadcast_interval)
+        self._rooms: dict[int, dict[int, PresenceEntry]] = {}
+        self._user_rooms: dict[int, int] = {}
+        self._broadcast_at: dict[int, datetime] = {}
+        self._task: asyncio.Task | None = None
+
+        self.users_expired = 0
+        self.failures = 0
+
+        connection_manager.backplane.add_listener(self.handle_event)
+
+    async def start(self) -> None:
+        """Spawn periodic idle expiry task."""
+        if self._task is None and self.sweep_interval > 0:
+            self._task = asyncio.create_task(
+                self._sweep_periodically(), name="presence-sweeper"
+            )
+
+    async def stop(self) -> None:
+        """Cancel periodic idle expiry task."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def get_room_users(
+        self, room_id: int, load_users: RoomUsersLoader
+    ) -> list[PresenceEntry]:
+        """
+        Get presence of the users in a room, loading the room on first use.
+        :param room_id: Room ID
+        :param load_users: Coroutine function returning the users of a room
+        :return: List of entries ordered by username
+        """
+        room = self._rooms.get(room_id)
+        if room is None:
+            users = await load_users(room_id)
+            room = self._rooms.setdefault(room_id, {})
+            now = datetime.now(timezone.utc)
+            for user in users:
+                if user.id not in room:
+                    self._remove(user.id)
+                    self._add(room_id, self._entry_from_user(user, now))
+        return sorted(room.values(), key=lambda entry: entry.username)
+
+    async def heartbeat(self, user_id: int, room_id: int | None = None) -> None:
+        """
+        Record activity of a user, bringing them back from idle AWAY.
+        :param user_id: User ID
+        :param room_id: Room of the user if known
+        """
+        now = datetime.now(timezone.utc)
+        self.activity_buffer.record(user_id, last_active=now)
+
+        room_id = room_id or self._user_rooms.get(user_id)
+        entry = self._rooms.get(room_id, {}).get(user_id)
+        if entry is not None:
+            entry.last_active = now
+            if entry.idle:
+                await self.set_status(room_id, entry, UserStatus.AVAILABLE)
+                return
+
+        last_broadcast = self._broadcast_at.get(user_id)
+        if last_broadcast is None or now - last_broadcast >= self.broadcast_interval:
+            self._broadcast_at[user_id] = now
+            await self.connection_manager.publish_event(
+                PRESENCE_CHANNEL,
+                "presence.heartbeat",
+                user_id=user_id,
+                room_id=room_id,
+                last_active=now.isoformat(),
+            )
+
+    async def set_status(
+        self,
+        room_id: int,
+        entry: PresenceEntry,
+        status: UserStatus,
+        idle: bool = False,
+    ) -> None:
+        """
+        Change status of an indexed user and tell the other processes.
+        :param room_id: Room ID
+        :param entry: Presence entry of the user
+        :param status: New status
+        :param idle: Whether the change is an idle expiry
+        """
+        entry.status = status
+        entry.idle = idle
+        self.activity_buffer.record(entry.user_id, status=status)
+        await self.connection_manager.publish_event(
+            room_channel(room_id),
+            "presence.updated",
+            user_id=entry.user_id,
+            username=entry.username,
+            status=status.value,
+            idle=idle,
+            last_active=entry.last_active.isoformat(),
+        )
+
+    async def expire_idle_users(self) -> int:
+        """
+        Switch users without heartbeat for idle_timeout to AWAY.
+        :return: Number of expired users
+        """
+        cutoff = datetime.now(timezone.utc) - self.idle_timeout
+        expired = [
+            (room_id, entry)
+            for room_id, room in self._rooms.items()
+            for entry in room.values()
+            if entry.status != UserStatus.AWAY and entry.last_active <= cutoff
+        ]
+        for room_id, entry in expired:
+            await self.set_status(room_id, entry, UserStatus.AWAY, idle=True)
+        self.users_expired += len(expired)
+        return len(expired)
+
+    async def change_status(self, user: User, status: UserStatus) -> None:
+        """
+        Set status chosen by a user through the write-behind buffer and
+        push it to the user's room.
+        :param user: User changing status
+        :param status: New status
+        """
+        self.activity_buffer.record(user.id, status=status)
+        if user.current_room_id:
+            await self.connection_manager.publish_event(
+                room_channel(user.current_room_id),
+                "presence.updated",
+                **{**presence_fields(user), "status": status.value, "idle": False},
+            )
+
+    def current_status(self, user: User) -> UserStatus:
+        """
+        Get status of a user loaded from the database, including a change
+        still waiting in the write-behind buffer.
+        :param user: Loaded user
+        :return: Current status
+        """
+        _, pending_status = self.activity_buffer.get_pending(user.id)
+        return pending_status or user.status
+
+    def handle_event(self, event: dict) -> None:
+        """
+        Apply a room or presence event received from the backplane.
+        :param event: Event dictionary
+        """
+        event_type = event.get("type")
+        room_id = _room_id(event.get("channel")) or event.get("room_id")
+
+        if event_type in ("room.user_joined", "room.user_left"):
+            self.activity_buffer.discard_status(event["user_id"])
+
+        if event_type == "room.user_joined":
+            self._remove(event["user_id"])
+            if room_id in self._rooms:
+                self._add(
+                    room_id,
+                    PresenceEntry(
+                        user_id=event["user_id"],
+                        username=event["username"],
+                        avatar_url=event.get("avatar_url"),
+                        status=UserStatus(
+                            event.get("status", UserStatus.AVAILABLE.value)
+                        ),
+                        last_active=_parse_time(event.get("last_active")),
+                    ),
+                )
+        elif event_type == "room.user_left":
+            self._remove(event["user_id"])
+        elif event_type == "channel.closed" and room_id is not None:
+            for user_id in self._rooms.pop(room_id, {}):
+                self._user_rooms.pop(user_id, None)
+                self.activity_buffer.discard_status(user_id)
+        elif event_type in ("presence.updated", "presence.heartbeat"):
+            entry = self._rooms.get(room_id, {}).get(event["user_id"])
+            if entry is None:
+                return
+            entry.last_active = max(
+                entry.last_active, _parse_time(event.get("last_active"))
+            )
+            if event_type == "presence.updated":
+                entry.status = UserStatus(event["status"])
+                entry.idle = event.get("idle", False)
+
+    def stats(self) -> dict:
+        """
+        Get index size and totals since process start.
+        :return: Dictionary of counters
+        """
+        return {
+            "running": self._task is not None,
+            "rooms": len(self._rooms),
+            "users": len(self._user_rooms),
+            "users_expired": self.users_expired,
+            "failures": self.failures,
+        }
+
+    def clear(self) -> None:
+        """Forget all rooms."""
+        self._rooms.clear()
+        self._user_rooms.clear()
+        self._broadcast_at.clear()
+
+    def _entry_from_user(self, user: User, now: datetime) -> PresenceEntry:
+        """
+        Build entry of a user loaded from the database, applying buffered
+        writes. AWAY users without recent activity count as idle.
+        :param user: User in the room
+        :param now: Current time
+        :return: PresenceEntry instance
+        """
+        pending_last_active, pending_status = self.activity_buffer.get_pending(user.id)
+        last_active = pending_last_active or user.last_active
+        if last_active is None:
+            last_active = now
+        elif last_active.tzinfo is None:
+            last_active = last_active.replace(tzinfo=timezone.utc)
+        status = pending_status or user.status
+        return PresenceEntry(
+            user_id=user.id,
+            username=user.username,
+            avatar_url=user.avatar_url,
+            status=status,
+            last_active=last_active,
+            idle=status == UserStatus.AWAY and now - last_active >= self.idle_timeout,
+        )
+
+    def _add(self, room_id: int, entry: PresenceEntry) -> None:
+        """Index entry under its room."""
+        self._rooms[room_id][entry.user_id] = entry
+        self._user_rooms[entry.user_id] = room_id
+
+    def _remove(self, user_id: int) -> None:
+        """Drop user from the room it is indexed in."""
+        room_id = self._user_rooms.pop(user_id, None)
+        if room_id is not None:
+            self._rooms.get(room_id, {}).pop(user_id, None)
+
+    async def _sweep_periodically(self) -> None:
+        """Expire idle users until cancelled."""
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                await self.expire_idle_users()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failures += 1
+                print(f"Presence sweep failed: {e}")
+
+
+presence_service = PresenceService(
+    connection_manager=connection_manager,
+    activity_buffer=user_activity_buffer,
+    idle_timeout=settings.presence_idle_timeout,
+    sweep_interval=settings.presence_sweep_interval,
+    broadcast_interval=settings.presence_broadcast_interval,
+)
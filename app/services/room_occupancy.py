@@ -0,0 +1,93 @@
+import asyncio
+from datetime import datetime, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.unit_of_work import transaction
+from app.repositories.room_repository import RoomRepository
+
+
+class RoomOccupancyReconciler:
+    """
+    Background task repairing drift of the denormalized room occupancy
+    counters (e.g. users moved by hand or a crash between two writes).
+
+    Every interval seconds it recounts the users of all active rooms in one
+    set-based UPDATE that only touches rooms whose counter is off.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        interval: float = 600.0,
+    ):
+        self.session_factory = session_factory
+        self.interval = interval
+        self._task: asyncio.Task | None = None
+
+        self.runs_completed = 0
+        self.rooms_repaired = 0
+        self.failures = 0
+        self.last_run_at: datetime | None = None
+
+    async def start(self) -> None:
+        """Spawn periodic reconciliation task."""
+        if self._task is None and self.interval > 0:
+            self._task = asyncio.create_task(
+                self._reconcile_periodically(), name="room-occupancy-reconciler"
+            )
+
+    async def stop(self) -> None:
+        """Cancel periodic reconciliation task."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def reconcile(self) -> int:
+        """
+        Recount occupancy of all active rooms.
+        :return: Number of repaired rooms
+        """
+        async with self.session_factory() as db, transaction(db):
+            repaired = await RoomRepository(db).reconcile_user_counts()
+
+        self.runs_completed += 1
+        self.rooms_repaired += repaired
+        self.last_run_at = datetime.now(timezone.utc)
+        if repaired:
+            print(f"Occupancy reconciliation repaired {repaired} rooms")
+        return repaired
+
+    async def _reconcile_periodically(self) -> None:
+        """Reconcile every interval seconds until cancelled."""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.reconcile()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failures += 1
+                print(f"Occupancy reconciliation failed: {e}")
+
+    def stats(self) -> dict:
+        """
+        Get reconciliation totals since process start.
+        :return: Dictionary of counters
+        """
+        return {
+            "running": self._task is not None,
+            "runs_completed": self.runs_completed,
+            "rooms_repaired": self.rooms_repaired,
+            "failures": self.failures,
+            "last_run_at": self.last_run_at,
+        }
+
+
+room_occupancy_reconciler = RoomOccupancyReconciler(
+    session_factory=AsyncSessionLocal,
+    interval=settings.room_occupancy_reconcile_interval,
+)
@@ -1,7 +1,10 @@
+from datetime import datetime, timezone
+
 from fastapi import HTTPException, status
 
-from app.core.constants import MAX_ROOM_MESSAGES
+from app.core.unit_of_work import UnitOfWork, run_after_commit
 from app.models.message import Message
+from app.models.message_archive import RetentionMode
 from app.models.room import Room
 from app.models.user import User, UserStatus
 from app.repositories.conversation_repository import IConversationRepository
@@ -9,6 +12,8 @@ from app.repositories.room_repository import IRoomRepository
 from app.repositories.user_repository import IUserRepository
 from app.repositories.message_repository import IMessageRepository
 from app.schemas.room_user_schemas import RoomUserResponse
+from app.services.connection_manager import ConnectionManager, room_channel
+from app.services.presence_service import PresenceService, presence_fields
 from app.services.translation_service import TranslationService
 
 
@@ -22,32 +27,45 @@ class RoomService:
         message_repo: IMessageRepository,
         conversation_repo: IConversationRepository,
         translation_service: TranslationService,
+        connection_manager: ConnectionManager,
+        presence_service: PresenceService,
+        unit_of_work: UnitOfWork | None = None,
     ):
         self.room_repo = room_repo
         self.user_repo = user_repo
         self.message_repo = message_repo
         self.conversation_repo = conversation_repo
         self.translation_service = translation_service
+        self.connection_manager = connection_manager
+        self.presence_service = presence_service
+        self.unit_of_work = unit_of_work
 
-    def get_all_rooms(self) -> list[Room]:
+    async def get_all_rooms(self) -> list[Room]:
         """Get all active rooms."""
-        return self.room_repo.get_active_rooms()
+        return await self.room_repo.get_active_rooms()
 
-    def create_room(
+    async def create_room(
         self,
         name: str,
         description: str | None,
         max_users: int | None,
         is_translation_enabled: bool = False,
+        message_retention_count: int | None = None,
+        message_retention_days: int | None = None,
+        message_retention_mode: RetentionMode = RetentionMode.DELETE,
     ) -> Room:
         """
         Create new room with validation.
         :param name: Room name
         :param description: Room description
         :param max_users: Maximum users allowed
+        :param is_translation_enabled: Enable automatic translation
+        :param message_retention_count: Number of newest messages kept
+        :param message_retention_days: Maximum message age in days
+        :param message_retention_mode: Delete or archive expired messages
         :return: Created room
         """
-        if self.room_repo.name_exists(name):
+        if await self.room_repo.name_exists(name):
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail=f"Room name '{name}' already exists",
@@ -58,17 +76,23 @@ class RoomService:
             description=description,
             max_users=max_users,
             is_translation_enabled=is_translation_enabled,
+            message_retention_count=message_retention_count,
+            message_retention_days=message_retention_days,
+            message_retention_mode=message_retention_mode,
         )
 
-        return self.room_repo.create(new_room)
+        return await self.room_repo.create(new_room)
 
-    def update_room(
+    async def update_room(
         self,
         room_id: int,
         name: str,
         description: str | None,
         max_users: int | None,
         is_translation_enabled: bool = False,
+        message_retention_count: int | None = None,
+        message_retention_days: int | None = None,
+        message_retention_mode: RetentionMode = RetentionMode.DELETE,
     ) -> Room:
         """
         Update room with validation.
@@ -76,11 +100,15 @@ class RoomService:
         :param name: New room name
         :param description: New room description
         :param max_users: New max users
+        :param is_translation_enabled: Enable automatic translation
+        :param message_retention_count: Number of newest messages kept
+        :param message_retention_days: Maximum message age in days
+        :param message_retention_mode: Delete or archive expired messages
         :return: Updated room
         """
-        room = self._get_room_or_404(room_id)
+        room = await self._get_room_or_404(room_id)
 
-        if name != room.name and self.room_repo.name_exists(name, room_id):
+        if name != room.name and await self.room_repo.name_exists(name, room_id):
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail=f"Room name '{name}' already exists",
@@ -90,49 +118,41 @@ class RoomService:
         room.description = description
         room.max_users = max_users
         room.is_translation_enabled = is_translation_enabled
+        room.message_retention_count = message_retention_count
+        room.message_retention_days = message_retention_days
+        room.message_retention_mode = message_retention_mode
 
-        return self.room_repo.update(room)
+        return await self.room_repo.update(room)
 
-    def delete_room(self, room_id: int) -> dict:
+    async def delete_room(self, room_id: int) -> dict:
         """
         Soft delete room, kick out all users and deactivate conversations.
         :param room_id: Room ID to delete
         :return: Deleted room
         """
-        room = self._get_room_or_404(room_id)
-
-        users_in_room = self.room_repo.get_users_in_room(room_id)
-        kicked_users = []
-        for user in users_in_room:
-            user.current_room_id = None
-            user.status = UserStatus.AWAY
-            self.user_repo.update(user)
-            kicked_users.append(user.username)
-
-        conversations = self.conversation_repo.get_room_conversations(room_id)
-        deactivated_conversations = len(conversations)
-        for conversation in conversations:
-            conversation.is_active = False
-            self.conversation_repo.update(conversation)
+        room = await self._get_room_or_404(room_id)
 
-        self.room_repo.soft_delete(room_id)
-        room.is_active = False
+        users_kicked, conversations_archived = await self.room_repo.close_room(room_id)
+        await run_after_commit(
+            self.unit_of_work,
+            lambda: self.connection_manager.close_channel(room_channel(room_id)),
+        )
 
         return {
             "message": f"Room '{room.name}' has been closed",
             "room_id": room_id,
-            "users_kicked": len(kicked_users),
-            "conversations_archived": deactivated_conversations,
+            "users_kicked": users_kicked,
+            "conversations_archived": conversations_archived,
             "note": "Chat history remains accessible",
         }
 
-    def get_room_by_id(self, room_id: int) -> Room:
+    async def get_room_by_id(self, room_id: int) -> Room:
         """Get room by ID with validation."""
-        return self._get_room_or_404(room_id)
+        return await self._get_room_or_404(room_id)
 
-    def get_room_count(self) -> dict:
+    async def get_room_count(self) -> dict:
         """Get count of active rooms."""
-        active_rooms = self.room_repo.get_active_rooms()
+        active_rooms = await self.room_repo.get_active_rooms()
         room_count = len(active_rooms)
 
         return {
@@ -140,43 +160,63 @@ class RoomService:
             "message": f"Found {room_count} active rooms",
         }
 
-    def join_room(self, current_user: User, room_id: int) -> dict:
+    async def join_room(self, current_user: User, room_id: int) -> dict:
         """
         User joins room with validation.
         :param current_user: User joining room
         :param room_id: Room ID to join
         :return: Join confirmation
         """
-        room = self._get_room_or_404(room_id)
-
-        current_user_count = self.room_repo.get_user_count(room_id)
-        if room.max_users and current_user_count >= room.max_users:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Room '{room.name}' is full (max {room.max_users} users)",
-            )
+        previous_room_id = current_user.current_room_id
+        if previous_room_id == room_id:
+            room = await self._get_room_or_404(room_id)
+        else:
+            room = await self.room_repo.reserve_seat(room_id)
+            if room is None:
+                room = await self._get_room_or_404(room_id)
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail=f"Room '{room.name}' is full (max {room.max_users} users)",
+                )
+            if previous_room_id:
+                await self.room_repo.release_seat(previous_room_id)
 
         current_user.current_room_id = room_id
         current_user.status = UserStatus.AVAILABLE
-        self.user_repo.update(current_user)
-
-        final_user_count = self.room_repo.get_user_count(room_id)
+        current_user.last_active = datetime.now(timezone.utc)
+        await self.user_repo.update(current_user)
+
+        if previous_room_id and previous_room_id != room_id:
+            await run_after_commit(
+                self.unit_of_work,
+                lambda: self.connection_manager.unsubscribe_user(
+                    current_user.id, room_channel(previous_room_id)
+                ),
+            )
+        await run_after_commit(
+            self.unit_of_work,
+            lambda: self.connection_manager.publish_event(
+                room_channel(room_id),
+                "room.user_joined",
+                **presence_fields(current_user),
+            ),
+        )
 
         return {
             "message": f"Successfully joined room '{room.name}'",
             "room_id": room_id,
             "room_name": room.name,
-            "user_count": final_user_count,
+            "user_count": room.user_count,
         }
 
-    def leave_room(self, current_user: User, room_id: int) -> dict:
+    async def leave_room(self, current_user: User, room_id: int) -> dict:
         """
         User leaves room with validation.
         :param current_user: User leaving room
         :param room_id: Room ID to leave
         :return: Leave confirmation
         """
-        room = self._get_room_or_404(room_id)
+        room = await self._get_room_or_404(room_id)
 
         if current_user.current_room_id != room_id:
             raise HTTPException(
@@ -186,7 +226,23 @@ class RoomService:
 
         current_user.current_room_id = None
         current_user.status = UserStatus.AWAY
-        self.user_repo.update(current_user)
+        await self.user_repo.update(current_user)
+        await self.room_repo.release_seat(room_id)
+        await run_after_commit(
+            self.unit_of_work,
+            lambda: self.connection_manager.unsubscribe_user(
+                current_user.id, room_channel(room_id)
+            ),
+        )
+        await run_after_commit(
+            self.unit_of_work,
+            lambda: self.connection_manager.publish_event(
+                room_channel(room_id),
+                "room.user_left",
+                user_id=current_user.id,
+                username=current_user.username,
+            ),
+        )
 
         return {
             "message": f"Left room '{room.name}'",
@@ -194,23 +250,26 @@ class RoomService:
             "room_name": room.name,
         }
 
-    def get_room_users(self, room_id: int) -> dict:
+    async def get_room_users(self, room_id: int) -> dict:
         """
         Get users in room with validation.
         :param room_id: Room ID
         :return: Room users data
         """
-        room = self._get_room_or_404(room_id)
-        users = self.room_repo.get_users_in_room(room_id)
+        room = await self._get_room_or_404(room_id)
+        entries = await self.presence_service.get_room_users(
+            room_id, self.room_repo.get_users_in_room
+        )
 
         room_users = [
             RoomUserResponse(
-                id=user.id,
-                username=user.username,
-                status=user.status.value,
-                last_active=user.last_active,
+                id=entry.user_id,
+                username=entry.username,
+                avatar_url=entry.avatar_url,
+                status=entry.status.value,
+                last_active=entry.last_active,
             )
-            for user in users
+            for entry in entries
         ]
 
         return {
@@ -220,15 +279,16 @@ class RoomService:
             "users": room_users,
         }
 
-    def update_user_status(self, current_user: User, new_status: UserStatus) -> dict:
+    async def update_user_status(
+        self, current_user: User, new_status: UserStatus
+    ) -> dict:
         """
         Update user status.
         :param current_user: User to update
         :param new_status: New status
         :return: Status update confirmation
         """
-        current_user.status = new_status
-        self.user_repo.update(current_user)
+        await self.presence_service.change_status(current_user, new_status)
 
         return {
             "message": f"Status updated to '{new_status.value}'",
@@ -236,7 +296,22 @@ class RoomService:
             "user": current_user.username,
         }
 
-    def send_room_message(
+    async def heartbeat(self, current_user: User) -> dict:
+        """
+        Record that the user is still active.
+        :param current_user: Active user
+        :return: Heartbeat confirmation
+        """
+        await self.presence_service.heartbeat(
+            current_user.id, current_user.current_room_id
+        )
+
+        return {
+            "message": "Heartbeat received",
+            "room_id": current_user.current_room_id,
+        }
+
+    async def send_room_message(
         self, current_user: User, room_id: int, content: str
     ) -> Message:
         """
@@ -246,7 +321,7 @@ class RoomService:
         :param content: Message content
         :return: Created message
         """
-        room = self._get_room_or_404(room_id)
+        room = await self._get_room_or_404(room_id)
 
         if current_user.current_room_id != room_id:
             raise HTTPException(
@@ -254,13 +329,13 @@ class RoomService:
                 detail=f"User must be in room '{room.name}' to send messages",
             )
 
-        message = self.message_repo.create_room_message(
+        message = await self.message_repo.create_room_message(
             sender_id=current_user.id, room_id=room_id, content=content
         )
 
         # Translation logic
         if room.is_translation_enabled:
-            room_users = self.room_repo.get_users_in_room(room_id)
+            room_users = await self.room_repo.get_users_in_room(room_id)
 
             target_languages = list(
                 set(
@@ -281,35 +356,44 @@ class RoomService:
                     else None
                 )
 
-                self.translation_service.translate_and_store_message(
+                await self.translation_service.enqueue_message_translation(
                     message_id=message.id,
-                    content=content,
                     source_language=source_lang,
                     target_languages=target_languages,
                 )
 
-        # Old message cleanup
-        try:
-            if message.id % 10 == 0:
-                self.message_repo.cleanup_old_room_messages(room_id, MAX_ROOM_MESSAGES)
-        except Exception as e:
-            print(f"Cleanup failed, but message sent successfully: {e}")
-
         message.sender_username = current_user.username
+        await run_after_commit(
+            self.unit_of_work, lambda: self.connection_manager.publish_message(message)
+        )
         return message
 
-    def get_room_messages(
-        self, current_user: User, room_id: int, page: int = 1, page_size: int = 50
-    ) -> tuple[list[Message], int]:
+    async def get_room_messages(
+        self,
+        current_user: User,
+        room_id: int,
+        page_size: int = 50,
+        before: int | None = None,
+        after: int | None = None,
+        include_total: bool = False,
+    ) -> tuple[list[Message], bool, int | None]:
         """
-        Get room messages with validation and pagination.
+        Get room messages with validation and cursor pagination.
         :param current_user: User requesting messages
         :param room_id: Room ID
-        :param page: Page number
         :param page_size: Messages per page
-        :return: Tuple of (messages, total_count)
+        :param before: Return messages older than this message ID
+        :param after: Return messages newer than this message ID
+        :param include_total: Whether to count all room messages
+        :return: Tuple of (messages, has_more, total_count or None)
         """
-        self._get_room_or_404(room_id)
+        if before is not None and after is not None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Use either 'before' or 'after' cursor, not both",
+            )
+
+        await self._get_room_or_404(room_id)
 
         if current_user.current_room_id != room_id:
             raise HTTPException(
@@ -317,16 +401,51 @@ class RoomService:
                 detail="User must join the room before viewing messages",
             )
 
-        return self.message_repo.get_room_messages(
+        return await self.message_repo.get_room_messages(
             room_id=room_id,
-            page=page,
             page_size=page_size,
+            before=before,
+            after=after,
             user_language=current_user.preferred_language,
+            include_total=include_total,
         )
 
-    def _get_room_or_404(self, room_id: int) -> Room:
+    async def get_message_translation_status(
+        self, current_user: User, room_id: int, message_id: int
+    ) -> dict:
+        """
+        Get background translation status of a room message.
+        :param current_user: User requesting the status
+        :param room_id: Room ID
+        :param message_id: Message ID
+        :return: Translation status data
+        """
+        await self._get_room_or_404(room_id)
+
+        if current_user.current_room_id != room_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="User must join the room before viewing messages",
+            )
+
+        message = await self.message_repo.get_by_id(message_id)
+        if not message or message.room_id != room_id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Message with id {message_id} not found in room",
+            )
+
+        translation_status = await self.translation_service.get_translation_status(
+            message_id
+        )
+        return translation_status or {
+            "message_id": message_id,
+            "status": "not_required",
+        }
+
+    async def _get_room_or_404(self, room_id: int) -> Room:
         """Get room by ID or raise 404."""
-        room = self.room_repo.get_by_id(room_id)
+        room = await self.room_repo.get_by_id(room_id)
         if not room:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -3,6 +3,14 @@ from fastapi import Depends
 from app.services.conversation_service import ConversationService
 from app.services.room_service import RoomService
 from app.services.translation_service import TranslationService
+from app.services.translation_cache import TranslationCache, translation_memory_cache
+from app.services.translation_queue import translation_broker
+from app.services.connection_manager import connection_manager
+from app.services.presence_service import presence_service
+from app.services.websocket_service import WebSocketService
+from app.core.config import settings
+from app.core.database import get_unit_of_work
+from app.core.unit_of_work import UnitOfWork
 from app.repositories.conversation_repository import IConversationRepository
 from app.repositories.message_repository import IMessageRepository
 from app.repositories.message_translation_repository import (
@@ -10,30 +18,60 @@ from app.repositories.message_translation_repository import (
 )
 from app.repositories.user_repository import IUserRepository
 from app.repositories.room_repository import IRoomRepository
+from app.repositories.translation_job_repository import ITranslationJobRepository
+from app.repositories.translation_cache_repository import ITranslationCacheRepository
 from app.repositories.repository_dependencies import (
     get_conversation_repository,
     get_message_repository,
     get_message_translation_repository,
     get_user_repository,
     get_room_repository,
+    get_translation_job_repository,
+    get_translation_cache_repository,
 )
 
 
+def get_translation_cache(
+    cache_repo: ITranslationCacheRepository = Depends(get_translation_cache_repository),
+) -> TranslationCache:
+    """
+    Create TranslationCache instance over the shared memory tier.
+    :param cache_repo: TranslationCacheEntry repository instance
+    :return: TranslationCache instance
+    """
+    return TranslationCache(
+        cache_repo=cache_repo,
+        memory_cache=translation_memory_cache,
+        ttl=settings.translation_cache_ttl,
+    )
+
+
 def get_translation_service(
     message_repo: IMessageRepository = Depends(get_message_repository),
     translation_repo: IMessageTranslationRepository = Depends(
         get_message_translation_repository
     ),
+    job_repo: ITranslationJobRepository = Depends(get_translation_job_repository),
+    translation_cache: TranslationCache = Depends(get_translation_cache),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
 ) -> TranslationService:
     """
     Create TranslationService instance with repository dependencies.
     :param message_repo: Message repository instance
     :param translation_repo: MessageTranslation repository instance
+    :param job_repo: TranslationJob repository instance
+    :param translation_cache: TranslationCache instance
+    :param unit_of_work: Unit of work of the request
     :return: TranslationService instance
     """
     return TranslationService(
         message_repo=message_repo,
         translation_repo=translation_repo,
+        job_repo=job_repo,
+        broker=translation_broker,
+        connection_manager=connection_manager,
+        translation_cache=translation_cache,
+        unit_of_work=unit_of_work,
     )
 
 
@@ -42,6 +80,7 @@ def get_conversation_service(
     message_repo: IMessageRepository = Depends(get_message_repository),
     user_repo: IUserRepository = Depends(get_user_repository),
     translation_service: TranslationService = Depends(get_translation_service),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
 ) -> ConversationService:
     """
     Create ConversationService instance with repository dependencies.
@@ -49,6 +88,7 @@ def get_conversation_service(
     :param message_repo: Message repository instance
     :param user_repo: User repository instance
     :param translation_service: Translation service instance
+    :param unit_of_work: Unit of work of the request
     :return: ConversationService instance
     """
     return ConversationService(
@@ -56,6 +96,9 @@ def get_conversation_service(
         message_repo=message_repo,
         user_repo=user_repo,
         translation_service=translation_service,
+        connection_manager=connection_manager,
+        presence_service=presence_service,
+        unit_of_work=unit_of_work,
     )
 
 
@@ -65,6 +108,7 @@ def get_room_service(
     message_repo: IMessageRepository = Depends(get_message_repository),
     conversation_repo: IConversationRepository = Depends(get_conversation_repository),
     translation_service: TranslationService = Depends(get_translation_service),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
 ) -> RoomService:
     """
     Create RoomService instance with repository dependencies.
@@ -73,6 +117,7 @@ def get_room_service(
     :param message_repo: Message repository instance
     :param conversation_repo: Conversation repository instance
     :param translation_service: Translation service instance
+    :param unit_of_work: Unit of work of the request
     :return: RoomService instance
     """
     return RoomService(
@@ -81,4 +126,20 @@ def get_room_service(
         message_repo=message_repo,
         conversation_repo=conversation_repo,
         translation_service=translation_service,
+        connection_manager=connection_manager,
+        presence_service=presence_service,
+        unit_of_work=unit_of_work,
     )
+
+
+def get_websocket_service(
+    user_repo: IUserRepository = Depends(get_user_repository),
+    conversation_repo: IConversationRepository = Depends(get_conversation_repository),
+) -> WebSocketService:
+    """
+    Create WebSocketService instance with repository dependencies.
+    :param user_repo: User repository instance
+    :param conversation_repo: Conversation repository instance
+    :return: WebSocketService instance
+    """
+    return WebSocketService(user_repo=user_repo, conversation_repo=conversation_repo)
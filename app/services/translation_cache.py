@@ -0,0 +1,185 @@
+import hashlib
+import re
+import unicodedata
+from datetime import datetime, timedelta, timezone
+
+from app.core.config import settings
+from app.core.lru_cache import TTLLRUCache
+from app.repositories.translation_cache_repository import (
+    ITranslationCacheRepository,
+)
+
+
+AUTO_SOURCE_LANGUAGE = "AUTO"
+
+_WHITESPACE = re.compile(r"\s+")
+
+CacheKey = tuple[str, str, str]
+
+
+def normalize_content(content: str) -> str:
+    """
+    Normalize content so trivially different texts share one cache entry.
+    :param content: Original text
+    :return: NFC-normalized text with collapsed whitespace
+    """
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", content)).strip()
+
+
+def make_cache_key(
+    content: str, source_language: str | None, target_language: str
+) -> CacheKey:
+    """
+    Build content-addressed cache key.
+    :param content: Original text
+    :param source_language: Source language (auto-detect if None)
+    :param target_language: Target language code
+    :return: Tuple of (content hash, source language, target language)
+    """
+    content_hash = hashlib.sha256(
+        normalize_content(content).encode("utf-8")
+    ).hexdigest()
+    source = source_language.upper() if source_language else AUTO_SOURCE_LANGUAGE
+    return content_hash, source, target_language.upper()
+
+
+class LRUTranslationCache(TTLLRUCache):
+    """
+    In-process LRU tier of the translation memory. Shared by the
+    TranslationCache instances of all sessions, it also counts their
+    persistent tier lookups.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 86400.0):
+        super().__init__(max_entries=max_entries, ttl=ttl)
+        self.persistent_hits = 0
+        self.persistent_misses = 0
+
+
+class TranslationCache:
+    """
+    Two-tier translation memory: shared in-process LRU in front of the
+    persistent translation_cache table.
+    """
+
+    def __init__(
+        self,
+        cache_repo: ITranslationCacheRepository,
+        memory_cache: LRUTranslationCache,
+        ttl: float = 86400.0,
+    ):
+        self.cache_repo = cache_repo
+        self.memory_cache = memory_cache
+        self.ttl = ttl
+
+    async def get_many(self, keys: list[CacheKey]) -> dict[CacheKey, str]:
+        """
+        Look up translations, memory tier first, then one database query.
+        :param keys: Cache keys
+        :return: Dictionary mapping found keys to translated text
+        """
+        found: dict[CacheKey, str] = {}
+        missing: set[CacheKey] = set()
+
+        for key in dict.fromkeys(keys):
+            value = self.memory_cache.get(key)
+            if value is None:
+                missing.add(key)
+            else:
+                found[key] = value
+
+        if not missing:
+            return found
+
+        now = datetime.now(timezone.utc)
+        try:
+            entries = await self.cache_repo.get_valid_entries(
+                [content_hash for content_hash, _, _ in missing], now
+            )
+        except Exception as e:
+            print(f"Translation cache lookup failed: {e}")
+            return found
+
+        hit_ids = []
+        for entry in entries:
+            key = (entry.content_hash, entry.source_language, entry.target_language)
+            if key not in missing:
+                continue
+            found[key] = entry.translated_content
+            self.memory_cache.put(key, entry.translated_content)
+            hit_ids.append(entry.id)
+
+        self.memory_cache.persistent_hits += len(hit_ids)
+        self.memory_cache.persistent_misses += len(missing) - len(hit_ids)
+
+        if hit_ids:
+            try:
+                await self.cache_repo.record_hits(hit_ids, now)
+            except Exception as e:
+                print(f"Failed to record translation cache hits: {e}")
+
+        return found
+
+    async def put_many(self, translations: dict[CacheKey, str]) -> None:
+        """
+        Store fresh translations in both tiers.
+        :param translations: Dictionary mapping cache keys to translated text
+        """
+        if not translations:
+            return
+
+        for key, value in translations.items():
+            self.memory_cache.put(key, value)
+
+        now = datetime.now(timezone.utc)
+        expires_at = now + timedelta(seconds=self.ttl)
+        try:
+            await self.cache_repo.upsert_entries(
+                [
+                    {
+                        "content_hash": content_hash,
+                        "source_language": source_language,
+                        "target_language": target_language,
+                        "translated_content": value,
+                        "hit_count": 0,
+                        "last_used_at": now,
+                        "expires_at": expires_at,
+                    }
+                    for (
+                        content_hash,
+                        source_language,
+                        target_language,
+                    ), value in translations.items()
+                ]
+            )
+        except Exception as e:
+            print(f"Failed to store translation cache entries: {e}")
+
+    async def prune(self, max_rows: int) -> int:
+        """
+        Delete expired entries and trim persistent tier to max_rows.
+        :param max_rows: Maximum number of persistent entries to keep
+        :return: Number of deleted entries
+        """
+        deleted = await self.cache_repo.delete_expired(datetime.now(timezone.utc))
+        deleted += await self.cache_repo.evict_least_recently_used(max_rows)
+        return deleted
+
+    def stats(self) -> dict:
+        """
+        Get hit/miss counters of both tiers.
+        :return: Dictionary with memory and persistent tier counters
+        """
+        return {
+            "memory": self.memory_cache.stats(),
+            "persistent": {
+                "hits": self.memory_cache.persistent_hits,
+                "misses": self.memory_cache.persistent_misses,
+            },
+        }
+
+
+translation_memory_cache = LRUTranslationCache(
+    max_entries=settings.translation_cache_max_entries,
+    ttl=settings.translation_cache_ttl,
+)
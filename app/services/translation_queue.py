@@ -0,0 +1,89 @@
+import asyncio
+from abc import ABC, abstractmethod
+
+
+class ITranslationBroker(ABC):
+    """Abstract interface for brokers delivering translation job IDs to workers."""
+
+    @abstractmethod
+    async def connect(self) -> None:
+        """Open broker resources before workers start consuming."""
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release broker resources on shutdown."""
+        pass
+
+    @abstractmethod
+    async def publish(self, job_id: int) -> None:
+        """Hand a translation job to the workers."""
+        pass
+
+    @abstractmethod
+    async def consume(self) -> int:
+        """Wait for the next translation job ID."""
+        pass
+
+    async def consume_batch(self, max_items: int, window: float) -> list[int]:
+        """
+        Wait for one job ID, then gather more that arrive within the window.
+        :param max_items: Maximum number of job IDs to return
+        :param window: Seconds to wait for additional job IDs
+        :return: List of job IDs
+        """
+        job_ids = [await self.consume()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + window
+
+        while len(job_ids) < max_items:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                job_ids.append(await asyncio.wait_for(self.consume(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        return job_ids
+
+
+class InMemoryTranslationBroker(ITranslationBroker):
+    """
+    In-process broker backed by an asyncio queue.
+
+    Only reaches workers of the same process; unfinished jobs survive a
+    restart because the worker pool re-publishes them from the database.
+    """
+
+    def __init__(self):
+        self._queue: asyncio.Queue[int] | None = None
+
+    @property
+    def queue(self) -> asyncio.Queue[int]:
+        """
+        Lazily created job queue.
+        :return: Queue of translation job IDs
+        """
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        return self._queue
+
+    async def connect(self) -> None:
+        """Start with a fresh queue bound to the running event loop."""
+        self._queue = asyncio.Queue()
+
+    async def close(self) -> None:
+        """Drop queued job IDs, they are recovered from the database."""
+        self._queue = None
+
+    async def publish(self, job_id: int) -> None:
+        """Put job ID on the queue."""
+        self.queue.put_nowait(job_id)
+
+    async def consume(self) -> int:
+        """Wait for the next job ID on the queue."""
+        return await self.queue.get()
+
+
+translation_broker = InMemoryTranslationBroker()
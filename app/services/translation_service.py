@@ -1,11 +1,46 @@
-import deepl
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import TYPE_CHECKING
 
 from app.core.config import settings
+from app.core.unit_of_work import UnitOfWork, run_after_commit
+from app.models.message import Message
 from app.models.message_translation import MessageTranslation
+from app.models.translation_job import TranslationJob, TranslationJobStatus
 from app.repositories.message_repository import IMessageRepository
 from app.repositories.message_translation_repository import (
     IMessageTranslationRepository,
 )
+from app.repositories.translation_job_repository import ITranslationJobRepository
+from app.services.connection_manager import ConnectionManager
+from app.services.translation_cache import (
+    CacheKey,
+    TranslationCache,
+    make_cache_key,
+)
+from app.services.translation_queue import ITranslationBroker
+
+if TYPE_CHECKING:
+    import deepl
+
+
+DEEPL_MAX_TEXTS_PER_REQUEST = 50
+
+deepl_executor = ThreadPoolExecutor(
+    max_workers=settings.translation_max_concurrency, thread_name_prefix="deepl"
+)
+
+
+def compute_retry_delay(attempts: int) -> float:
+    """
+    Exponential backoff delay for the next translation attempt.
+    :param attempts: Number of attempts already made
+    :return: Delay in seconds
+    """
+    delay = settings.translation_retry_base_delay * (2 ** max(attempts - 1, 0))
+    return min(delay, settings.translation_retry_max_delay)
 
 
 class TranslationService:
@@ -15,15 +50,26 @@ class TranslationService:
         self,
         message_repo: IMessageRepository,
         translation_repo: IMessageTranslationRepository,
+        job_repo: ITranslationJobRepository,
+        broker: ITranslationBroker,
+        connection_manager: ConnectionManager | None = None,
+        translation_cache: TranslationCache | None = None,
+        unit_of_work: UnitOfWork | None = None,
     ):
         self.message_repo = message_repo
         self.translation_repo = translation_repo
-        self._deepl_client: deepl.DeepLClient | None = None
+        self.job_repo = job_repo
+        self.broker = broker
+        self.connection_manager = connection_manager
+        self.translation_cache = translation_cache
+        self.unit_of_work = unit_of_work
+        self._deepl_client: "deepl.DeepLClient | None" = None
 
     @property
-    def deepl_client(self) -> deepl.DeepLClient | None:
+    def deepl_client(self) -> "deepl.DeepLClient | None":
         """
-        Lazy-loaded DeepL client with error handling.
+        Lazy-loaded DeepL client with error handling. The deepl package is
+        imported on first use, keeping it out of worker startup.
         :return: DeepL client or None if initialization fails
         """
         if self._deepl_client is None:
@@ -32,6 +78,8 @@ class TranslationService:
                     print("DEEPL_API_KEY not configured - translations disabled")
                     return None
 
+                import deepl
+
                 self._deepl_client = deepl.DeepLClient(settings.deepl_api_key)
                 self._deepl_client.set_app_info("the-gathering", "1.0.0")
                 print("DeepL client initialized successfully")
@@ -42,61 +90,170 @@ class TranslationService:
 
         return self._deepl_client
 
-    def translate_message_content(
+    async def _translate_texts(
+        self, texts: list[str], source_language: str | None, target_language: str
+    ) -> list[str | None]:
+        """
+        Translate several texts to one language with a single DeepL request.
+        Runs on the bounded DeepL executor so the event loop is never blocked.
+        :param texts: Texts to translate (at most DEEPL_MAX_TEXTS_PER_REQUEST)
+        :param source_language: Source language (auto-detect if None)
+        :param target_language: Target language code
+        :return: Translated texts in input order, None for empty results
+        """
+        deepl_target = "EN-US" if target_language.upper() == "EN" else target_language
+
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(
+            deepl_executor,
+            partial(
+                self.deepl_client.translate_text,
+                texts,
+                source_lang=source_language,
+                target_lang=deepl_target,
+            ),
+        )
+
+        if not isinstance(results, list):
+            results = [results]
+
+        return [
+            result.text if result.text and result.text.strip() else None
+            for result in results
+        ]
+
+    async def translate_message_content(
         self,
         content: str,
         source_language: str | None = None,
         target_languages: list[str] | None = None,
     ) -> dict[str, str]:
         """
-        Translate message content to multiple target languages.
+        Translate message content to multiple target languages concurrently.
         :param content: Original message content
         :param source_language: Source language (auto-detect if None)
         :param target_languages: List of target language codes
         :return: Dictionary mapping language codes to translated content
         """
-        if not self.deepl_client:
-            print("DeepL client not available - skipping translation")
-            return {}
+        translations, _ = await self.translate_messages_batch(
+            [(0, content, source_language, target_languages or [])]
+        )
+        return translations.get(0, {})
 
-        if not target_languages:
+    async def translate_messages_batch(
+        self, items: list[tuple[int, str, str | None, list[str]]]
+    ) -> tuple[dict[int, dict[str, str]], dict[int, str]]:
+        """
+        Translate several messages, coalescing texts per language pair.
+        Translations found in the translation memory cost no API call; every
+        remaining (source, target) pair becomes one DeepL request carrying its
+        distinct texts, and all requests are sent concurrently.
+        :param items: Tuples of (key, content, source_language, target_languages)
+        :return: Tuple of (translations by key and language, errors by key)
+        """
+        pairs: list[tuple[int, str, str | None, str]] = []
+        for key, content, source_language, target_languages in items:
+            source = source_language.upper() if source_language else None
+            for target_language in target_languages:
+                if target_language.upper() == source:
+                    continue
+                pairs.append((key, content, source_language, target_language))
+
+        if not pairs:
             print("No target languages specified - skipping translation")
-            return {}
+            return {}, {}
 
-        if source_language and source_language.upper() in target_languages:
-            target_languages.remove(source_language.upper())
+        translations: dict[int, dict[str, str]] = {}
+        errors: dict[int, str] = {}
 
-        translations = {}
+        cache_keys = {
+            (key, target_language): make_cache_key(
+                content, source_language, target_language
+            )
+            for key, content, source_language, target_language in pairs
+        }
+        cached = (
+            await self.translation_cache.get_many(list(cache_keys.values()))
+            if self.translation_cache
+            else {}
+        )
 
-        for target_lang in target_languages:
-            try:
-                print(f"Translating to {target_lang}")
-                deepl_target = "EN-US" if target_lang.upper() == "EN" else target_lang
+        groups: dict[tuple[str | None, str], dict[str, list[int]]] = {}
+        for key, content, source_language, target_language in pairs:
+            cached_text = cached.get(cache_keys[(key, target_language)])
+            if cached_text is not None:
+                translations.setdefault(key, {})[target_language] = cached_text
+                continue
+            groups.setdefault((source_language, target_language), {}).setdefault(
+                content, []
+            ).append(key)
 
-                result = self.deepl_client.translate_text(
-                    content, source_lang=source_language, target_lang=deepl_target
-                )
+        cache_hits = len(pairs) - sum(
+            len(keys) for entries in groups.values() for keys in entries.values()
+        )
+        if not groups:
+            print(f"Translation summary: {cache_hits}/{len(pairs)} from cache")
+            return translations, errors
 
-                if not result.text or not result.text.strip():
-                    print(f"DeepL returned empty translation for {target_lang}")
-                    continue
+        if not self.deepl_client:
+            print("DeepL client not available - skipping translation")
+            return translations, errors
+
+        # Already loaded by the client, bound here for the error handler
+        import deepl
 
-                translations[target_lang] = result.text
-                print(f"Successfully translated to {target_lang}")
+        fresh: dict[CacheKey, str] = {}
 
+        async def translate_chunk(
+            source_language: str | None,
+            target_language: str,
+            chunk: list[tuple[str, list[int]]],
+        ) -> None:
+            try:
+                texts = await self._translate_texts(
+                    [content for content, _ in chunk], source_language, target_language
+                )
             except deepl.DeepLException as e:
-                print(f"DeepL API error for {target_lang}: {e}")
-                continue
+                print(f"DeepL API error for {target_language}: {e}")
+                errors.update({key: str(e) for _, keys in chunk for key in keys})
+                return
             except Exception as e:
-                print(f"Unexpected error translating to {target_lang}: {e}")
-                continue
+                print(f"Unexpected error translating to {target_language}: {e}")
+                errors.update({key: str(e) for _, keys in chunk for key in keys})
+                return
+
+            for (_, keys), text in zip(chunk, texts):
+                if text is None:
+                    print(f"DeepL returned empty translation for {target_language}")
+                    continue
+                for key in keys:
+                    translations.setdefault(key, {})[target_language] = text
+                fresh[cache_keys[(keys[0], target_language)]] = text
+
+        await asyncio.gather(
+            *(
+                translate_chunk(
+                    source_language,
+                    target_language,
+                    chunk[i : i + DEEPL_MAX_TEXTS_PER_REQUEST],
+                )
+                for (source_language, target_language), entries in groups.items()
+                for chunk in [list(entries.items())]
+                for i in range(0, len(chunk), DEEPL_MAX_TEXTS_PER_REQUEST)
+            )
+        )
 
+        if self.translation_cache:
+            await self.translation_cache.put_many(fresh)
+
+        completed = sum(len(languages) for languages in translations.values())
         print(
-            f"Translation summary: {len(translations)}/{len(target_languages)} successful"
+            f"Translation summary: {completed}/{len(pairs)} successful "
+            f"({cache_hits} from cache) in {len(groups)} language batches"
         )
-        return translations
+        return translations, errors
 
-    def create_message_translations(
+    async def create_message_translations(
         self, message_id: int, translations: dict[str, str]
     ) -> list[MessageTranslation]:
         """
@@ -125,7 +282,7 @@ class TranslationService:
                 continue
 
         if translation_objects:
-            created_translations = self.translation_repo.bulk_create_translations(
+            created_translations = await self.translation_repo.bulk_create_translations(
                 translation_objects
             )
 
@@ -138,7 +295,7 @@ class TranslationService:
 
         return []
 
-    def translate_and_store_message(
+    async def translate_and_store_message(
         self,
         message_id: int,
         content: str,
@@ -154,7 +311,7 @@ class TranslationService:
         :return: Number of successful translations created
         """
         try:
-            translations = self.translate_message_content(
+            translations = await self.translate_message_content(
                 content=content,
                 source_language=source_language,
                 target_languages=target_languages,
@@ -164,7 +321,7 @@ class TranslationService:
                 print(f"No translations created for message {message_id}")
                 return 0
 
-            translation_objects = self.create_message_translations(
+            translation_objects = await self.create_message_translations(
                 message_id=message_id, translations=translations
             )
 
@@ -177,7 +334,213 @@ class TranslationService:
             print(f"Translation workflow failed for message {message_id}: {e}")
             return 0
 
-    def get_message_translation(
+    async def enqueue_message_translation(
+        self,
+        message_id: int,
+        source_language: str | None = None,
+        target_languages: list[str] | None = None,
+    ) -> TranslationJob | None:
+        """
+        Persist a translation job and hand it to the background workers.
+        :param message_id: ID of the message to translate
+        :param source_language: Source language code (auto-detect if None)
+        :param target_languages: Target language codes
+        :return: Created job or None if nothing to translate
+        """
+        if not target_languages:
+            return None
+
+        job = await self.job_repo.create_job(
+            message_id=message_id,
+            source_language=source_language,
+            target_languages=target_languages,
+        )
+        await run_after_commit(self.unit_of_work, lambda: self.broker.publish(job.id))
+        return job
+
+    async def process_translation_jobs(
+        self, job_ids: list[int]
+    ) -> list[TranslationJob]:
+        """
+        Run one attempt of several translation jobs as a single batch.
+        Languages without a stored translation are retried with backoff
+        until translation_max_attempts is reached.
+        :param job_ids: IDs of the translation jobs
+        :return: Updated jobs (jobs that are finished, not due or claimed
+            by another worker are skipped)
+        """
+        stale_before = datetime.now(timezone.utc) - timedelta(
+            seconds=settings.translation_job_claim_timeout
+        )
+        jobs = await self.job_repo.claim_jobs(job_ids, stale_before)
+        if not jobs:
+            return []
+
+        messages = {
+            message.id: message
+            for message in await self.message_repo.get_by_ids(
+                [job.message_id for job in jobs]
+            )
+        }
+
+        active_jobs = []
+        for job in jobs:
+            if job.message_id not in messages:
+                job.status = TranslationJobStatus.FAILED
+                job.last_error = "Message no longer exists"
+                continue
+            active_jobs.append(job)
+        await self.job_repo.bulk_update(jobs)
+        # Make the claim durable before the slow DeepL round-trips
+        if self.unit_of_work is not None:
+            await self.unit_of_work.commit()
+
+        missing = await self._get_missing_languages(active_jobs)
+        translations, errors = await self.translate_messages_batch(
+            [
+                (
+                    job.message_id,
+                    messages[job.message_id].content,
+                    job.source_language,
+                    missing[job.id],
+                )
+                for job in active_jobs
+                if missing[job.id]
+            ]
+        )
+
+        translation_objects = [
+            MessageTranslation(
+                message_id=message_id,
+                target_language=target_language,
+                content=translated_content,
+            )
+            for message_id, languages in translations.items()
+            for target_language, translated_content in languages.items()
+        ]
+        if translation_objects:
+            stored = await self.translation_repo.bulk_create_translations(
+                translation_objects
+            )
+            stored_languages = {
+                (translation.message_id, translation.target_language)
+                for translation in stored
+            }
+            await run_after_commit(
+                self.unit_of_work,
+                lambda: self._publish_stored_translations(stored, messages),
+            )
+            if not stored:
+                errors.update(
+                    {
+                        job.message_id: "Failed to store translations"
+                        for job in active_jobs
+                    }
+                )
+        else:
+            stored_languages = set()
+
+        for job in active_jobs:
+            remaining = [
+                language
+                for language in missing[job.id]
+                if (job.message_id, language) not in stored_languages
+            ]
+            error = errors.get(job.message_id)
+
+            if not remaining:
+                job.status = TranslationJobStatus.COMPLETED
+                job.last_error = None
+            elif job.attempts >= settings.translation_max_attempts:
+                job.status = TranslationJobStatus.FAILED
+                job.last_error = error or (
+                    f"Untranslated after {job.attempts} attempts: "
+                    f"{', '.join(remaining)}"
+                )
+            else:
+                job.status = TranslationJobStatus.PENDING
+                job.last_error = error or f"Untranslated: {', '.join(remaining)}"
+                job.next_attempt_at = datetime.now(timezone.utc) + timedelta(
+                    seconds=compute_retry_delay(job.attempts)
+                )
+
+        return await self.job_repo.bulk_update(jobs)
+
+    async def _publish_stored_translations(
+        self,
+        translations: list[MessageTranslation],
+        messages: dict[int, Message],
+    ) -> None:
+        """
+        Push freshly stored translations to connected WebSocket clients.
+        :param translations: Stored translations
+        :param messages: Translated messages by ID
+        """
+        if not self.connection_manager:
+            return
+
+        by_message: dict[int, dict[str, str]] = {}
+        for translation in translations:
+            by_message.setdefault(translation.message_id, {})[
+                translation.target_language
+            ] = translation.content
+
+        for message_id, languages in by_message.items():
+            await self.connection_manager.publish_translations(
+                messages[message_id], languages
+            )
+
+    async def get_translation_status(self, message_id: int) -> dict | None:
+        """
+        Get background translation status for a message.
+        :param message_id: ID of the message
+        :return: Status data or None if no job exists
+        """
+        job = await self.job_repo.get_by_message_id(message_id)
+        if not job:
+            return None
+
+        translations = await self.translation_repo.get_by_message_id(message_id)
+
+        return {
+            "message_id": message_id,
+            "status": job.status.value,
+            "attempts": job.attempts,
+            "target_languages": job.requested_languages,
+            "completed_languages": [
+                translation.target_language for translation in translations
+            ],
+            "last_error": job.last_error,
+            "next_attempt_at": job.next_attempt_at,
+        }
+
+    async def _get_missing_languages(
+        self, jobs: list[TranslationJob]
+    ) -> dict[int, list[str]]:
+        """
+        Get requested languages that have no stored translation yet.
+        :param jobs: Translation jobs
+        :return: Dictionary mapping job IDs to language codes still to translate
+        """
+        translations = await self.translation_repo.get_by_message_ids(
+            [job.message_id for job in jobs]
+        )
+        done = {
+            (translation.message_id, translation.target_language)
+            for translation in translations
+        }
+
+        missing = {}
+        for job in jobs:
+            source = job.source_language.upper() if job.source_language else None
+            missing[job.id] = [
+                language
+                for language in job.requested_languages
+                if (job.message_id, language) not in done and language != source
+            ]
+        return missing
+
+    async def get_message_translation(
         self, message_id: int, target_language: str
     ) -> str | None:
         """
@@ -186,29 +549,29 @@ class TranslationService:
         :param target_language: Target language code
         :return: Translated content or None if not found
         """
-        translation = self.translation_repo.get_by_message_and_language(
+        translation = await self.translation_repo.get_by_message_and_language(
             message_id=message_id, target_language=target_language.upper()
         )
 
         return translation.content if translation else None
 
-    def get_all_message_translations(self, message_id: int) -> dict[str, str]:
+    async def get_all_message_translations(self, message_id: int) -> dict[str, str]:
         """
         Get all translations for a message.
         :param message_id: ID of the original message
         :return: Dictionary mapping language codes to translated content
         """
-        translations = self.translation_repo.get_by_message_id(message_id)
+        translations = await self.translation_repo.get_by_message_id(message_id)
 
         return {
             translation.target_language: translation.content
             for translation in translations
         }
 
-    def delete_message_translations(self, message_id: int) -> int:
+    async def delete_message_translations(self, message_id: int) -> int:
         """
         Delete all translations for a message.
         :param message_id: ID of the message
         :return: Number of translations deleted
         """
-        return self.translation_repo.delete_by_message_id(message_id)
+        return await self.translation_repo.delete_by_message_id(message_id)
@@ -0,0 +1,259 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.unit_of_work import UnitOfWork, transaction
+from app.models.translation_job import TranslationJob, TranslationJobStatus
+from app.repositories.message_repository import MessageRepository
+from app.repositories.message_translation_repository import (
+    MessageTranslationRepository,
+)
+from app.repositories.translation_job_repository import TranslationJobRepository
+from app.repositories.translation_cache_repository import (
+    TranslationCacheRepository,
+)
+from app.services.connection_manager import connection_manager
+from app.services.translation_cache import TranslationCache, translation_memory_cache
+from app.services.translation_queue import ITranslationBroker, translation_broker
+from app.services.translation_service import TranslationService
+
+
+class TranslationWorkerPool:
+    """
+    Pool of asyncio workers processing translation jobs off the request path.
+
+    Each worker drains up to batch_size job IDs that arrive within
+    batch_window seconds and translates them together, so a burst of short
+    chat messages costs one DeepL request per target language.
+    """
+
+    def __init__(
+        self,
+        broker: ITranslationBroker,
+        session_factory: async_sessionmaker[AsyncSession],
+        worker_count: int = 2,
+        batch_size: int = 20,
+        batch_window: float = 0.05,
+        recovery_interval: float = 600.0,
+    ):
+        self.broker = broker
+        self.session_factory = session_factory
+        self.worker_count = worker_count
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.recovery_interval = recovery_interval
+        self._workers: list[asyncio.Task] = []
+        self._retry_tasks: set[asyncio.Task] = set()
+        self._maintenance_tasks: list[asyncio.Task] = []
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Check if workers are running.
+        :return: True if started, else False
+        """
+        return bool(self._workers)
+
+    def _build_translation_service(self, db: AsyncSession) -> TranslationService:
+        """
+        Create TranslationService bound to a worker-owned session.
+        :param db: Database session of the current job
+        :return: TranslationService instance
+        """
+        return TranslationService(
+            message_repo=MessageRepository(db),
+            translation_repo=MessageTranslationRepository(db),
+            job_repo=TranslationJobRepository(db),
+            broker=self.broker,
+            connection_manager=connection_manager,
+            translation_cache=self._build_translation_cache(db),
+            unit_of_work=UnitOfWork.of(db),
+        )
+
+    def _build_translation_cache(self, db: AsyncSession) -> TranslationCache:
+        """
+        Create TranslationCache bound to a worker-owned session.
+        :param db: Database session of the current job
+        :return: TranslationCache instance
+        """
+        return TranslationCache(
+            cache_repo=TranslationCacheRepository(db),
+            memory_cache=translation_memory_cache,
+            ttl=settings.translation_cache_ttl,
+        )
+
+    async def start(self) -> None:
+        """Connect broker, recover unfinished jobs and spawn workers."""
+        if self.is_running:
+            return
+
+        await self.broker.connect()
+        await self.recover_unfinished_jobs()
+
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"translation-worker-{i}")
+            for i in range(self.worker_count)
+        ]
+        self._maintenance_tasks = [
+            asyncio.create_task(
+                self._prune_translation_cache_periodically(),
+                name="translation-cache-pruner",
+            ),
+            asyncio.create_task(
+                self._recover_jobs_periodically(), name="translation-job-recovery"
+            ),
+        ]
+        print(f"Started {self.worker_count} translation workers")
+
+    async def stop(self) -> None:
+        """Cancel workers and pending retries, then close broker."""
+        tasks = self._workers + list(self._retry_tasks) + self._maintenance_tasks
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        self._workers = []
+        self._retry_tasks.clear()
+        self._maintenance_tasks = []
+        await self.broker.close()
+
+    async def recover_unfinished_jobs(self, all_pending: bool = True) -> int:
+        """
+        Re-publish pending jobs, at their next attempt, and jobs whose worker
+        stopped processing them. Jobs a live worker holds are left alone;
+        the claim of run_jobs makes jobs recovered by several workers run
+        once.
+        :param all_pending: Whether to recover every pending job (on start),
+            else only those overdue by the claim timeout
+        :return: Number of recovered jobs
+        """
+        now = datetime.now(timezone.utc)
+        stale_before = now - timedelta(seconds=settings.translation_job_claim_timeout)
+        try:
+            async with self.session_factory() as db:
+                jobs = await TranslationJobRepository(db).get_recoverable_jobs(
+                    stale_before, all_pending=all_pending
+                )
+        except Exception as e:
+            print(f"Could not recover translation jobs: {e}")
+            return 0
+
+        for job in jobs:
+            delay = self._retry_delay(job, now)
+            if delay > 0:
+                self._schedule_retry(job.id, delay)
+            else:
+                await self.broker.publish(job.id)
+
+        if jobs:
+            print(f"Recovered {len(jobs)} unfinished translation jobs")
+        return len(jobs)
+
+    async def prune_translation_cache(self) -> int:
+        """
+        Drop expired and least recently used translation cache entries.
+        :return: Number of deleted entries
+        """
+        async with self.session_factory() as db, transaction(db):
+            deleted = await self._build_translation_cache(db).prune(
+                settings.translation_cache_max_rows
+            )
+
+        if deleted:
+            print(f"Pruned {deleted} translation cache entries")
+        return deleted
+
+    async def _prune_translation_cache_periodically(self) -> None:
+        """Prune translation cache every prune interval until cancelled."""
+        while True:
+            await asyncio.sleep(settings.translation_cache_prune_interval)
+            try:
+                await self.prune_translation_cache()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Translation cache pruning failed: {e}")
+
+    async def _recover_jobs_periodically(self) -> None:
+        """
+        Recover jobs left behind by crashed workers or lost publishes every
+        recovery interval until cancelled.
+        """
+        while True:
+            await asyncio.sleep(self.recovery_interval)
+            try:
+                await self.recover_unfinished_jobs(all_pending=False)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Translation job recovery failed: {e}")
+
+    async def run_jobs(self, job_ids: list[int]) -> None:
+        """
+        Process one attempt of a batch of jobs and schedule retries.
+        :param job_ids: IDs of the translation jobs
+        """
+        async with self.session_factory() as db, transaction(db):
+            translation_service = self._build_translation_service(db)
+            jobs = await translation_service.process_translation_jobs(job_ids)
+
+        now = datetime.now(timezone.utc)
+        for job in jobs:
+            if job.status == TranslationJobStatus.PENDING:
+                self._schedule_retry(job.id, self._retry_delay(job, now))
+
+    @staticmethod
+    def _retry_delay(job: TranslationJob, now: datetime) -> float:
+        """
+        Get seconds until the next attempt of a pending job is due.
+        :param job: Translation job
+        :param now: Current time
+        :return: Delay in seconds, 0 if due
+        """
+        if not job.next_attempt_at:
+            return 0.0
+        next_attempt_at = job.next_attempt_at
+        if next_attempt_at.tzinfo is None:
+            next_attempt_at = next_attempt_at.replace(tzinfo=timezone.utc)
+        return max((next_attempt_at - now).total_seconds(), 0.0)
+
+    def _schedule_retry(self, job_id: int, delay: float) -> None:
+        """
+        Re-publish job after backoff delay.
+        :param job_id: ID of the translation job
+        :param delay: Delay in seconds
+        """
+        task = asyncio.create_task(self._publish_later(job_id, delay))
+        self._retry_tasks.add(task)
+        task.add_done_callback(self._retry_tasks.discard)
+
+    async def _publish_later(self, job_id: int, delay: float) -> None:
+        """Sleep for backoff delay and publish job again."""
+        await asyncio.sleep(delay)
+        await self.broker.publish(job_id)
+
+    async def _worker(self) -> None:
+        """Consume batches of job IDs until cancelled."""
+        while True:
+            job_ids = await self.broker.consume_batch(
+                self.batch_size, self.batch_window
+            )
+            try:
+                await self.run_jobs(list(dict.fromkeys(job_ids)))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Translation jobs {job_ids} crashed: {e}")
+
+
+translation_worker_pool = TranslationWorkerPool(
+    broker=translation_broker,
+    session_factory=AsyncSessionLocal,
+    worker_count=settings.translation_worker_count,
+    batch_size=settings.translation_batch_size,
+    batch_window=settings.translation_batch_window,
+    recovery_interval=settings.translation_job_claim_timeout,
+)
@@ -0,0 +1,177 @@
+import asyncio
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.unit_of_work import transaction
+from app.models.user import UserStatus
+from app.repositories.user_repository import (
+    ACTIVITY_UPDATE_CHUNK_SIZE,
+    UserRepository,
+)
+
+
+class UserActivityBuffer:
+    """
+    Write-behind buffer of user status and last_active updates.
+
+    Updates are coalesced per user in memory, so any number of heartbeats or
+    status changes of a user between two flushes costs one row, and written
+    by primary key in executemany chunks of chunk_size users every
+    flush_interval seconds, earlier once max_pending users are buffered, and
+    on shutdown. A crash loses at most flush_interval seconds of updates.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        flush_interval: float = 5.0,
+        max_pending: int = 10000,
+        chunk_size: int = ACTIVITY_UPDATE_CHUNK_SIZE,
+    ):
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.chunk_size = chunk_size
+        self._last_active: dict[int, datetime] = {}
+        self._statuses: dict[int, UserStatus] = {}
+        self._full = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+        self.updates_recorded = 0
+        self.flushes = 0
+        self.rows_written = 0
+        self.failures = 0
+
+    @property
+    def pending_count(self) -> int:
+        """
+        Number of users with buffered updates.
+        :return: User count
+        """
+        return len(self._last_active.keys() | self._statuses.keys())
+
+    async def start(self) -> None:
+        """Spawn periodic flush task."""
+        if self._task is None and self.flush_interval > 0:
+            self._task = asyncio.create_task(
+                self._flush_periodically(), name="user-activity-flusher"
+            )
+
+    async def stop(self) -> None:
+        """Cancel periodic flush task and write what is left."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            print(f"Final user activity flush failed: {e}")
+
+    def record(
+        self,
+        user_id: int,
+        last_active: datetime | None = None,
+        status: UserStatus | None = None,
+    ) -> None:
+        """
+        Buffer new values of a user, replacing older unflushed ones.
+        :param user_id: User ID
+        :param last_active: Time of the latest activity
+        :param status: New status
+        """
+        if last_active is not None:
+            self._last_active[user_id] = last_active
+        if status is not None:
+            self._statuses[user_id] = status
+        self.updates_recorded += 1
+
+        if self.pending_count >= self.max_pending:
+            self._full.set()
+
+    def discard_status(self, user_id: int) -> None:
+        """
+        Drop buffered status of a user whose status was written directly
+        (e.g. joining or leaving a room), so the flush does not revert it.
+        :param user_id: User ID
+        """
+        self._statuses.pop(user_id, None)
+
+    def get_pending(self, user_id: int) -> tuple[datetime | None, UserStatus | None]:
+        """
+        Get unflushed values of a user.
+        :param user_id: User ID
+        :return: Tuple of (last_active, status), None where nothing is buffered
+        """
+        return self._last_active.get(user_id), self._statuses.get(user_id)
+
+    async def flush(self) -> int:
+        """
+        Write buffered values in one transaction.
+        :return: Number of updated users
+        """
+        last_active, self._last_active = self._last_active, {}
+        statuses, self._statuses = self._statuses, {}
+        self._full.clear()
+        if not last_active and not statuses:
+            return 0
+
+        try:
+            async with self.session_factory() as db, transaction(db):
+                updated = await UserRepository(db).update_activity(
+                    last_active, statuses, self.chunk_size
+                )
+        except Exception:
+            self.failures += 1
+            # Keep values for the next flush unless newer ones arrived
+            self._last_active = last_active | self._last_active
+            self._statuses = statuses | self._statuses
+            raise
+
+        self.flushes += 1
+        self.rows_written += updated
+        return updated
+
+    def clear(self) -> None:
+        """Drop buffered values without writing them."""
+        self._last_active.clear()
+        self._statuses.clear()
+        self._full.clear()
+
+    async def _flush_periodically(self) -> None:
+        """Flush every flush_interval seconds or when full, until cancelled."""
+        while True:
+            try:
+                await asyncio.wait_for(self._full.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"User activity flush failed: {e}")
+
+    def stats(self) -> dict:
+        """
+        Get buffer size and totals since process start.
+        :return: Dictionary of counters
+        """
+        return {
+            "running": self._task is not None,
+            "pending_users": self.pending_count,
+            "updates_recorded": self.updates_recorded,
+            "flushes": self.flushes,
+            "rows_written": self.rows_written,
+            "failures": self.failures,
+        }
+
+
+user_activity_buffer = UserActivityBuffer(
+    session_factory=AsyncSessionLocal,
+    flush_interval=settings.user_activity_flush_interval,
+    max_pending=settings.user_activity_max_pending,
+)
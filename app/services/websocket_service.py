@@ -0,0 +1,80 @@
+import jwt
+from fastapi import HTTPException, status
+
+from app.core.jwt_utils import get_user_from_token
+from app.models.user import User
+from app.repositories.conversation_repository import IConversationRepository
+from app.repositories.user_repository import IUserRepository
+from app.services.connection_manager import conversation_channel, room_channel
+
+
+class WebSocketService:
+    """Service for authenticating WebSocket clients and their subscriptions."""
+
+    def __init__(
+        self,
+        user_repo: IUserRepository,
+        conversation_repo: IConversationRepository,
+    ):
+        self.user_repo = user_repo
+        self.conversation_repo = conversation_repo
+
+    async def authenticate(self, token: str | None) -> User:
+        """
+        Resolve user from the same JWT used for HTTP requests.
+        :param token: JWT token string
+        :return: Authenticated active user
+        """
+        if not token:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Authentication required",
+            )
+
+        try:
+            username = get_user_from_token(token)
+        except jwt.PyJWTError:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid credentials",
+            )
+
+        user = await self.user_repo.get_authenticated_user(username)
+        if not user or not user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=f"User '{username}' not found",
+            )
+
+        return user
+
+    async def authorize_subscription(
+        self, user_id: int, channel_type: str, target_id: int
+    ) -> tuple[str, User]:
+        """
+        Check that user may receive events of a room or conversation.
+        :param user_id: ID of the subscribing user
+        :param channel_type: 'room' or 'conversation'
+        :param target_id: Room or conversation ID
+        :return: Tuple of (channel name, current user state)
+        """
+        user = await self.user_repo.get_by_id(user_id)
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
+            )
+
+        if channel_type == "room":
+            if user.current_room_id != target_id:
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="User must join the room before subscribing",
+                )
+            return room_channel(target_id), user
+
+        if not await self.conversation_repo.is_participant(target_id, user_id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="User is not a participant in this conversation",
+            )
+        return conversation_channel(target_id), user
@@ -1,14 +1,26 @@
 from contextlib import asynccontextmanager
+import time
 from fastapi import FastAPI
-import os
 import uvicorn
 
+from app.core.auth_utils import password_hash_executor
 from app.core.config import settings
-from app.core.database import create_tables, drop_tables
+from app.core.database import engine, read_router
+from app.core.identity_cache import identity_cache
+from app.core.migrations import check_schema, migrate
+from app.core.startup import get_startup_profile
 from app.api.v1.endpoints.conversation_router import router as conversation_router
 from app.api.v1.endpoints.room_router import router as rooms_router
 from app.api.v1.endpoints.auth_router import router as auth_router
-from testing_setup import setup_complete_test_environment
+from app.api.v1.endpoints.admin_router import router as admin_router
+from app.api.v1.endpoints.websocket_router import router as websocket_router
+from app.services.avatar_service import avatar_style_catalog
+from app.services.connection_manager import connection_manager
+from app.services.message_retention import message_retention_sweeper
+from app.services.presence_service import presence_service
+from app.services.room_occupancy import room_occupancy_reconciler
+from app.services.user_activity_buffer import user_activity_buffer
+from app.services.translation_worker import translation_worker_pool
 
 
 @asynccontextmanager
@@ -16,18 +28,41 @@ async def lifespan(app: FastAPI):
     """
     Lifespan event handler for startup and shutdown.
     """
-    print("Starting...")
-
-    if os.getenv("RESET_DB") == "true":
-        print("RESET_DB=true - Resetting database...")
-        drop_tables()
-        print("Database reset complete")
-
-    create_tables()
-    setup_complete_test_environment()
-    print("Database tables created")
+    profile = get_startup_profile(settings.environment)
+    print(f"Starting ({profile.name} profile)...")
+    started_at = time.perf_counter()
+
+    # Outside dev and test, schema changes belong to `python migrate.py`
+    if profile.migrate:
+        await migrate(engine)
+    else:
+        await check_schema(engine)
+    if profile.seed:
+        from testing_setup import setup_complete_test_environment
+
+        await setup_complete_test_environment()
+    read_router.attach(connection_manager.backplane)
+    identity_cache.attach(connection_manager.backplane)
+    await connection_manager.start()
+    await translation_worker_pool.start()
+    await avatar_style_catalog.start()
+    await message_retention_sweeper.start()
+    if profile.reconcile_occupancy:
+        await room_occupancy_reconciler.reconcile()
+    await room_occupancy_reconciler.start()
+    await user_activity_buffer.start()
+    await presence_service.start()
+    print(f"Started in {(time.perf_counter() - started_at) * 1000:.0f} ms")
     yield
     print("Shutting down...")
+    await presence_service.stop()
+    await user_activity_buffer.stop()
+    await room_occupancy_reconciler.stop()
+    await message_retention_sweeper.stop()
+    await avatar_style_catalog.stop()
+    await translation_worker_pool.stop()
+    await connection_manager.stop()
+    password_hash_executor.shutdown()
 
 
 app = FastAPI(
@@ -40,6 +75,8 @@ app = FastAPI(
 app.include_router(rooms_router, prefix="/api/v1")
 app.include_router(auth_router, prefix="/api/v1")
 app.include_router(conversation_router, prefix="/api/v1")
+app.include_router(admin_router, prefix="/api/v1")
+app.include_router(websocket_router, prefix="/api/v1")
 
 
 @app.get("/")
@@ -52,6 +89,7 @@ def root():
         "endpoints": {
             "rooms": "/api/v1/rooms",
             "room_health": "/api/v1/rooms/health/check",
+            "websocket": "/api/v1/ws",
         },
     }
 
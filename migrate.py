@@ -0,0 +1,46 @@
+import argparse
+import asyncio
+
+from app.core.database import drop_tables, engine
+from app.core.migrations import get_pending_versions, migrate
+
+# Register every table for --reset
+import app.models  # noqa: F401
+import app.models.message_translation  # noqa: F401
+
+
+async def run(reset: bool = False, check: bool = False) -> int:
+    """
+    Bring the database schema up to date, once per deployment.
+    :param reset: Drop all tables first
+    :param check: Only report pending migrations
+    :return: Exit code
+    """
+    try:
+        if check:
+            pending = await get_pending_versions(engine)
+            print(f"Pending migrations: {pending or 'none'}")
+            return 1 if pending else 0
+
+        if reset:
+            print("Resetting database...")
+            await drop_tables()
+        applied = await migrate(engine)
+        print(f"Database schema up to date ({len(applied)} migrations applied)")
+        return 0
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Apply database migrations")
+    parser.add_argument(
+        "--reset", action="store_true", help="drop all tables before migrating"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit with status 1 if migrations are pending, without applying them",
+    )
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(run(reset=args.reset, check=args.check)))
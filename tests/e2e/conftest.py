@@ -1,67 +1,65 @@
 import os
+import tempfile
 import pytest
 from datetime import datetime
 
 if not os.getenv("CI"):
     os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+os.environ["ENVIRONMENT"] = "test"
 
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool
 
 from main import app
-from app.core.database import get_db, Base
+from app.core.database import get_db, get_async_database_url, Base
+from app.core.identity_cache import identity_cache
+from app.services.presence_service import presence_service
+from app.services.user_activity_buffer import user_activity_buffer
+from app.core.unit_of_work import transaction
 from app.models.user import User
 from app.models.room import Room
 from app.core.auth_utils import hash_password
-from app.repositories.repository_dependencies import (
-    get_user_repository,
-    get_room_repository,
-    get_conversation_repository,
-    get_message_repository,
-    get_message_translation_repository,
-)
-from app.repositories.user_repository import UserRepository
-from app.repositories.room_repository import RoomRepository
-from app.repositories.conversation_repository import ConversationRepository
-from app.repositories.message_repository import MessageRepository
-from app.repositories.message_translation_repository import MessageTranslationRepository
-
-from app.services.service_dependencies import (
-    get_room_service,
-    get_conversation_service,
-    get_translation_service,
-)
-from app.services.room_service import RoomService
-from app.services.conversation_service import ConversationService
-from app.services.translation_service import TranslationService
 
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///:memory:")
-print(f"Test Database URL: {DATABASE_URL}")
 
 if "sqlite" in DATABASE_URL:
-    engine = create_engine(
-        DATABASE_URL, connect_args={"check_same_thread": False}, poolclass=StaticPool
+    # Fixtures use a sync engine while the app uses an async engine, so both
+    # must point at the same on-disk database instead of separate :memory: ones.
+    DATABASE_URL = (
+        f"sqlite:///{os.path.join(tempfile.gettempdir(), 'thegathering_e2e.db')}"
     )
+print(f"Test Database URL: {DATABASE_URL}")
+
+if "sqlite" in DATABASE_URL:
+    engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
     print("Using SQLite engine configuration")
 else:
     engine = create_engine(DATABASE_URL, pool_pre_ping=True, pool_recycle=3600)
     print("Using PostgreSQL engine configuration")
 
+async_engine = create_async_engine(
+    get_async_database_url(DATABASE_URL), poolclass=NullPool
+)
+
 
 @event.listens_for(engine, "connect")
+@event.listens_for(async_engine.sync_engine, "connect")
 def set_sqlite_pragma(dbapi_connection, connection_record):
     """Activate Foreign Key Constraints for SQLite connections."""
     if "sqlite" in DATABASE_URL:
         cursor = dbapi_connection.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
         cursor.close()
-        print("SQLite Foreign Key Constraints aktiviert")
 
 
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
 
 
 @pytest.fixture(scope="function")
@@ -74,75 +72,20 @@ def db_session():
     finally:
         db.close()
         Base.metadata.drop_all(bind=engine)
+        identity_cache.clear()
+        presence_service.clear()
+        user_activity_buffer.clear()
 
 
 @pytest.fixture(scope="function")
 def client(db_session):
     """Create test client for E2E tests."""
 
-    def override_get_db():
-        try:
-            yield db_session
-        finally:
-            pass
-
-    def override_user_repository():
-        return UserRepository(db_session)
-
-    def override_room_repository():
-        return RoomRepository(db_session)
-
-    def override_conversation_repository():
-        return ConversationRepository(db_session)
-
-    def override_message_repository():
-        return MessageRepository(db_session)
-
-    def override_message_translation_repository():
-        return MessageTranslationRepository(db_session)
-
-    def override_translation_service():
-        return TranslationService(
-            message_repo=MessageRepository(db_session),
-            translation_repo=MessageTranslationRepository(db_session),
-        )
-
-    def override_room_service():
-        return RoomService(
-            room_repo=RoomRepository(db_session),
-            user_repo=UserRepository(db_session),
-            message_repo=MessageRepository(db_session),
-            conversation_repo=ConversationRepository(db_session),
-            translation_service=TranslationService(
-                message_repo=MessageRepository(db_session),
-                translation_repo=MessageTranslationRepository(db_session),
-            ),
-        )
-
-    def override_conversation_service():
-        return ConversationService(
-            conversation_repo=ConversationRepository(db_session),
-            message_repo=MessageRepository(db_session),
-            user_repo=UserRepository(db_session),
-            translation_service=TranslationService(
-                message_repo=MessageRepository(db_session),
-                translation_repo=MessageTranslationRepository(db_session),
-            ),
-        )
+    async def override_get_db():
+        async with TestingAsyncSessionLocal() as session, transaction(session):
+            yield session
 
     app.dependency_overrides[get_db] = override_get_db
-    app.dependency_overrides[get_user_repository] = override_user_repository
-    app.dependency_overrides[get_room_repository] = override_room_repository
-    app.dependency_overrides[get_conversation_repository] = (
-        override_conversation_repository
-    )
-    app.dependency_overrides[get_message_repository] = override_message_repository
-    app.dependency_overrides[get_message_translation_repository] = (
-        override_message_translation_repository
-    )
-    app.dependency_overrides[get_translation_service] = override_translation_service
-    app.dependency_overrides[get_room_service] = override_room_service
-    app.dependency_overrides[get_conversation_service] = override_conversation_service
 
     with TestClient(app) as test_client:
         yield test_client
@@ -2,7 +2,23 @@ import os
 
 os.environ["DATABASE_URL"] = "sqlite:///:memory:"
 
+import asyncio
+from datetime import datetime, timedelta, timezone
+
 import pytest
+from sqlalchemy import event
+from starlette.websockets import WebSocketDisconnect
+
+from app.models.conversation import Conversation
+from app.models.conversation_participant import ConversationParticipant
+from app.models.message import Message
+from app.models.message_archive import ArchivedMessage, RetentionMode
+from app.models.message_translation import MessageTranslation
+from app.models.user import User, UserStatus
+from app.services.message_retention import MessageRetentionSweeper
+from app.services.room_occupancy import RoomOccupancyReconciler
+from app.services.user_activity_buffer import user_activity_buffer
+from tests.e2e.conftest import TestingAsyncSessionLocal, async_engine
 
 
 @pytest.mark.e2e
@@ -148,6 +164,556 @@ class TestCriticalUserJourneys:
         )
         assert room_users_after.status_code == 404
 
+    def test_room_capacity_workflow(
+        self,
+        client,
+        authenticated_admin_headers,
+        authenticated_user_headers,
+    ):
+        """Test joins take seats up to max_users and leaving frees them."""
+        room_response = client.post(
+            "/api/v1/rooms/",
+            json={"name": "Small Room", "max_users": 1},
+            headers=authenticated_admin_headers,
+        )
+        room_id = room_response.json()["id"]
+
+        admin_join = client.post(
+            f"/api/v1/rooms/{room_id}/join", headers=authenticated_admin_headers
+        )
+        assert admin_join.status_code == 200
+        assert admin_join.json()["user_count"] == 1
+
+        rejoin = client.post(
+            f"/api/v1/rooms/{room_id}/join", headers=authenticated_admin_headers
+        )
+        assert rejoin.status_code == 200
+        assert rejoin.json()["user_count"] == 1
+
+        full = client.post(
+            f"/api/v1/rooms/{room_id}/join", headers=authenticated_user_headers
+        )
+        assert full.status_code == 409
+
+        client.post(
+            f"/api/v1/rooms/{room_id}/leave", headers=authenticated_admin_headers
+        )
+        user_join = client.post(
+            f"/api/v1/rooms/{room_id}/join", headers=authenticated_user_headers
+        )
+        assert user_join.status_code == 200
+        assert user_join.json()["user_count"] == 1
+
+    def test_room_list_occupancy_and_reconciliation(
+        self,
+        client,
+        db_session,
+        created_room,
+        created_admin,
+        authenticated_user_headers,
+    ):
+        """Test room list shows live occupancy and reconciliation repairs drift."""
+
+        def listed_count():
+            rooms = client.get("/api/v1/rooms/", headers=authenticated_user_headers)
+            return {room["id"]: room["user_count"] for room in rooms.json()}[
+                created_room.id
+            ]
+
+        client.post(
+            f"/api/v1/rooms/{created_room.id}/join", headers=authenticated_user_headers
+        )
+        assert listed_count() == 1
+
+        # Move a user in behind the counter's back
+        created_admin.current_room_id = created_room.id
+        db_session.commit()
+        assert listed_count() == 1
+
+        reconciler = RoomOccupancyReconciler(TestingAsyncSessionLocal)
+        assert asyncio.run(reconciler.reconcile()) == 1
+        assert listed_count() == 2
+        assert asyncio.run(reconciler.reconcile()) == 0
+
+        client.post(
+            f"/api/v1/rooms/{created_room.id}/leave",
+            headers=authenticated_user_headers,
+        )
+        assert listed_count() == 1
+
+    def test_message_history_translation_query_count(
+        self,
+        client,
+        db_session,
+        created_user,
+        created_room,
+        authenticated_user_headers,
+    ):
+        """Test history pages load translations without per-message queries."""
+        created_user.preferred_language = "de"
+        created_user.current_room_id = created_room.id
+        db_session.commit()
+
+        for i in range(20):
+            message = Message(
+                sender_id=created_user.id,
+                room_id=created_room.id,
+                content=f"Hello {i}",
+            )
+            db_session.add(message)
+            db_session.flush()
+            if i % 2 == 0:
+                db_session.add(
+                    MessageTranslation(
+                        message_id=message.id,
+                        target_language="DE",
+                        content=f"Hallo {i}",
+                    )
+                )
+        db_session.commit()
+
+        # Authenticate once, so the counts exclude the identity cache miss
+        me = client.get("/api/v1/auth/me", headers=authenticated_user_headers)
+        assert me.json()["preferred_language"] == "de"
+
+        statements = []
+
+        def count_statement(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        def fetch_page(page_size):
+            statements.clear()
+            event.listen(
+                async_engine.sync_engine, "before_cursor_execute", count_statement
+            )
+            try:
+                response = client.get(
+                    f"/api/v1/rooms/{created_room.id}/messages",
+                    params={"page_size": page_size},
+                    headers=authenticated_user_headers,
+                )
+            finally:
+                event.remove(
+                    async_engine.sync_engine, "before_cursor_execute", count_statement
+                )
+            assert response.status_code == 200
+            return response.json(), len(statements)
+
+        small_page, small_page_queries = fetch_page(5)
+        full_page, full_page_queries = fetch_page(20)
+
+        assert len(small_page) == 5
+        assert len(full_page) == 20
+        # Room lookup, then messages joined with the reader's translations
+        assert small_page_queries == full_page_queries == 2
+
+        contents = {message["content"] for message in full_page}
+        assert "Hallo 0" in contents
+        assert "Hello 1" in contents
+
+        db_session.expire_all()
+        originals = db_session.query(Message.content).all()
+        assert all(content.startswith("Hello") for (content,) in originals)
+
+    def test_conversation_list_query_count_and_unread(
+        self,
+        client,
+        db_session,
+        created_user,
+        created_admin,
+        created_room,
+        authenticated_user_headers,
+    ):
+        """Test conversation list costs the same queries for any number of chats."""
+
+        def add_conversations(count):
+            for i in range(count):
+                conversation = Conversation(room_id=created_room.id)
+                db_session.add(conversation)
+                db_session.flush()
+                db_session.add_all(
+                    ConversationParticipant(
+                        conversation_id=conversation.id, user_id=user.id
+                    )
+                    for user in (created_user, created_admin)
+                )
+                db_session.add_all(
+                    Message(
+                        sender_id=created_admin.id,
+                        conversation_id=conversation.id,
+                        content=f"Ping {i}.{n}",
+                    )
+                    for n in range(2)
+                )
+            db_session.commit()
+
+        # Authenticate once, so the counts exclude the identity cache miss
+        client.get("/api/v1/auth/me", headers=authenticated_user_headers)
+
+        statements = []
+
+        def count_statement(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        def list_conversations():
+            statements.clear()
+            event.listen(
+                async_engine.sync_engine, "before_cursor_execute", count_statement
+            )
+            try:
+                response = client.get(
+                    "/api/v1/conversations/", headers=authenticated_user_headers
+                )
+            finally:
+                event.remove(
+                    async_engine.sync_engine, "before_cursor_execute", count_statement
+                )
+            assert response.status_code == 200
+            return response.json(), len(statements)
+
+        add_conversations(1)
+        few, few_queries = list_conversations()
+        add_conversations(5)
+        many, many_queries = list_conversations()
+
+        assert len(few) == 1
+        assert len(many) == 6
+        # One query returns participants, last message and unread count
+        assert few_queries == many_queries == 1
+
+        newest = many[0]
+        assert newest["participants"] == [created_admin.username]
+        assert newest["participant_count"] == 2
+        assert newest["unread_count"] == 2
+        assert newest["last_message"]["content"] == "Ping 4.1"
+        assert newest["last_message"]["sender_username"] == created_admin.username
+
+        client.get(
+            f"/api/v1/conversations/{newest['id']}/messages",
+            headers=authenticated_user_headers,
+        )
+        after_reading, _ = list_conversations()
+        assert after_reading[0]["unread_count"] == 0
+        assert after_reading[1]["unread_count"] == 2
+
+    def test_request_commits_once(
+        self, client, created_room, authenticated_user_headers
+    ):
+        """Test a write request is one transaction, however many repositories it uses."""
+        commits = []
+
+        def count_commit(conn):
+            commits.append(conn)
+
+        def post(url, **kwargs):
+            commits.clear()
+            event.listen(async_engine.sync_engine, "commit", count_commit)
+            try:
+                response = client.post(
+                    url, headers=authenticated_user_headers, **kwargs
+                )
+            finally:
+                event.remove(async_engine.sync_engine, "commit", count_commit)
+            return response, len(commits)
+
+        join, join_commits = post(f"/api/v1/rooms/{created_room.id}/join")
+        assert join.status_code == 200
+        assert join_commits == 1
+
+        message, message_commits = post(
+            f"/api/v1/rooms/{created_room.id}/messages",
+            json={"content": "One transaction"},
+        )
+        assert message.status_code == 200
+        assert message.json()["sent_at"] is not None
+        assert message_commits == 1
+
+    def test_message_history_cursor_pagination(
+        self,
+        client,
+        db_session,
+        created_user,
+        created_room,
+        authenticated_user_headers,
+    ):
+        """Test before/after cursors walk history without gaps or repeats."""
+        created_user.current_room_id = created_room.id
+        db_session.add_all(
+            Message(
+                sender_id=created_user.id,
+                room_id=created_room.id,
+                content=f"Message {i}",
+            )
+            for i in range(7)
+        )
+        db_session.commit()
+        url = f"/api/v1/rooms/{created_room.id}/messages"
+
+        first_page = client.get(
+            url,
+            params={"page_size": 3, "include_total": True},
+            headers=authenticated_user_headers,
+        )
+        assert first_page.status_code == 200
+        assert first_page.headers["X-Total-Count"] == "7"
+        assert first_page.headers["X-Has-More"] == "true"
+
+        seen = [message["content"] for message in first_page.json()]
+        cursor = first_page.headers["X-Before-Cursor"]
+        while True:
+            page = client.get(
+                url,
+                params={"page_size": 3, "before": cursor},
+                headers=authenticated_user_headers,
+            )
+            assert "X-Total-Count" not in page.headers
+            seen.extend(message["content"] for message in page.json())
+            if page.headers["X-Has-More"] == "false":
+                break
+            cursor = page.headers["X-Before-Cursor"]
+
+        assert seen == [f"Message {i}" for i in reversed(range(7))]
+
+        newer = client.get(
+            url,
+            params={"page_size": 2, "after": cursor},
+            headers=authenticated_user_headers,
+        )
+        assert [message["content"] for message in newer.json()] == [
+            "Message 3",
+            "Message 2",
+        ]
+        assert newer.headers["X-Has-More"] == "true"
+
+        conflicting = client.get(
+            url,
+            params={"before": cursor, "after": cursor},
+            headers=authenticated_user_headers,
+        )
+        assert conflicting.status_code == 400
+
+    def test_retention_sweep_trims_rooms_to_their_policy(
+        self, client, db_session, created_user, created_room
+    ):
+        """Test sweeper deletes the oldest messages and their translations."""
+        created_room.message_retention_count = 3
+        messages = [
+            Message(
+                sender_id=created_user.id,
+                room_id=created_room.id,
+                content=f"Message {i}",
+            )
+            for i in range(5)
+        ]
+        db_session.add_all(messages)
+        db_session.flush()
+        db_session.add(
+            MessageTranslation(
+                message_id=messages[0].id, target_language="DE", content="Nachricht 0"
+            )
+        )
+        db_session.commit()
+
+        sweeper = MessageRetentionSweeper(TestingAsyncSessionLocal)
+        assert asyncio.run(sweeper.sweep()) == 2
+        assert asyncio.run(sweeper.sweep()) == 0
+
+        db_session.expire_all()
+        remaining = db_session.query(Message.content).order_by(Message.id).all()
+        assert [content for (content,) in remaining] == [
+            "Message 2",
+            "Message 3",
+            "Message 4",
+        ]
+        assert db_session.query(MessageTranslation).count() == 0
+
+    def test_retention_sweep_checks_only_changed_owners(
+        self, client, db_session, created_user, created_room
+    ):
+        """Test sweeps after a complete one skip owners without new messages."""
+        conversations = [Conversation(room_id=created_room.id) for _ in range(2)]
+        db_session.add_all(conversations)
+        db_session.flush()
+        db_session.add_all(
+            Message(
+                sender_id=created_user.id,
+                conversation_id=conversation.id,
+                content=f"Private {i}",
+            )
+            for conversation in conversations
+            for i in range(3)
+        )
+        db_session.commit()
+
+        sweeper = MessageRetentionSweeper(
+            TestingAsyncSessionLocal, conversation_keep_count=2
+        )
+        assert asyncio.run(sweeper.sweep()) == 2
+        assert sweeper.stats()["targets_total"] == 2
+
+        db_session.add_all(
+            Message(
+                sender_id=created_user.id,
+                conversation_id=conversations[0].id,
+                content=f"Private {i}",
+            )
+            for i in range(3, 5)
+        )
+        db_session.commit()
+        sweeper.conversation_keep_count = 1
+
+        assert asyncio.run(sweeper.sweep()) == 3
+        assert sweeper.stats()["targets_total"] == 1
+        assert (
+            db_session.query(Message)
+            .filter(Message.conversation_id == conversations[1].id)
+            .count()
+            == 2
+        )
+
+    def test_retention_sweep_archives_by_age_and_trims_conversations(
+        self, client, db_session, created_user, created_room
+    ):
+        """Test archive policies and conversation limits in bounded batches."""
+        created_room.message_retention_days = 7
+        created_room.message_retention_mode = RetentionMode.ARCHIVE
+        conversation = Conversation(room_id=created_room.id)
+        db_session.add(conversation)
+        db_session.flush()
+        now = datetime.now(timezone.utc)
+        db_session.add_all(
+            Message(
+                sender_id=created_user.id,
+                room_id=created_room.id,
+                content=f"Room {age} days",
+                sent_at=now - timedelta(days=age),
+            )
+            for age in (30, 10, 1)
+        )
+        db_session.add_all(
+            Message(
+                sender_id=created_user.id,
+                conversation_id=conversation.id,
+                content=f"Private {i}",
+            )
+            for i in range(5)
+        )
+        db_session.commit()
+
+        sweeper = MessageRetentionSweeper(
+            TestingAsyncSessionLocal, batch_size=2, conversation_keep_count=2
+        )
+        assert asyncio.run(sweeper.sweep()) == 5
+
+        stats = sweeper.stats()
+        assert stats["messages_archived"] == 2
+        assert stats["messages_deleted"] == 3
+        assert stats["targets_done"] == stats["targets_total"] == 2
+        assert stats["batches"] == 4
+
+        archived = db_session.query(ArchivedMessage.content).order_by(
+            ArchivedMessage.sent_at
+        )
+        assert [content for (content,) in archived] == [
+            "Room 30 days",
+            "Room 10 days",
+        ]
+        remaining = db_session.query(Message.content).order_by(Message.id).all()
+        assert [content for (content,) in remaining] == [
+            "Room 1 days",
+            "Private 3",
+            "Private 4",
+        ]
+
+    def test_websocket_pushes_room_messages(
+        self,
+        client,
+        db_session,
+        created_user,
+        created_admin,
+        created_room,
+        authenticated_user_headers,
+        authenticated_admin_headers,
+    ):
+        """Test subscribed members receive messages without polling."""
+        created_user.current_room_id = created_room.id
+        created_admin.current_room_id = created_room.id
+        db_session.commit()
+        token = authenticated_admin_headers["Authorization"].split()[1]
+
+        with pytest.raises(WebSocketDisconnect):
+            with client.websocket_connect("/api/v1/ws?token=invalid") as websocket:
+                websocket.receive_json()
+
+        with client.websocket_connect(f"/api/v1/ws?token={token}") as websocket:
+            websocket.send_json(
+                {"action": "subscribe", "channel": "conversation", "id": 999}
+            )
+            assert websocket.receive_json()["type"] == "error"
+
+            websocket.send_json(
+                {"action": "subscribe", "channel": "room", "id": created_room.id}
+            )
+            assert websocket.receive_json() == {
+                "type": "subscribed",
+                "channel": f"room:{created_room.id}",
+            }
+
+            response = client.post(
+                f"/api/v1/rooms/{created_room.id}/messages",
+                json={"content": "Pushed!"},
+                headers=authenticated_user_headers,
+            )
+            assert response.status_code == 200
+
+            event = websocket.receive_json()
+            assert event["type"] == "message.created"
+            assert event["message"]["id"] == response.json()["id"]
+            assert event["message"]["content"] == "Pushed!"
+            assert event["message"]["sender_username"] == created_user.username
+
+    def test_profile_update_invalidates_identity_cache(
+        self, client, authenticated_user_headers
+    ):
+        """Test cached identity never serves stale data after PATCH /auth/me."""
+        first_response = client.get(
+            "/api/v1/auth/me", headers=authenticated_user_headers
+        )
+        assert first_response.status_code == 200
+
+        update_response = client.patch(
+            "/api/v1/auth/me",
+            json={"preferred_language": "fr"},
+            headers=authenticated_user_headers,
+        )
+        assert update_response.status_code == 200
+
+        me_response = client.get("/api/v1/auth/me", headers=authenticated_user_headers)
+        assert me_response.status_code == 200
+        assert me_response.json()["preferred_language"] == "fr"
+
+    def test_status_change_is_written_by_the_flush(
+        self, client, db_session, created_user, authenticated_user_headers, monkeypatch
+    ):
+        """Test a chosen status is coalesced in the buffer until the next flush."""
+        monkeypatch.setattr(
+            user_activity_buffer, "session_factory", TestingAsyncSessionLocal
+        )
+        for status in ("away", "busy"):
+            response = client.patch(
+                "/api/v1/rooms/users/status",
+                json={"status": status},
+                headers=authenticated_user_headers,
+            )
+            assert response.status_code == 200
+
+        db_session.expire_all()
+        assert db_session.get(User, created_user.id).status != UserStatus.BUSY
+
+        assert asyncio.run(user_activity_buffer.flush()) == 1
+        db_session.expire_all()
+        assert db_session.get(User, created_user.id).status == UserStatus.BUSY
+
     def test_authentication_security(self, client, sample_user_data):
         """Test authentication and authorization security."""
         # Unauthorized access
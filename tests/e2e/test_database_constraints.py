@@ -286,16 +286,26 @@ class TestDatabaseConstraints:
         expected_indexes = [
             "ix_users_email",
             "ix_users_username",
+            "ix_users_current_room_id",
             "idx_conversation_user_unique",
-            "idx_user_participation_history",
-            "idx_conversation_messages",
-            "idx_room_messages",
+            "idx_active_participations",
+            "idx_active_room_conversations",
+            "idx_room_members",
+            "idx_conversation_message_history",
+            "idx_room_message_history",
             "idx_user_messages",
         ]
 
         for expected_index in expected_indexes:
             assert expected_index in index_names, f"Missing index: {expected_index}"
 
+        # Covered by the prefix of idx_message_language_unique
+        assert "idx_message_translations" not in index_names
+        # Unused; membership lookups by user go through idx_active_participations
+        assert "idx_user_participation_history" not in index_names
+        # Would only duplicate the primary key of rooms
+        assert "idx_active_rooms" not in index_names
+
 
 if __name__ == "__main__":
     print(
@@ -0,0 +1,98 @@
+import os
+
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+
+import asyncio
+
+import pytest
+from sqlalchemy import event
+
+from app.repositories.conversation_repository import ConversationRepository
+from app.repositories.message_repository import MessageRepository
+from app.repositories.room_repository import RoomRepository
+from tests.e2e.conftest import DATABASE_URL, TestingAsyncSessionLocal, async_engine
+
+
+def capture_statements(repository_class, method_name, *args, **kwargs):
+    """
+    Run a repository method and record the SQL it executes.
+    :return: List of (statement, parameters) tuples
+    """
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    async def run():
+        async with TestingAsyncSessionLocal() as session:
+            await getattr(repository_class(session), method_name)(*args, **kwargs)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record_statement)
+    try:
+        asyncio.run(run())
+    finally:
+        event.remove(
+            async_engine.sync_engine, "before_cursor_execute", record_statement
+        )
+    return statements
+
+
+@pytest.mark.e2e
+@pytest.mark.skipif("sqlite" not in DATABASE_URL, reason="SQLite query plans")
+class TestQueryPlans:
+    """Hot repository queries must be served by their indexes."""
+
+    def query_plan(self, db_session, repository_class, method_name, *args, **kwargs):
+        """Get EXPLAIN QUERY PLAN details of the first query of a method."""
+        statement, parameters = capture_statements(
+            repository_class, method_name, *args, **kwargs
+        )[0]
+        rows = (
+            db_session.connection()
+            .exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            .fetchall()
+        )
+        return " | ".join(row[-1] for row in rows)
+
+    @pytest.mark.parametrize(
+        "repository_class, method_name, args, index_name",
+        [
+            (RoomRepository, "get_users_in_room", (1,), "idx_room_members"),
+            (
+                ConversationRepository,
+                "get_room_conversations",
+                (1,),
+                "idx_active_room_conversations",
+            ),
+            (
+                ConversationRepository,
+                "get_user_conversations",
+                (1,),
+                "idx_active_participations",
+            ),
+            (MessageRepository, "get_room_messages", (1,), "idx_room_message_history"),
+            (
+                MessageRepository,
+                "get_conversation_messages",
+                (1,),
+                "idx_conversation_message_history",
+            ),
+        ],
+    )
+    def test_hot_query_uses_index(
+        self, db_session, repository_class, method_name, args, index_name
+    ):
+        """Test query is an index search without a full table scan or sort."""
+        plan = self.query_plan(db_session, repository_class, method_name, *args)
+
+        assert f"USING INDEX {index_name}" in plan, plan
+        assert "USE TEMP B-TREE" not in plan, plan
+
+    def test_room_history_page_uses_index(self, db_session):
+        """Test keyset pages before a cursor stay on the history index."""
+        plan = self.query_plan(
+            db_session, MessageRepository, "get_room_messages", 1, before=100
+        )
+
+        assert "USING INDEX idx_room_message_history" in plan, plan
+        assert "USE TEMP B-TREE" not in plan, plan
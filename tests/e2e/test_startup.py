@@ -0,0 +1,44 @@
+import os
+
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+
+import asyncio
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from app.core.config import settings
+from app.core.migrations import migrate
+from tests.e2e.conftest import async_engine
+
+# Prod workers must be serving well before a rolling restart times out
+STARTUP_BUDGET_SECONDS = 1.0
+
+
+@pytest.mark.e2e
+class TestStartup:
+    """Worker startup cost of the prod profile."""
+
+    def test_prod_startup_within_budget(self, db_session, monkeypatch):
+        """Test a prod worker starts without seeding or migrating."""
+        asyncio.run(migrate(async_engine))
+        monkeypatch.setattr(main, "engine", async_engine)
+        monkeypatch.setattr(settings, "environment", "prod")
+
+        started_at = time.perf_counter()
+        with TestClient(main.app) as client:
+            elapsed = time.perf_counter() - started_at
+            assert client.get("/health").status_code == 200
+
+        assert elapsed < STARTUP_BUDGET_SECONDS
+
+    def test_prod_startup_refuses_outdated_schema(self, db_session, monkeypatch):
+        """Test a prod worker does not start before `python migrate.py`."""
+        monkeypatch.setattr(main, "engine", async_engine)
+        monkeypatch.setattr(settings, "environment", "prod")
+
+        with pytest.raises(RuntimeError, match="pending migrations"):
+            with TestClient(main.app):
+                pass
@@ -1,10 +1,13 @@
 import pytest
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 from datetime import datetime
 
 from app.services.conversation_service import ConversationService
 from app.services.room_service import RoomService
 from app.services.translation_service import TranslationService
+from app.services.connection_manager import ConnectionManager
+from app.services.presence_service import PresenceService
+from app.services.user_activity_buffer import UserActivityBuffer
 from app.models.user import User, UserStatus
 from app.models.room import Room
 from app.models.conversation import Conversation, ConversationType
@@ -14,36 +17,66 @@ from app.models.conversation import Conversation, ConversationType
 def mock_repositories():
     """Mock all repository dependencies."""
     return {
-        "conversation_repo": Mock(),
-        "message_repo": Mock(),
-        "user_repo": Mock(),
-        "room_repo": Mock(),
-        "translation_repo": Mock(),
+        "conversation_repo": AsyncMock(),
+        "message_repo": AsyncMock(),
+        "user_repo": AsyncMock(),
+        "room_repo": AsyncMock(),
+        "translation_repo": AsyncMock(),
+        "translation_job_repo": AsyncMock(),
     }
 
 
 @pytest.fixture
-def translation_service(mock_repositories):
+def mock_broker():
+    """Mock translation job broker."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def connection_manager():
+    """Mock WebSocket connection manager."""
+    return Mock(spec=ConnectionManager)
+
+
+@pytest.fixture
+def translation_service(mock_repositories, mock_broker):
     """TranslationService with mocked repositories - clean pattern."""
     return TranslationService(
         message_repo=mock_repositories["message_repo"],
         translation_repo=mock_repositories["translation_repo"],  # Repository pattern
+        job_repo=mock_repositories["translation_job_repo"],
+        broker=mock_broker,
     )
 
 
 @pytest.fixture
-def conversation_service(mock_repositories, translation_service):
+def conversation_service(
+    mock_repositories, translation_service, connection_manager, presence_service
+):
     """ConversationService with mocked dependencies."""
     return ConversationService(
         conversation_repo=mock_repositories["conversation_repo"],
         message_repo=mock_repositories["message_repo"],
         user_repo=mock_repositories["user_repo"],
         translation_service=translation_service,
+        connection_manager=connection_manager,
+        presence_service=presence_service,
+    )
+
+
+@pytest.fixture
+def presence_service():
+    """PresenceService on an in-memory backplane without database."""
+    return PresenceService(
+        connection_manager=ConnectionManager(),
+        activity_buffer=UserActivityBuffer(session_factory=AsyncMock()),
     )
 
 
 @pytest.fixture
-def room_service(mock_repositories, translation_service):
+def room_service(
+    mock_repositories, translation_service, connection_manager, presence_service
+):
     """RoomService with mocked dependencies."""
     return RoomService(
         room_repo=mock_repositories["room_repo"],
@@ -51,6 +84,8 @@ def room_service(mock_repositories, translation_service):
         message_repo=mock_repositories["message_repo"],
         conversation_repo=mock_repositories["conversation_repo"],
         translation_service=translation_service,
+        connection_manager=connection_manager,
+        presence_service=presence_service,
     )
 
 
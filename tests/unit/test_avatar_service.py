@@ -0,0 +1,53 @@
+import httpx
+import pytest
+
+from app.services import avatar_service
+from app.services.avatar_service import AvatarStyleCatalog, generate_avatar_url
+
+
+def mock_dicebear(monkeypatch, handler):
+    """Route catalog refreshes to a mock transport"""
+    real_client = httpx.AsyncClient
+
+    def client_factory(**kwargs):
+        return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr(avatar_service.httpx, "AsyncClient", client_factory)
+
+
+@pytest.mark.unit
+class TestAvatarStyleCatalog:
+    """Unit tests for the cached DiceBear style catalog"""
+
+    def test_bundled_snapshot_serves_lookups(self):
+        """Test lookups work without any network access"""
+        catalog = AvatarStyleCatalog()
+
+        assert "Bottts" in catalog
+        assert "not-a-style" not in catalog
+
+    def test_generate_avatar_url_falls_back_for_unknown_style(self):
+        """Test unknown styles fall back to bottts"""
+        url = generate_avatar_url("Alice Smith", style="unknown")
+
+        assert url == "https://api.dicebear.com/7.x/bottts/svg?seed=alice+smith"
+
+    async def test_refresh_replaces_catalog(self, monkeypatch):
+        """Test successful refresh swaps in the fetched styles"""
+        mock_dicebear(
+            monkeypatch,
+            lambda request: httpx.Response(200, json=[{"id": "glass"}, {"name": "x"}]),
+        )
+        catalog = AvatarStyleCatalog()
+
+        assert await catalog.refresh() is True
+        assert catalog.styles == ("glass",)
+        assert "glass" in catalog
+
+    async def test_failed_refresh_keeps_catalog(self, monkeypatch):
+        """Test API errors keep serving the previous catalog"""
+        mock_dicebear(monkeypatch, lambda request: httpx.Response(503))
+        catalog = AvatarStyleCatalog(styles=("rings",))
+
+        assert await catalog.refresh() is False
+        assert catalog.styles == ("rings",)
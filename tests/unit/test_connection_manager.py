@@ -0,0 +1,187 @@
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock, patch
+
+from app.models.message import Message
+from app.services.connection_manager import (
+    ClientConnection,
+    ConnectionManager,
+    room_channel,
+)
+from app.services.event_backplane import (
+    InMemoryEventBackplane,
+    PostgresEventBackplane,
+    get_postgres_dsn,
+)
+
+
+@pytest.mark.unit
+class TestConnectionManager:
+    """Unit tests for WebSocket fan-out"""
+
+    @pytest.fixture
+    def manager(self):
+        """Empty connection manager"""
+        return ConnectionManager()
+
+    def connect(self, manager, user_id, language, outbox_size=100):
+        """Register a connection subscribed to room 1"""
+        connection = ClientConnection(
+            websocket=Mock(),
+            user_id=user_id,
+            username=f"user{user_id}",
+            preferred_language=language,
+            outbox_size=outbox_size,
+        )
+        manager.register(connection)
+        manager.subscribe(connection, room_channel(1))
+        return connection
+
+    @pytest.fixture
+    def message(self):
+        """Room message as returned by send_room_message"""
+        message = Message(
+            id=5,
+            sender_id=1,
+            room_id=1,
+            content="Hello",
+            sent_at=datetime(2025, 1, 1, 12, 0),
+        )
+        message.sender_username = "user1"
+        return message
+
+    async def test_publish_message_reaches_channel_subscribers(self, manager, message):
+        """Test new messages are queued for every subscriber of the room"""
+        first = self.connect(manager, 1, "en")
+        second = self.connect(manager, 2, "de")
+        outsider = ClientConnection(Mock(), 3, "user3", "en")
+        manager.register(outsider)
+
+        await manager.publish_message(message)
+
+        event = first.outbox.get_nowait()
+        assert event["type"] == "message.created"
+        assert event["message"]["content"] == "Hello"
+        assert second.outbox.qsize() == 1
+        assert outsider.outbox.empty()
+
+    async def test_publish_translations_uses_preferred_language(self, manager, message):
+        """Test each subscriber only receives its own language"""
+        german = self.connect(manager, 1, "de")
+        french = self.connect(manager, 2, "fr")
+        english = self.connect(manager, 3, "en")
+
+        await manager.publish_translations(message, {"de": "Hallo", "FR": "Bonjour"})
+
+        assert german.outbox.get_nowait()["content"] == "Hallo"
+        assert french.outbox.get_nowait()["content"] == "Bonjour"
+        assert english.outbox.empty()
+
+    async def test_slow_client_is_dropped(self, manager, message):
+        """Test a full outbox unsubscribes the client instead of blocking"""
+        slow = self.connect(manager, 1, "en", outbox_size=1)
+        fast = self.connect(manager, 2, "en")
+
+        await manager.publish_message(message)
+        await manager.publish_message(message)
+
+        assert fast.outbox.qsize() == 2
+        assert manager.subscribers(room_channel(1)) == [fast]
+        assert slow.channels == set()
+
+    async def test_unsubscribe_user_and_close_channel(self, manager):
+        """Test leaving and closing a room stop delivery"""
+        first = self.connect(manager, 1, "en")
+        second = self.connect(manager, 2, "en")
+
+        await manager.unsubscribe_user(1, room_channel(1))
+        assert manager.subscribers(room_channel(1)) == [second]
+
+        await manager.close_channel(room_channel(1))
+        assert manager.subscribers(room_channel(1)) == []
+        assert second.outbox.get_nowait()["type"] == "channel.closed"
+        assert first.outbox.empty()
+
+    async def test_events_from_other_workers_reach_local_clients(self, message):
+        """Test events arrive through the shared backplane, not local state"""
+        backplane = InMemoryEventBackplane()
+        publishing_worker = ConnectionManager(backplane)
+        receiving_worker = ConnectionManager(backplane)
+        connection = self.connect(receiving_worker, 2, "en")
+
+        await publishing_worker.publish_message(message)
+        await publishing_worker.publish_event(
+            room_channel(1), "room.user_left", user_id=1, username="user1"
+        )
+
+        assert connection.outbox.get_nowait()["type"] == "message.created"
+        assert connection.outbox.get_nowait() == {
+            "type": "room.user_left",
+            "channel": room_channel(1),
+            "user_id": 1,
+            "username": "user1",
+        }
+
+    async def test_publish_failure_does_not_raise(self, message):
+        """Test a broken backplane never fails the triggering request"""
+        backplane = InMemoryEventBackplane()
+        backplane.publish = AsyncMock(side_effect=OSError("connection refused"))
+        manager = ConnectionManager(backplane)
+
+        await manager.publish_message(message)
+
+
+@pytest.mark.unit
+class TestPostgresEventBackplane:
+    """Unit tests for LISTEN/NOTIFY backplane with mocked asyncpg connections"""
+
+    @pytest.fixture
+    def connection(self):
+        """Mock asyncpg connection"""
+        connection = AsyncMock()
+        connection.is_closed = Mock(return_value=False)
+        connection.add_termination_listener = Mock()
+        return connection
+
+    async def test_publish_notifies_and_listener_dispatches(self, connection):
+        """Test events are sent with pg_notify and decoded on receipt"""
+        backplane = PostgresEventBackplane("postgresql://db/app", channel="events")
+        received = []
+        backplane.add_listener(received.append)
+
+        with patch(
+            "app.services.event_backplane.asyncpg.connect", return_value=connection
+        ):
+            await backplane.start()
+            await backplane.publish({"type": "room.user_left", "channel": "room:1"})
+
+        connection.add_listener.assert_called_once_with(
+            "events", backplane._on_notification
+        )
+        query, channel, payload = connection.execute.call_args[0]
+        assert query == "SELECT pg_notify($1, $2)"
+        assert channel == "events"
+
+        backplane._on_notification(connection, 1, "events", payload)
+        assert received == [{"type": "room.user_left", "channel": "room:1"}]
+
+    async def test_oversized_event_is_delivered_locally(self, connection):
+        """Test payloads above the NOTIFY limit skip PostgreSQL"""
+        backplane = PostgresEventBackplane("postgresql://db/app")
+        received = []
+        backplane.add_listener(received.append)
+
+        with patch(
+            "app.services.event_backplane.asyncpg.connect", return_value=connection
+        ):
+            await backplane.publish({"type": "message.created", "body": "x" * 8000})
+
+        connection.execute.assert_not_called()
+        assert len(received) == 1
+
+    def test_get_postgres_dsn_strips_driver(self):
+        """Test SQLAlchemy URLs are converted for asyncpg"""
+        assert (
+            get_postgres_dsn("postgresql+asyncpg://user:pw@db/app")
+            == "postgresql://user:pw@db/app"
+        )
@@ -1,16 +1,17 @@
 import pytest
 from fastapi import HTTPException
 
-from app.models.user import User
+from app.models.user import User, UserStatus
 from app.models.conversation import Conversation, ConversationType
 from app.models.message import Message, MessageType
+from app.models.message_archive import RetentionMode
 
 
 @pytest.mark.unit
 class TestConversationService:
     """Unit tests for ConversationService."""
 
-    def test_create_private_conversation_success(
+    async def test_create_private_conversation_success(
         self, conversation_service, mock_repositories, sample_user
     ):
         """Test: Successfully create private conversation."""
@@ -24,10 +25,12 @@ class TestConversationService:
             "conversation_repo"
         ].create_private_conversation.return_value = expected_conversation
 
-        result = conversation_service.create_conversation(
+        result = await conversation_service.create_conversation(
             current_user=sample_user,
             participant_usernames=["otheruser"],
             conversation_type="private",
+            message_retention_days=30,
+            message_retention_mode=RetentionMode.ARCHIVE,
         )
 
         assert result == expected_conversation
@@ -37,17 +40,21 @@ class TestConversationService:
         mock_repositories[
             "conversation_repo"
         ].create_private_conversation.assert_called_once_with(
-            room_id=1, participant_ids=[1, 2]
+            room_id=1,
+            participant_ids=[1, 2],
+            message_retention_count=None,
+            message_retention_days=30,
+            message_retention_mode=RetentionMode.ARCHIVE,
         )
 
-    def test_create_conversation_user_not_in_room(
+    async def test_create_conversation_user_not_in_room(
         self, conversation_service, sample_user
     ):
         """Test: Error when user is not in a room."""
         sample_user.current_room_id = None
 
         with pytest.raises(HTTPException) as exc_info:
-            conversation_service.create_conversation(
+            await conversation_service.create_conversation(
                 current_user=sample_user,
                 participant_usernames=["otheruser"],
                 conversation_type="private",
@@ -56,13 +63,13 @@ class TestConversationService:
         assert exc_info.value.status_code == 403
         assert "User must be in a room" in str(exc_info.value.detail)
 
-    def test_create_private_conversation_wrong_participant_count(
+    async def test_create_private_conversation_wrong_participant_count(
         self, conversation_service, sample_user
     ):
         """Test: Private conversation requires exactly 1 other participant."""
 
         with pytest.raises(HTTPException) as exc_info:
-            conversation_service.create_conversation(
+            await conversation_service.create_conversation(
                 current_user=sample_user,
                 participant_usernames=["user1", "user2"],
                 conversation_type="private",
@@ -71,14 +78,14 @@ class TestConversationService:
         assert exc_info.value.status_code == 400
         assert "exactly 1 other participant" in str(exc_info.value.detail)
 
-    def test_create_conversation_participant_not_found(
+    async def test_create_conversation_participant_not_found(
         self, conversation_service, mock_repositories, sample_user
     ):
         """Test: Error when participant does not exist."""
         mock_repositories["user_repo"].get_by_username.return_value = None
 
         with pytest.raises(HTTPException) as exc_info:
-            conversation_service.create_conversation(
+            await conversation_service.create_conversation(
                 current_user=sample_user,
                 participant_usernames=["nonexistent"],
                 conversation_type="private",
@@ -91,7 +98,7 @@ class TestConversationService:
     # SEND MESSAGE TESTS
     # =====================================
 
-    def test_send_message_success(
+    async def test_send_message_success(
         self, conversation_service, mock_repositories, sample_user, sample_conversation
     ):
         """Test: Successfully send a message."""
@@ -114,7 +121,7 @@ class TestConversationService:
             sample_user
         ]
 
-        result = conversation_service.send_message(
+        result = await conversation_service.send_message(
             current_user=sample_user, conversation_id=1, content="Hello!"
         )
 
@@ -129,21 +136,37 @@ class TestConversationService:
             sender_id=1, conversation_id=1, content="Hello!"
         )
 
-    def test_send_message_conversation_not_found(
+    async def test_get_participants_reports_buffered_status(
+        self, conversation_service, mock_repositories, sample_user
+    ):
+        """Test: Participants show a status change before it is flushed."""
+        mock_repositories["conversation_repo"].is_participant.return_value = True
+        mock_repositories["conversation_repo"].get_participants.return_value = [
+            sample_user
+        ]
+        conversation_service.presence_service.activity_buffer.record(
+            sample_user.id, status=UserStatus.BUSY
+        )
+
+        result = await conversation_service.get_participants(sample_user, 1)
+
+        assert [participant["status"] for participant in result] == ["busy"]
+
+    async def test_send_message_conversation_not_found(
         self, conversation_service, mock_repositories, sample_user
     ):
         """Test: Error when conversation does not exist."""
         mock_repositories["conversation_repo"].get_by_id.return_value = None
 
         with pytest.raises(HTTPException) as exc_info:
-            conversation_service.send_message(
+            await conversation_service.send_message(
                 current_user=sample_user, conversation_id=999, content="Hello!"
             )
 
         assert exc_info.value.status_code == 404
         assert "not found" in str(exc_info.value.detail)
 
-    def test_send_message_not_participant(
+    async def test_send_message_not_participant(
         self, conversation_service, mock_repositories, sample_user, sample_conversation
     ):
         """Test: Error when user is not a participant in the conversation."""
@@ -153,13 +176,61 @@ class TestConversationService:
         mock_repositories["conversation_repo"].is_participant.return_value = False
 
         with pytest.raises(HTTPException) as exc_info:
-            conversation_service.send_message(
+            await conversation_service.send_message(
                 current_user=sample_user, conversation_id=1, content="Hello!"
             )
 
         assert exc_info.value.status_code == 403
         assert "not a participant" in str(exc_info.value.detail)
 
+    # =====================================
+    # CONVERSATION LIST TESTS
+    # =====================================
+
+    async def test_get_user_conversations_uses_single_summary_query(
+        self, conversation_service, mock_repositories, sample_conversation
+    ):
+        """Test: Conversation list is built from one summary call without N+1."""
+        mock_repositories[
+            "conversation_repo"
+        ].get_user_conversation_summaries.return_value = [
+            {
+                "conversation": sample_conversation,
+                "participants": [(1, "testuser"), (2, "otheruser")],
+                "unread_count": 3,
+                "last_message": {"id": 9, "content": "Hi"},
+            }
+        ]
+
+        result = await conversation_service.get_user_conversations(1)
+
+        assert result[0]["participants"] == ["otheruser"]
+        assert result[0]["participant_count"] == 2
+        assert result[0]["unread_count"] == 3
+        assert result[0]["last_message"]["content"] == "Hi"
+        mock_repositories["conversation_repo"].get_participants.assert_not_called()
+
+    async def test_get_messages_marks_latest_page_read(
+        self, conversation_service, mock_repositories, sample_user, sample_conversation
+    ):
+        """Test: Loading the newest page advances the read watermark."""
+        mock_repositories[
+            "conversation_repo"
+        ].get_by_id.return_value = sample_conversation
+        mock_repositories["conversation_repo"].is_participant.return_value = True
+        mock_repositories["message_repo"].get_conversation_messages.return_value = (
+            [Message(id=12), Message(id=11)],
+            False,
+            None,
+        )
+
+        await conversation_service.get_messages(sample_user, 1)
+        await conversation_service.get_messages(sample_user, 1, before=11)
+
+        mock_repositories["conversation_repo"].mark_read.assert_called_once_with(
+            1, sample_user.id, 12
+        )
+
 
 if __name__ == "__main__":
     print("Unit Tests für ConversationService, tests/unit/test_conversation_service.py")
@@ -0,0 +1,78 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.database import MeteredQueuePool, get_pool_stats, ping_idle_connections
+from app.repositories.message_repository import MessageRepository
+
+
+@pytest.mark.unit
+class TestDatabasePool:
+    """Unit tests for connection pool metering and routing of history reads"""
+
+    @pytest.fixture
+    async def engine(self):
+        """Engine with a single pooled connection"""
+        engine = create_async_engine(
+            "sqlite+aiosqlite://",
+            poolclass=MeteredQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.05,
+        )
+        yield engine
+        await engine.dispose()
+
+    async def test_checkouts_and_timeouts_are_counted(self, engine):
+        """Test metrics report connections in use and exhausted checkouts"""
+        async with engine.connect():
+            assert get_pool_stats(engine)["checked_out"] == 1
+            with pytest.raises(PoolTimeoutError):
+                async with engine.connect():
+                    pass
+
+        stats = get_pool_stats(engine)
+        assert stats["pool_class"] == "MeteredQueuePool"
+        assert stats["checked_out"] == 0
+        assert stats["checkouts"] == 1
+        assert stats["timeouts"] == 1
+        assert stats["wait_max_ms"] >= stats["wait_avg_ms"] > 0
+
+    async def test_only_idle_connections_are_pinged(self, engine, monkeypatch):
+        """Test dead idle connections are replaced without failing the checkout"""
+        do_ping = MagicMock(side_effect=ConnectionError("server closed"))
+        monkeypatch.setattr(engine.dialect, "do_ping", do_ping)
+        ping_idle_connections(engine, idle_seconds=0.01)
+
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        do_ping.assert_not_called()
+
+        await asyncio.sleep(0.02)
+        async with engine.connect() as conn:
+            assert (await conn.execute(text("SELECT 1"))).scalar() == 1
+        do_ping.assert_called_once()
+
+    async def test_history_pages_use_read_session(self):
+        """Test history pages are read from the read session only"""
+        db, read_db = AsyncMock(), AsyncMock()
+        read_db.execute.return_value = MagicMock(all=MagicMock(return_value=[]))
+        repository = MessageRepository(db, read_db)
+
+        messages, has_more, _ = await repository.get_room_messages(
+            room_id=1, include_total=True
+        )
+
+        assert messages == [] and not has_more
+        assert read_db.execute.await_count == 2
+        db.execute.assert_not_awaited()
+
+    def test_read_session_defaults_to_primary(self):
+        """Test repositories without a replica read from their own session"""
+        db = AsyncMock()
+
+        assert MessageRepository(db).read_db is db
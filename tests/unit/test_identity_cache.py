@@ -0,0 +1,93 @@
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+from app.core.identity_cache import USERS_CHANGED_EVENT, IdentityCache
+from app.models.user import User, UserStatus
+from app.repositories.user_repository import UserRepository
+from app.services.event_backplane import InMemoryEventBackplane
+
+
+@pytest.fixture
+def user():
+    """Loaded user snapshot"""
+    return User(
+        id=7,
+        email="alice@example.com",
+        username="alice",
+        password_hash="hash",
+        preferred_language="de",
+        is_active=True,
+        is_admin=False,
+        status=UserStatus.AVAILABLE,
+        created_at=datetime(2025, 1, 1),
+    )
+
+
+@pytest.mark.unit
+class TestIdentityCache:
+    """Unit tests for the authenticated-user cache"""
+
+    def test_put_and_get_returns_column_values(self, user):
+        """Test cache stores plain column values keyed by username"""
+        cache = IdentityCache(max_entries=10, ttl=30)
+        cache.put(user)
+
+        values = cache.get("alice")
+        assert values["id"] == 7
+        assert values["preferred_language"] == "de"
+        assert cache.stats()["hits"] == 1
+
+    def test_invalidate_by_user_id(self, user):
+        """Test writes drop the entry even after a username change"""
+        cache = IdentityCache(max_entries=10, ttl=30)
+        cache.put(user)
+        user.username = "alice2"
+
+        cache.invalidate(user.id)
+
+        assert cache.get("alice") is None
+        assert cache.stats()["invalidations"] == 1
+
+    def test_put_skipped_after_concurrent_invalidation(self, user):
+        """Test a snapshot loaded before an invalidation is not cached"""
+        cache = IdentityCache(max_entries=10, ttl=30)
+        generation = cache.invalidations
+        cache.invalidate(99)
+
+        cache.put(user, generation)
+
+        assert cache.get("alice") is None
+
+    async def test_committed_invalidation_reaches_other_workers(self, user):
+        """Test a write on one worker drops the user cached by another"""
+        backplane = InMemoryEventBackplane()
+        published = []
+        backplane.add_listener(published.append)
+        writer = IdentityCache(max_entries=10, ttl=30)
+        reader = IdentityCache(max_entries=10, ttl=30)
+        writer.attach(backplane)
+        reader.attach(backplane)
+        reader.put(user)
+
+        await writer.publish_invalidation([user.id])
+
+        assert reader.get("alice") is None
+        assert published == [{"type": USERS_CHANGED_EVENT, "user_ids": [7]}]
+
+    async def test_repository_hit_skips_select(self, user, monkeypatch):
+        """Test cached user is merged into the session without a query"""
+        cache = IdentityCache(max_entries=10, ttl=30)
+        cache.put(user)
+        monkeypatch.setattr("app.repositories.user_repository.identity_cache", cache)
+        db = AsyncMock()
+        db.merge.side_effect = lambda instance, load: instance
+        repo = UserRepository(db)
+
+        result = await repo.get_authenticated_user("alice")
+
+        assert result.id == 7
+        assert result.preferred_language == "de"
+        db.execute.assert_not_called()
+        db.merge.assert_awaited_once()
+        assert db.merge.call_args.kwargs == {"load": False}
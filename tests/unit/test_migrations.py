@@ -0,0 +1,156 @@
+import pytest
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.core.migrations import (
+    check_schema,
+    get_pending_versions,
+    load_migrations,
+    migrate,
+)
+
+
+# Columns added to existing tables since the first release
+PRE_MIGRATION_MISSING_COLUMNS = [
+    ("rooms", "user_count"),
+    ("rooms", "message_retention_count"),
+    ("rooms", "message_retention_days"),
+    ("rooms", "message_retention_mode"),
+    ("conversations", "message_retention_count"),
+    ("conversations", "message_retention_days"),
+    ("conversations", "message_retention_mode"),
+    ("conversation_participants", "last_read_message_id"),
+]
+
+
+@pytest.mark.unit
+class TestMigrations:
+    """Unit tests for the versioned migration runner"""
+
+    @pytest.fixture
+    async def engine(self):
+        """Empty in-memory SQLite database"""
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        yield engine
+        await engine.dispose()
+
+    async def index_names(self, engine):
+        """Names of the indexes in the database"""
+        async with engine.connect() as conn:
+            result = await conn.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'index'")
+            )
+            return set(result.scalars().all())
+
+    async def schema(self, engine):
+        """Column and index names of each table"""
+
+        def inspect_schema(sync_conn):
+            inspector = inspect(sync_conn)
+            return {
+                table: (
+                    {column["name"] for column in inspector.get_columns(table)},
+                    {index["name"] for index in inspector.get_indexes(table)},
+                )
+                for table in inspector.get_table_names()
+            }
+
+        async with engine.connect() as conn:
+            return await conn.run_sync(inspect_schema)
+
+    def test_scripts_are_ordered_by_version(self):
+        """Test scripts are discovered in version order"""
+        versions = [migration.version for migration in load_migrations()]
+
+        assert versions[:2] == [1, 2]
+        assert versions == sorted(versions)
+
+    async def test_pending_migrations_apply_once(self, engine):
+        """Test a second run finds nothing to apply"""
+        applied = await migrate(engine)
+
+        assert applied == [migration.version for migration in load_migrations()]
+        assert await migrate(engine) == []
+        assert "idx_active_participations" in await self.index_names(engine)
+
+    async def test_schema_check_issues_no_ddl(self, engine):
+        """Test workers only read the migration state"""
+        with pytest.raises(RuntimeError, match="pending migrations"):
+            await check_schema(engine)
+        assert await self.index_names(engine) == set()
+
+        await migrate(engine)
+
+        await check_schema(engine)
+        assert await get_pending_versions(engine) == []
+
+    def test_index_migration_builds_online(self):
+        """Test index scripts run outside a transaction"""
+        baseline, index_migration = load_migrations()[:2]
+
+        assert baseline.transactional
+        assert not index_migration.transactional
+
+    async def test_index_migration_upgrades_old_schema(self, engine):
+        """Test databases from before the baseline get the new index set"""
+        baseline, index_migration = load_migrations()[:2]
+        await migrate(engine, [baseline])
+
+        index_names = await self.index_names(engine)
+        assert "idx_message_translations" in index_names
+        assert "idx_room_message_history" not in index_names
+
+        assert await migrate(engine, [baseline, index_migration]) == [2]
+
+        index_names = await self.index_names(engine)
+        assert "idx_room_message_history" in index_names
+        assert "idx_message_translations" not in index_names
+
+    async def test_migrations_build_the_model_schema(self, engine):
+        """Test the frozen revisions add up to the tables of the models"""
+        model_engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        async with model_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        await migrate(engine)
+
+        try:
+            assert await self.schema(engine) == await self.schema(model_engine)
+        finally:
+            await model_engine.dispose()
+
+    async def test_upgrade_adds_columns_to_pre_migration_schema(self, engine):
+        """Test databases from before versioned migrations get the new columns"""
+        baseline = load_migrations()[0]
+        await migrate(engine, [baseline])
+        async with engine.begin() as conn:
+            await conn.execute(text("DROP TABLE schema_migrations"))
+            await conn.execute(
+                text(
+                    "INSERT INTO rooms (id, name, is_translation_enabled, is_active) "
+                    "VALUES (1, 'Lobby', 0, 1), (2, 'Empty', 0, 1)"
+                )
+            )
+            await conn.execute(
+                text(
+                    "INSERT INTO users (email, username, password_hash, status, "
+                    "is_active, is_admin, current_room_id) VALUES "
+                    "('a@example.com', 'a', 'x', 'AVAILABLE', 1, 0, 1), "
+                    "('b@example.com', 'b', 'x', 'AVAILABLE', 1, 0, 1), "
+                    "('c@example.com', 'c', 'x', 'AVAILABLE', 0, 0, 1)"
+                )
+            )
+
+        await migrate(engine)
+
+        async with engine.connect() as conn:
+            for table, column in PRE_MIGRATION_MISSING_COLUMNS:
+                await conn.execute(text(f"SELECT {column} FROM {table}"))
+            result = await conn.execute(
+                text(
+                    "SELECT id, user_count, message_retention_mode FROM rooms "
+                    "ORDER BY id"
+                )
+            )
+            assert result.all() == [(1, 2, "DELETE"), (2, 0, "DELETE")]
@@ -0,0 +1,56 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.auth_utils import PasswordHashExecutor
+
+
+@pytest.mark.unit
+class TestPasswordHashExecutor:
+    """Unit tests for the bounded password hashing pool"""
+
+    async def test_runs_off_event_loop_thread(self):
+        """Test hash functions execute in a worker thread"""
+        executor = PasswordHashExecutor(max_workers=1, max_pending=4)
+
+        thread_name = await executor.run(lambda: threading.current_thread().name)
+
+        assert thread_name.startswith("password-hash")
+        assert executor.stats()["completed"] == 1
+        executor.shutdown()
+
+    async def test_records_queue_wait(self):
+        """Test calls waiting for the single worker report queue wait"""
+        executor = PasswordHashExecutor(max_workers=1, max_pending=4)
+        release = threading.Event()
+
+        blocked = asyncio.create_task(executor.run(release.wait, 5))
+        queued = asyncio.create_task(executor.run(lambda: "done"))
+        await asyncio.sleep(0.05)
+        release.set()
+
+        assert await queued == "done"
+        await blocked
+        stats = executor.stats()
+        assert stats["queue_wait_max_ms"] >= 40
+        assert stats["pending"] == 0
+        executor.shutdown()
+
+    async def test_rejects_when_pending_limit_reached(self):
+        """Test overload returns 503 instead of queueing without limit"""
+        executor = PasswordHashExecutor(max_workers=1, max_pending=1)
+        release = threading.Event()
+
+        blocked = asyncio.create_task(executor.run(release.wait, 5))
+        await asyncio.sleep(0)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await executor.run(lambda: None)
+
+        assert exc_info.value.status_code == 503
+        assert executor.stats()["rejected"] == 1
+        release.set()
+        await blocked
+        executor.shutdown()
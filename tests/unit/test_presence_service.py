@@ -0,0 +1,138 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+from app.models.user import User, UserStatus
+from app.services.connection_manager import ConnectionManager, room_channel
+from app.services.presence_service import PresenceService
+from app.services.user_activity_buffer import UserActivityBuffer
+
+
+def room_user(user_id, status=UserStatus.AVAILABLE, idle_for=0):
+    """User in room 1 last active idle_for seconds ago"""
+    return User(
+        id=user_id,
+        username=f"user{user_id}",
+        status=status,
+        current_room_id=1,
+        last_active=datetime.now(timezone.utc) - timedelta(seconds=idle_for),
+    )
+
+
+@pytest.mark.unit
+class TestPresenceService:
+    """Unit tests for the in-memory presence index"""
+
+    @pytest.fixture
+    def presence(self):
+        """Presence service on an in-memory backplane"""
+        return PresenceService(
+            connection_manager=ConnectionManager(),
+            activity_buffer=UserActivityBuffer(session_factory=AsyncMock()),
+            idle_timeout=60,
+        )
+
+    async def test_room_is_loaded_once(self, presence):
+        """Test the database is only queried on the first read of a room"""
+        load_users = AsyncMock(return_value=[room_user(2), room_user(1)])
+
+        first = await presence.get_room_users(1, load_users)
+        second = await presence.get_room_users(1, load_users)
+
+        assert [entry.username for entry in first] == ["user1", "user2"]
+        assert second == first
+        load_users.assert_awaited_once_with(1)
+
+    async def test_room_events_update_index(self, presence):
+        """Test joins, leaves and status changes apply without reloading"""
+        load_users = AsyncMock(return_value=[room_user(1)])
+        await presence.get_room_users(1, load_users)
+
+        await presence.connection_manager.publish_event(
+            room_channel(1),
+            "room.user_joined",
+            user_id=2,
+            username="user2",
+            status="available",
+            last_active=datetime.now(timezone.utc).isoformat(),
+        )
+        await presence.connection_manager.publish_event(
+            room_channel(1), "presence.updated", user_id=2, status="busy"
+        )
+        await presence.connection_manager.publish_event(
+            room_channel(1), "room.user_left", user_id=1
+        )
+
+        entries = await presence.get_room_users(1, load_users)
+        assert [(entry.user_id, entry.status) for entry in entries] == [
+            (2, UserStatus.BUSY)
+        ]
+        load_users.assert_awaited_once()
+
+    async def test_closed_room_is_dropped(self, presence):
+        """Test closing a room forgets its users"""
+        await presence.get_room_users(1, AsyncMock(return_value=[room_user(1)]))
+
+        await presence.connection_manager.close_channel(room_channel(1))
+
+        assert presence.stats()["rooms"] == 0
+        assert presence.stats()["users"] == 0
+
+    async def test_idle_users_expire_and_heartbeat_restores(self, presence):
+        """Test idle users turn AWAY and come back on their next heartbeat"""
+        await presence.get_room_users(
+            1, AsyncMock(return_value=[room_user(1, idle_for=120), room_user(2)])
+        )
+
+        assert await presence.expire_idle_users() == 1
+        entries = {
+            entry.user_id: entry
+            for entry in await presence.get_room_users(1, AsyncMock())
+        }
+        assert entries[1].status == UserStatus.AWAY
+        assert entries[1].idle
+        assert entries[2].status == UserStatus.AVAILABLE
+
+        await presence.heartbeat(1)
+
+        assert entries[1].status == UserStatus.AVAILABLE
+        assert not entries[1].idle
+        assert await presence.expire_idle_users() == 0
+
+    async def test_manual_away_is_not_restored_by_heartbeat(self, presence):
+        """Test heartbeats keep a recently chosen AWAY status"""
+        await presence.get_room_users(
+            1, AsyncMock(return_value=[room_user(1, UserStatus.AWAY)])
+        )
+
+        await presence.heartbeat(1)
+
+        entries = await presence.get_room_users(1, AsyncMock())
+        assert entries[0].status == UserStatus.AWAY
+
+    async def test_updates_are_buffered_per_user(self, presence):
+        """Test heartbeats and expiries only reach the write-behind buffer"""
+        await presence.get_room_users(
+            1, AsyncMock(return_value=[room_user(1, idle_for=120)])
+        )
+        await presence.expire_idle_users()
+        for _ in range(3):
+            await presence.heartbeat(2)
+
+        assert presence.activity_buffer.pending_count == 2
+        assert presence.activity_buffer.get_pending(1) == (None, UserStatus.AWAY)
+        assert presence.activity_buffer.get_pending(2)[0] is not None
+
+    async def test_room_change_discards_buffered_status(self, presence):
+        """Test a join written directly is not reverted by an older buffered status"""
+        await presence.change_status(room_user(1), UserStatus.BUSY)
+
+        await presence.connection_manager.publish_event(
+            room_channel(2),
+            "room.user_joined",
+            user_id=1,
+            username="user1",
+            status="available",
+        )
+
+        assert presence.activity_buffer.get_pending(1) == (None, None)
@@ -0,0 +1,142 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.database import Base
+from app.core.read_routing import (
+    USER_WROTE_EVENT,
+    ReadRouter,
+    RoutedReadSession,
+    bind_user,
+)
+from app.models.conversation_participant import ConversationParticipant
+from app.models.room import Room
+from app.repositories.conversation_repository import ConversationRepository
+from app.services.event_backplane import InMemoryEventBackplane
+
+
+def request_session(user_id=None, has_writes=False):
+    """Mocked primary session of a request"""
+    session = AsyncMock(info={})
+    if user_id is not None:
+        bind_user(session, user_id)
+    if has_writes:
+        session.info["has_writes"] = True
+    return session
+
+
+@pytest.mark.unit
+class TestReadRouting:
+    """Unit tests for replica routing with read-your-writes stickiness"""
+
+    @pytest.fixture
+    def replicas(self):
+        """Two replica session factories"""
+        return [MagicMock(return_value=AsyncMock()) for _ in range(2)]
+
+    @pytest.fixture
+    def router(self, replicas):
+        """Router over the replicas sharing marks on an in-memory backplane"""
+        router = ReadRouter(replicas, sticky_window=60)
+        router.attach(InMemoryEventBackplane())
+        return router
+
+    def test_reads_rotate_over_replicas(self, router, replicas):
+        """Test anonymous and idle users are spread over all replicas"""
+        routes = [router.route(request_session(user_id)) for user_id in (None, 1, 2)]
+
+        assert routes == [replicas[0], replicas[1], replicas[0]]
+        assert router.stats()["replica_reads"] == 3
+
+    def test_without_replicas_reads_use_primary(self):
+        """Test a router without replicas keeps reads on the primary"""
+        router = ReadRouter()
+
+        assert router.route(request_session(1)) is None
+        assert router.stats()["primary_reads"] == 1
+
+    def test_request_reads_its_own_writes(self, router):
+        """Test reads after a write in the same request stay on the primary"""
+        assert router.route(request_session(1, has_writes=True)) is None
+
+    async def test_writer_is_sticky_for_the_window(self, router, replicas):
+        """Test a user reads the primary after committing a write"""
+        await router.record_writes(request_session(1, has_writes=True))
+
+        assert router.route(request_session(1)) is None
+        assert router.route(request_session(2)) in replicas
+
+        router.sticky_window = 0
+        assert router.route(request_session(1)) in replicas
+        assert router.stats()["sticky_users"] == 0
+
+    async def test_reads_without_writes_do_not_stick(self, router, replicas):
+        """Test committing a read-only request keeps the user on replicas"""
+        await router.record_writes(request_session(1))
+
+        assert router.route(request_session(1)) in replicas
+
+    async def test_write_marks_reach_other_workers(self, replicas):
+        """Test stickiness follows the user to another worker"""
+        backplane = InMemoryEventBackplane()
+        published = []
+        backplane.add_listener(published.append)
+        writer, reader = ReadRouter(replicas), ReadRouter(replicas)
+        writer.attach(backplane)
+        reader.attach(backplane)
+
+        await writer.record_writes(request_session(1, has_writes=True))
+        await writer.record_writes(request_session(1, has_writes=True))
+
+        assert reader.route(request_session(1)) is None
+        assert published == [{"type": USER_WROTE_EVENT, "user_id": 1}]
+
+    async def test_routed_session_binds_once(self, router, replicas):
+        """Test all reads of a request go to one replica session"""
+        primary = request_session(1)
+        read_db = RoutedReadSession(router, primary)
+
+        await read_db.execute("SELECT 1")
+        await read_db.execute("SELECT 2")
+        await read_db.close()
+
+        replica_session = replicas[0].return_value
+        assert replica_session.execute.await_count == 2
+        replica_session.close.assert_awaited_once()
+        primary.execute.assert_not_awaited()
+        primary.close.assert_not_awaited()
+
+    @pytest.fixture
+    async def session(self):
+        """Session on an empty in-memory database"""
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine) as session:
+            yield session
+        await engine.dispose()
+
+    async def test_statements_changing_no_rows_are_not_writes(self, session):
+        """Test only statements that changed rows make the user sticky"""
+        await session.execute(update(Room).where(Room.id == 1).values(user_count=1))
+        assert "has_writes" not in session.info
+
+        await session.execute(insert(Room).values(name="Lobby"))
+        assert session.info["has_writes"]
+
+    async def test_read_watermark_is_not_a_write(self, session):
+        """Test reading a conversation keeps the user on the replicas"""
+        await session.execute(
+            insert(ConversationParticipant).values(conversation_id=1, user_id=1)
+        )
+        session.info.clear()
+
+        await ConversationRepository(session).mark_read(1, 1, message_id=5)
+
+        assert "has_writes" not in session.info
+        watermark = await session.scalar(
+            select(ConversationParticipant.last_read_message_id)
+        )
+        assert watermark == 5
@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.core.startup import STARTUP_PROFILES, get_startup_profile
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+@pytest.mark.unit
+class TestStartupProfiles:
+    """Unit tests for environment startup profiles"""
+
+    def test_prod_profile_skips_ddl_and_seeding(self):
+        """Test prod workers only check the schema"""
+        profile = get_startup_profile("prod")
+
+        assert not profile.migrate
+        assert not profile.seed
+        assert not profile.reconcile_occupancy
+
+    def test_only_dev_profile_seeds(self):
+        """Test sample data is limited to development"""
+        assert [name for name, p in STARTUP_PROFILES.items() if p.seed] == ["dev"]
+
+    def test_unknown_environment_is_rejected(self):
+        """Test a typo does not silently pick a profile"""
+        with pytest.raises(ValueError, match="production"):
+            get_startup_profile("production")
+
+    def test_app_import_skips_optional_modules(self):
+        """Test importing the app loads neither DeepL nor the seeding code"""
+        code = (
+            "import sys, main; "
+            "print(sorted({'deepl', 'testing_setup'} & set(sys.modules)))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=PROJECT_ROOT,
+            env={
+                **os.environ,
+                "ENVIRONMENT": "prod",
+                "DATABASE_URL": "sqlite:///:memory:",
+            },
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip().splitlines()[-1] == "[]"
@@ -0,0 +1,127 @@
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from app.services.translation_cache import (
+    LRUTranslationCache,
+    TranslationCache,
+    make_cache_key,
+    normalize_content,
+)
+
+
+@pytest.mark.unit
+class TestTranslationCache:
+    """Unit tests for the two-tier translation memory"""
+
+    @pytest.fixture
+    def cache_repo(self):
+        """Mock translation cache repository"""
+        repo = AsyncMock()
+        repo.get_valid_entries.return_value = []
+        return repo
+
+    @pytest.fixture
+    def translation_cache(self, cache_repo):
+        """TranslationCache with fresh memory tier"""
+        return TranslationCache(
+            cache_repo=cache_repo,
+            memory_cache=LRUTranslationCache(max_entries=10, ttl=60),
+            ttl=60,
+        )
+
+    def test_normalized_content_shares_cache_key(self):
+        """Test whitespace differences map to the same key"""
+        assert normalize_content("  thanks \n a lot ") == "thanks a lot"
+        assert make_cache_key("thanks  a lot", "en", "de") == make_cache_key(
+            " thanks a lot", "EN", "DE"
+        )
+
+    def test_cache_key_separates_language_pairs(self):
+        """Test auto-detected and explicit source languages get own keys"""
+        auto_key = make_cache_key("hi", None, "DE")
+
+        assert auto_key[1:] == ("AUTO", "DE")
+        assert auto_key != make_cache_key("hi", "EN", "DE")
+        assert auto_key != make_cache_key("hi", None, "FR")
+
+    def test_lru_evicts_least_recently_used(self):
+        """Test full LRU drops the entry not used for the longest time"""
+        lru = LRUTranslationCache(max_entries=2, ttl=60)
+        lru.put(("a", "EN", "DE"), "A")
+        lru.put(("b", "EN", "DE"), "B")
+        lru.get(("a", "EN", "DE"))
+        lru.put(("c", "EN", "DE"), "C")
+
+        assert lru.get(("b", "EN", "DE")) is None
+        assert lru.get(("a", "EN", "DE")) == "A"
+        assert lru.stats()["evictions"] == 1
+
+    def test_lru_expires_entries_after_ttl(self):
+        """Test expired entries count as misses"""
+        lru = LRUTranslationCache(max_entries=2, ttl=60)
+
+        with patch("app.core.lru_cache.time.monotonic", return_value=0):
+            lru.put(("a", "EN", "DE"), "A")
+        with patch("app.core.lru_cache.time.monotonic", return_value=61):
+            assert lru.get(("a", "EN", "DE")) is None
+
+        assert lru.stats()["expirations"] == 1
+        assert lru.stats()["misses"] == 1
+        assert len(lru) == 0
+
+    async def test_get_many_prefers_memory_tier(self, translation_cache, cache_repo):
+        """Test memory hits never reach the database"""
+        key = make_cache_key("hi", None, "DE")
+        translation_cache.memory_cache.put(key, "Hallo")
+
+        result = await translation_cache.get_many([key])
+
+        assert result == {key: "Hallo"}
+        cache_repo.get_valid_entries.assert_not_called()
+
+    async def test_get_many_falls_back_to_persistent_tier(
+        self, translation_cache, cache_repo
+    ):
+        """Test persistent hits are promoted to memory and counted"""
+        key = make_cache_key("hi", None, "DE")
+        other_key = make_cache_key("ok", None, "DE")
+        cache_repo.get_valid_entries.return_value = [
+            Mock(
+                id=7,
+                content_hash=key[0],
+                source_language=key[1],
+                target_language=key[2],
+                translated_content="Hallo",
+            )
+        ]
+
+        result = await translation_cache.get_many([key, other_key])
+
+        assert result == {key: "Hallo"}
+        assert translation_cache.memory_cache.get(key) == "Hallo"
+        cache_repo.get_valid_entries.assert_called_once()
+        cache_repo.record_hits.assert_called_once()
+        assert cache_repo.record_hits.call_args[0][0] == [7]
+        assert translation_cache.stats()["persistent"] == {"hits": 1, "misses": 1}
+
+    async def test_put_many_writes_both_tiers(self, translation_cache, cache_repo):
+        """Test fresh translations are stored in memory and database"""
+        key = make_cache_key("hi", None, "DE")
+
+        await translation_cache.put_many({key: "Hallo"})
+
+        assert translation_cache.memory_cache.get(key) == "Hallo"
+        entries = cache_repo.upsert_entries.call_args[0][0]
+        assert len(entries) == 1
+        assert entries[0]["content_hash"] == key[0]
+        assert entries[0]["translated_content"] == "Hallo"
+
+    async def test_prune_deletes_expired_and_trims(self, translation_cache, cache_repo):
+        """Test prune removes expired rows and enforces row limit"""
+        cache_repo.delete_expired.return_value = 3
+        cache_repo.evict_least_recently_used.return_value = 2
+
+        deleted = await translation_cache.prune(max_rows=100)
+
+        assert deleted == 5
+        cache_repo.evict_least_recently_used.assert_called_once_with(100)
@@ -1,6 +1,10 @@
+import deepl
 import pytest
-from unittest.mock import Mock, patch
-from app.services.translation_service import TranslationService
+from unittest.mock import AsyncMock, Mock, patch
+from app.core.config import settings
+from app.models.translation_job import TranslationJob, TranslationJobStatus
+from app.services.translation_cache import make_cache_key
+from app.services.translation_service import TranslationService, compute_retry_delay
 
 
 @pytest.mark.unit
@@ -11,8 +15,10 @@ class TestTranslationService:
     def mock_repos(self):
         """Create mock repositories for testing"""
         return {
-            "message_repo": Mock(),
-            "translation_repo": Mock(),
+            "message_repo": AsyncMock(),
+            "translation_repo": AsyncMock(),
+            "job_repo": AsyncMock(),
+            "broker": AsyncMock(),
         }
 
     @pytest.fixture
@@ -21,40 +27,149 @@ class TestTranslationService:
         return TranslationService(
             message_repo=mock_repos["message_repo"],
             translation_repo=mock_repos["translation_repo"],
+            job_repo=mock_repos["job_repo"],
+            broker=mock_repos["broker"],
         )
 
-    def test_translate_message_content_no_client(self, translation_service):
+    async def test_translate_message_content_no_client(self, translation_service):
         """Test translation when DeepL client is not available"""
         # Mock the property to return None
         with patch.object(type(translation_service), "deepl_client", new=None):
-            result = translation_service.translate_message_content(
+            result = await translation_service.translate_message_content(
                 "Hello", None, ["DE", "FR"]
             )
 
         assert result == {}
 
-    def test_translate_message_content_success(self, translation_service):
-        """Test successful translation"""
-        # Mock translation results
-        mock_result_de = Mock()
-        mock_result_de.text = "Hallo"
-        mock_result_fr = Mock()
-        mock_result_fr.text = "Bonjour"
+    async def test_translate_message_content_success(self, translation_service):
+        """Test successful translation fans out one request per language"""
+        texts = {"DE": "Hallo", "FR": "Bonjour"}
+
+        def translate_text(texts_to_translate, source_lang, target_lang):
+            return [Mock(text=texts[target_lang]) for _ in texts_to_translate]
 
-        # Mock DeepL client
         mock_client = Mock()
-        mock_client.translate_text.side_effect = [mock_result_de, mock_result_fr]
+        mock_client.translate_text.side_effect = translate_text
 
-        # Mock the property correctly
         with patch.object(type(translation_service), "deepl_client", new=mock_client):
-            result = translation_service.translate_message_content(
+            result = await translation_service.translate_message_content(
                 "Hello", None, ["DE", "FR"]
             )
 
         assert result == {"DE": "Hallo", "FR": "Bonjour"}
         assert mock_client.translate_text.call_count == 2
 
-    def test_create_message_translations_success(self, translation_service, mock_repos):
+    async def test_translate_messages_batch_coalesces_per_language(
+        self, translation_service
+    ):
+        """Test several messages share one DeepL request per target language"""
+
+        def translate_text(texts_to_translate, source_lang, target_lang):
+            return [Mock(text=f"{target_lang}:{text}") for text in texts_to_translate]
+
+        mock_client = Mock()
+        mock_client.translate_text.side_effect = translate_text
+
+        with patch.object(type(translation_service), "deepl_client", new=mock_client):
+            translations, errors = await translation_service.translate_messages_batch(
+                [
+                    (1, "hi", "EN", ["DE", "FR"]),
+                    (2, "ok", "EN", ["DE"]),
+                    (3, "thanks", "EN", ["DE", "EN"]),
+                ]
+            )
+
+        assert mock_client.translate_text.call_count == 2
+        assert translations == {
+            1: {"DE": "DE:hi", "FR": "FR:hi"},
+            2: {"DE": "DE:ok"},
+            3: {"DE": "DE:thanks"},
+        }
+        assert errors == {}
+
+    async def test_translate_messages_batch_records_errors(self, translation_service):
+        """Test a failing language batch reports errors for its messages only"""
+
+        def translate_text(texts_to_translate, source_lang, target_lang):
+            if target_lang == "FR":
+                raise deepl.DeepLException("quota exceeded")
+            return [Mock(text="Hallo") for _ in texts_to_translate]
+
+        mock_client = Mock()
+        mock_client.translate_text.side_effect = translate_text
+
+        with patch.object(type(translation_service), "deepl_client", new=mock_client):
+            translations, errors = await translation_service.translate_messages_batch(
+                [(1, "hi", None, ["DE"]), (2, "hey", None, ["FR"])]
+            )
+
+        assert translations == {1: {"DE": "Hallo"}}
+        assert errors == {2: "quota exceeded"}
+
+    async def test_translate_messages_batch_uses_translation_cache(self, mock_repos):
+        """Test cached phrases cost no API call and repeats are sent once"""
+        cached_key = make_cache_key("ok", None, "DE")
+        translation_cache = AsyncMock()
+        translation_cache.get_many.return_value = {cached_key: "okay"}
+        translation_service = TranslationService(
+            message_repo=mock_repos["message_repo"],
+            translation_repo=mock_repos["translation_repo"],
+            job_repo=mock_repos["job_repo"],
+            broker=mock_repos["broker"],
+            translation_cache=translation_cache,
+        )
+
+        mock_client = Mock()
+        mock_client.translate_text.side_effect = lambda texts, **_: [
+            Mock(text="Danke") for _ in texts
+        ]
+
+        with patch.object(type(translation_service), "deepl_client", new=mock_client):
+            translations, errors = await translation_service.translate_messages_batch(
+                [
+                    (1, "ok", None, ["DE"]),
+                    (2, "thanks", None, ["DE"]),
+                    (3, "thanks", None, ["DE"]),
+                ]
+            )
+
+        assert translations == {
+            1: {"DE": "okay"},
+            2: {"DE": "Danke"},
+            3: {"DE": "Danke"},
+        }
+        assert errors == {}
+        mock_client.translate_text.assert_called_once()
+        assert mock_client.translate_text.call_args[0][0] == ["thanks"]
+        translation_cache.put_many.assert_called_once_with(
+            {make_cache_key("thanks", None, "DE"): "Danke"}
+        )
+
+    async def test_translate_messages_batch_cache_hits_without_client(self, mock_repos):
+        """Test fully cached batches work even without a DeepL client"""
+        translation_cache = AsyncMock()
+        translation_cache.get_many.return_value = {
+            make_cache_key("hi", "EN", "DE"): "Hallo"
+        }
+        translation_service = TranslationService(
+            message_repo=mock_repos["message_repo"],
+            translation_repo=mock_repos["translation_repo"],
+            job_repo=mock_repos["job_repo"],
+            broker=mock_repos["broker"],
+            translation_cache=translation_cache,
+        )
+
+        with patch.object(type(translation_service), "deepl_client", new=None):
+            result = await translation_service.translate_message_content(
+                "hi", "EN", ["DE"]
+            )
+
+        assert result == {"DE": "Hallo"}
+        translation_cache.put_many.assert_not_called()
+
+    async def test_create_message_translations_success(
+        self, translation_service, mock_repos
+    ):
         """Test successful creation of message translations via repository"""
         translations = {"DE": "Hallo", "FR": "Bonjour"}
 
@@ -64,7 +179,7 @@ class TestTranslationService:
             "translation_repo"
         ].bulk_create_translations.return_value = mock_translation_objects
 
-        result = translation_service.create_message_translations(1, translations)
+        result = await translation_service.create_message_translations(1, translations)
 
         # Verify repository was called correctly
         mock_repos["translation_repo"].bulk_create_translations.assert_called_once()
@@ -76,7 +191,7 @@ class TestTranslationService:
         assert len(call_args) == 2
         assert len(result) == 2
 
-    def test_create_message_translations_repository_failure(
+    async def test_create_message_translations_repository_failure(
         self, translation_service, mock_repos
     ):
         """Test repository failure handling"""
@@ -85,22 +200,22 @@ class TestTranslationService:
         # Mock repository failure
         mock_repos["translation_repo"].bulk_create_translations.return_value = []
 
-        result = translation_service.create_message_translations(1, translations)
+        result = await translation_service.create_message_translations(1, translations)
 
         # Verify empty result on repository failure
         assert len(result) == 0
 
-    def test_create_message_translations_empty_input(
+    async def test_create_message_translations_empty_input(
         self, translation_service, mock_repos
     ):
         """Test handling of empty translations"""
-        result = translation_service.create_message_translations(1, {})
+        result = await translation_service.create_message_translations(1, {})
 
         # Verify repository is not called with empty input
         mock_repos["translation_repo"].bulk_create_translations.assert_not_called()
         assert len(result) == 0
 
-    def test_translate_and_store_message_complete_workflow(
+    async def test_translate_and_store_message_complete_workflow(
         self, translation_service, mock_repos
     ):
         """Test complete translation workflow with repository pattern"""
@@ -116,7 +231,7 @@ class TestTranslationService:
                 "create_message_translations",
                 return_value=[Mock(), Mock()],
             ) as mock_store:
-                result = translation_service.translate_and_store_message(
+                result = await translation_service.translate_and_store_message(
                     1, "Hello", None, ["DE", "FR"]
                 )
 
@@ -128,18 +243,22 @@ class TestTranslationService:
                     message_id=1, translations={"DE": "Hallo", "FR": "Bonjour"}
                 )
 
-    def test_translate_and_store_message_no_translations(self, translation_service):
+    async def test_translate_and_store_message_no_translations(
+        self, translation_service
+    ):
         """Test workflow when no translations are generated"""
         with patch.object(
             translation_service, "translate_message_content", return_value={}
         ):
-            result = translation_service.translate_and_store_message(
+            result = await translation_service.translate_and_store_message(
                 1, "Hello", None, ["DE", "FR"]
             )
 
             assert result == 0
 
-    def test_get_message_translation_success(self, translation_service, mock_repos):
+    async def test_get_message_translation_success(
+        self, translation_service, mock_repos
+    ):
         """Test retrieving message translation via repository"""
         # Mock translation object
         mock_translation = Mock()
@@ -148,7 +267,7 @@ class TestTranslationService:
             "translation_repo"
         ].get_by_message_and_language.return_value = mock_translation
 
-        result = translation_service.get_message_translation(1, "DE")
+        result = await translation_service.get_message_translation(1, "DE")
 
         assert result == "Hallo"
         mock_repos[
@@ -157,15 +276,17 @@ class TestTranslationService:
             message_id=1, target_language="DE"
         )
 
-    def test_get_message_translation_not_found(self, translation_service, mock_repos):
+    async def test_get_message_translation_not_found(
+        self, translation_service, mock_repos
+    ):
         """Test retrieving translation when not found"""
         mock_repos["translation_repo"].get_by_message_and_language.return_value = None
 
-        result = translation_service.get_message_translation(1, "DE")
+        result = await translation_service.get_message_translation(1, "DE")
 
         assert result is None
 
-    def test_get_all_message_translations(self, translation_service, mock_repos):
+    async def test_get_all_message_translations(self, translation_service, mock_repos):
         """Test retrieving all translations for a message"""
         # Mock translation objects
         mock_translations = [
@@ -176,16 +297,164 @@ class TestTranslationService:
             "translation_repo"
         ].get_by_message_id.return_value = mock_translations
 
-        result = translation_service.get_all_message_translations(1)
+        result = await translation_service.get_all_message_translations(1)
 
         assert result == {"DE": "Hallo", "FR": "Bonjour"}
         mock_repos["translation_repo"].get_by_message_id.assert_called_once_with(1)
 
-    def test_delete_message_translations(self, translation_service, mock_repos):
+    async def test_delete_message_translations(self, translation_service, mock_repos):
         """Test deleting message translations via repository"""
         mock_repos["translation_repo"].delete_by_message_id.return_value = 2
 
-        result = translation_service.delete_message_translations(1)
+        result = await translation_service.delete_message_translations(1)
 
         assert result == 2
         mock_repos["translation_repo"].delete_by_message_id.assert_called_once_with(1)
+
+    # =====================================
+    # BACKGROUND JOB TESTS
+    # =====================================
+
+    async def test_enqueue_message_translation_publishes_job(
+        self, translation_service, mock_repos
+    ):
+        """Test enqueue persists a job and publishes its ID"""
+        mock_repos["job_repo"].create_job.return_value = Mock(id=7)
+
+        job = await translation_service.enqueue_message_translation(
+            message_id=1, source_language="EN", target_languages=["DE", "FR"]
+        )
+
+        assert job.id == 7
+        mock_repos["job_repo"].create_job.assert_called_once_with(
+            message_id=1, source_language="EN", target_languages=["DE", "FR"]
+        )
+        mock_repos["broker"].publish.assert_called_once_with(7)
+
+    async def test_enqueue_message_translation_no_targets(
+        self, translation_service, mock_repos
+    ):
+        """Test enqueue is a no-op without target languages"""
+        job = await translation_service.enqueue_message_translation(1, "EN", [])
+
+        assert job is None
+        mock_repos["job_repo"].create_job.assert_not_called()
+        mock_repos["broker"].publish.assert_not_called()
+
+    def _claimed_job(self, attempts=1):
+        """Build a translation job for DE and FR as its claim returns it"""
+        return TranslationJob(
+            id=7,
+            message_id=1,
+            source_language="EN",
+            target_languages="DE,FR",
+            status=TranslationJobStatus.PROCESSING,
+            attempts=attempts,
+        )
+
+    def _mock_job_batch(self, mock_repos, job):
+        """Wire repositories for processing a single claimed job"""
+        mock_repos["job_repo"].claim_jobs.return_value = [job]
+        mock_repos["job_repo"].bulk_update.side_effect = lambda jobs: jobs
+        mock_repos["message_repo"].get_by_ids.return_value = [
+            Mock(id=1, content="Hello")
+        ]
+        mock_repos["translation_repo"].get_by_message_ids.return_value = []
+        mock_repos["translation_repo"].bulk_create_translations.side_effect = (
+            lambda translations: translations
+        )
+
+    async def test_process_translation_jobs_completed(
+        self, translation_service, mock_repos
+    ):
+        """Test job completes once every language is stored"""
+        job = self._claimed_job()
+        self._mock_job_batch(mock_repos, job)
+
+        with patch.object(
+            translation_service,
+            "translate_messages_batch",
+            return_value=({1: {"DE": "Hallo", "FR": "Bonjour"}}, {}),
+        ) as mock_translate:
+            result = await translation_service.process_translation_jobs([7])
+
+        assert result == [job]
+        assert job.status == TranslationJobStatus.COMPLETED
+        assert job.attempts == 1
+        mock_translate.assert_called_once_with([(1, "Hello", "EN", ["DE", "FR"])])
+
+    async def test_process_translation_jobs_only_requests_missing_languages(
+        self, translation_service, mock_repos
+    ):
+        """Test a retry skips languages translated by an earlier attempt"""
+        job = self._claimed_job(attempts=2)
+        self._mock_job_batch(mock_repos, job)
+        mock_repos["translation_repo"].get_by_message_ids.return_value = [
+            Mock(message_id=1, target_language="DE")
+        ]
+
+        with patch.object(
+            translation_service,
+            "translate_messages_batch",
+            return_value=({1: {"FR": "Bonjour"}}, {}),
+        ) as mock_translate:
+            await translation_service.process_translation_jobs([7])
+
+        assert job.status == TranslationJobStatus.COMPLETED
+        mock_translate.assert_called_once_with([(1, "Hello", "EN", ["FR"])])
+
+    async def test_process_translation_jobs_schedules_retry(
+        self, translation_service, mock_repos
+    ):
+        """Test missing languages keep the job pending with a backoff"""
+        job = self._claimed_job()
+        self._mock_job_batch(mock_repos, job)
+
+        with patch.object(
+            translation_service,
+            "translate_messages_batch",
+            return_value=({1: {"DE": "Hallo"}}, {}),
+        ):
+            await translation_service.process_translation_jobs([7])
+
+        assert job.status == TranslationJobStatus.PENDING
+        assert job.next_attempt_at is not None
+        assert "FR" in job.last_error
+
+    async def test_process_translation_jobs_fails_after_max_attempts(
+        self, translation_service, mock_repos
+    ):
+        """Test job is marked failed when attempts are exhausted"""
+        job = self._claimed_job(attempts=settings.translation_max_attempts)
+        self._mock_job_batch(mock_repos, job)
+
+        with patch.object(
+            translation_service,
+            "translate_messages_batch",
+            return_value=({}, {1: "DeepL down"}),
+        ):
+            await translation_service.process_translation_jobs([7])
+
+        assert job.status == TranslationJobStatus.FAILED
+        assert job.last_error == "DeepL down"
+
+    async def test_process_translation_jobs_skips_jobs_claimed_elsewhere(
+        self, translation_service, mock_repos
+    ):
+        """Test a job delivered twice is translated by its first claim only"""
+        mock_repos["job_repo"].claim_jobs.return_value = []
+
+        with patch.object(
+            translation_service, "translate_messages_batch"
+        ) as mock_translate:
+            assert await translation_service.process_translation_jobs([7]) == []
+
+        mock_translate.assert_not_called()
+
+    def test_compute_retry_delay_is_exponential_and_capped(self):
+        """Test backoff doubles per attempt up to the configured maximum"""
+        base = settings.translation_retry_base_delay
+
+        assert compute_retry_delay(1) == base
+        assert compute_retry_delay(3) == base * 4
+        assert compute_retry_delay(100) == settings.translation_retry_max_delay
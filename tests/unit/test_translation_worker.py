@@ -0,0 +1,220 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.database import Base
+from app.models.translation_job import TranslationJob, TranslationJobStatus
+from app.repositories.translation_job_repository import TranslationJobRepository
+from app.services.translation_queue import InMemoryTranslationBroker
+from app.services.translation_service import TranslationService
+from app.services.translation_worker import TranslationWorkerPool
+
+
+@asynccontextmanager
+async def fake_session_factory():
+    """Session factory yielding a mocked session."""
+    yield AsyncMock(info={})
+
+
+@pytest.mark.unit
+class TestTranslationWorkerPool:
+    """Unit tests for the background translation worker pool"""
+
+    @pytest.fixture
+    def broker(self):
+        """In-memory broker bound to the test event loop"""
+        return InMemoryTranslationBroker()
+
+    @pytest.fixture
+    def worker_pool(self, broker):
+        """Worker pool with mocked sessions"""
+        return TranslationWorkerPool(
+            broker=broker, session_factory=fake_session_factory, worker_count=2
+        )
+
+    async def test_broker_delivers_published_jobs_in_order(self, broker):
+        """Test in-memory broker is FIFO"""
+        await broker.connect()
+        await broker.publish(1)
+        await broker.publish(2)
+
+        assert await broker.consume() == 1
+        assert await broker.consume() == 2
+
+    async def test_broker_consume_batch_collects_burst(self, broker):
+        """Test jobs arriving within the window are returned together"""
+        await broker.connect()
+        for job_id in range(1, 6):
+            await broker.publish(job_id)
+
+        assert await broker.consume_batch(max_items=3, window=0.01) == [1, 2, 3]
+        assert await broker.consume_batch(max_items=10, window=0.01) == [4, 5]
+
+    async def test_workers_process_published_jobs(self, worker_pool, broker):
+        """Test started workers pick up published jobs"""
+        processed = asyncio.Event()
+
+        async def process(self, job_ids):
+            processed.set()
+            return [Mock(status=TranslationJobStatus.COMPLETED)]
+
+        with (
+            patch.object(worker_pool, "recover_unfinished_jobs", AsyncMock()),
+            patch.object(TranslationService, "process_translation_jobs", process),
+        ):
+            await worker_pool.start()
+            await broker.publish(1)
+            await asyncio.wait_for(processed.wait(), timeout=1)
+            await worker_pool.stop()
+
+        assert not worker_pool.is_running
+
+    async def test_run_job_schedules_retry_for_pending_job(self, worker_pool):
+        """Test pending job is re-published after its backoff"""
+        job = Mock(
+            id=1,
+            status=TranslationJobStatus.PENDING,
+            next_attempt_at=datetime.now(timezone.utc) + timedelta(seconds=30),
+        )
+
+        with (
+            patch.object(
+                TranslationService, "process_translation_jobs", return_value=[job]
+            ),
+            patch.object(worker_pool, "_schedule_retry") as mock_schedule,
+        ):
+            await worker_pool.run_jobs([1])
+
+        job_id, delay = mock_schedule.call_args[0]
+        assert job_id == 1
+        assert 0 < delay <= 30
+
+    async def test_run_job_does_not_retry_finished_job(self, worker_pool):
+        """Test completed job is not re-published"""
+        job = Mock(status=TranslationJobStatus.COMPLETED)
+
+        with (
+            patch.object(
+                TranslationService, "process_translation_jobs", return_value=[job]
+            ),
+            patch.object(worker_pool, "_schedule_retry") as mock_schedule,
+        ):
+            await worker_pool.run_jobs([1])
+
+        mock_schedule.assert_not_called()
+
+    async def test_recovery_skips_jobs_until_due(self, worker_pool, broker):
+        """Test recovered jobs are published when their next attempt is due"""
+        now = datetime.now(timezone.utc)
+        jobs = [
+            Mock(id=1, next_attempt_at=None),
+            Mock(id=2, next_attempt_at=now + timedelta(seconds=30)),
+        ]
+
+        with (
+            patch.object(
+                TranslationJobRepository, "get_recoverable_jobs", return_value=jobs
+            ),
+            patch.object(worker_pool, "_schedule_retry") as mock_schedule,
+        ):
+            await broker.connect()
+            assert await worker_pool.recover_unfinished_jobs() == 2
+
+        assert await broker.consume() == 1
+        job_id, delay = mock_schedule.call_args[0]
+        assert job_id == 2
+        assert 0 < delay <= 30
+
+
+@pytest.mark.unit
+class TestTranslationJobClaims:
+    """Unit tests for claiming translation jobs on a real database"""
+
+    @pytest.fixture
+    async def session(self):
+        """Session on an in-memory database with jobs in every state"""
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        now = datetime.now(timezone.utc)
+        long_ago = now - timedelta(hours=1)
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            # Due, not due, held by a live worker, abandoned, finished
+            jobs = [
+                dict(status=TranslationJobStatus.PENDING, attempts=0),
+                dict(
+                    status=TranslationJobStatus.PENDING,
+                    attempts=1,
+                    next_attempt_at=now + timedelta(minutes=1),
+                ),
+                dict(status=TranslationJobStatus.PROCESSING, attempts=1),
+                dict(
+                    status=TranslationJobStatus.PROCESSING,
+                    attempts=1,
+                    updated_at=long_ago,
+                ),
+                dict(status=TranslationJobStatus.COMPLETED, attempts=1),
+            ]
+            await session.execute(
+                insert(TranslationJob),
+                [
+                    {
+                        "message_id": message_id,
+                        "target_languages": "DE",
+                        "next_attempt_at": None,
+                        "updated_at": now,
+                        **job,
+                    }
+                    for message_id, job in enumerate(jobs, start=1)
+                ],
+            )
+            yield session
+        await engine.dispose()
+
+    async def test_jobs_are_claimed_once(self, session):
+        """Test due and abandoned jobs are claimed by a single worker"""
+        repository = TranslationJobRepository(session)
+        stale_before = datetime.now(timezone.utc) - timedelta(minutes=10)
+
+        claimed = await repository.claim_jobs([1, 2, 3, 4, 5], stale_before)
+
+        assert [(job.id, job.attempts) for job in claimed] == [(1, 1), (4, 2)]
+        assert {job.status for job in claimed} == {TranslationJobStatus.PROCESSING}
+        assert await repository.claim_jobs([1, 2, 3, 4, 5], stale_before) == []
+
+    async def test_recovery_leaves_live_claims_alone(self, session):
+        """Test only pending and abandoned jobs are recovered"""
+        repository = TranslationJobRepository(session)
+        stale_before = datetime.now(timezone.utc) - timedelta(minutes=10)
+
+        recovered = await repository.get_recoverable_jobs(stale_before)
+
+        assert [job.id for job in recovered] == [1, 2, 4]
+        overdue = await repository.get_recoverable_jobs(stale_before, all_pending=False)
+        assert [job.id for job in overdue] == [4]
+
+    async def test_expired_claims_are_recovered_periodically(self, session):
+        """Test running workers re-publish abandoned jobs without a restart"""
+
+        @asynccontextmanager
+        async def session_factory():
+            yield session
+
+        broker = InMemoryTranslationBroker()
+        await broker.connect()
+        worker_pool = TranslationWorkerPool(
+            broker=broker, session_factory=session_factory, recovery_interval=0.01
+        )
+
+        recovery = asyncio.create_task(worker_pool._recover_jobs_periodically())
+        try:
+            assert await asyncio.wait_for(broker.consume(), timeout=1) == 4
+        finally:
+            recovery.cancel()
+            await asyncio.gather(recovery, return_exceptions=True)
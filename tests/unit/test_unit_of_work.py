@@ -0,0 +1,64 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.core.unit_of_work import UnitOfWork, run_after_commit, transaction
+
+
+@pytest.mark.unit
+class TestUnitOfWork:
+    """Unit tests for the per-request unit of work"""
+
+    @pytest.fixture
+    def session(self):
+        """Mocked async session"""
+        return AsyncMock(info={})
+
+    async def test_unit_of_work_is_bound_to_session(self, session):
+        """Test the same unit of work is returned for one session"""
+        assert UnitOfWork.of(session) is UnitOfWork.of(session)
+
+    async def test_callbacks_run_after_commit(self, session):
+        """Test callbacks are deferred until the transaction commits"""
+        calls = []
+        callback = AsyncMock(side_effect=lambda: calls.append("callback"))
+        session.commit.side_effect = lambda: calls.append("commit")
+
+        async with transaction(session) as unit_of_work:
+            await run_after_commit(unit_of_work, callback)
+            assert calls == []
+
+        assert calls == ["commit", "callback"]
+        session.rollback.assert_not_awaited()
+
+    async def test_error_rolls_back_and_drops_callbacks(self, session):
+        """Test failed transaction rolls back without running callbacks"""
+        callback = AsyncMock()
+
+        with pytest.raises(ValueError):
+            async with transaction(session) as unit_of_work:
+                unit_of_work.after_commit(callback)
+                raise ValueError("boom")
+
+        session.rollback.assert_awaited_once()
+        session.commit.assert_not_awaited()
+        callback.assert_not_awaited()
+
+    async def test_failing_callback_does_not_skip_others(self, session):
+        """Test one failing callback does not prevent the rest"""
+        failing = AsyncMock(side_effect=RuntimeError("broker down"))
+        succeeding = AsyncMock()
+
+        async with transaction(session) as unit_of_work:
+            unit_of_work.after_commit(failing)
+            unit_of_work.after_commit(succeeding)
+
+        succeeding.assert_awaited_once()
+
+    async def test_without_unit_of_work_callback_runs_immediately(self):
+        """Test callbacks run right away outside a unit of work"""
+        callback = AsyncMock()
+
+        await run_after_commit(None, callback)
+
+        callback.assert_awaited_once()
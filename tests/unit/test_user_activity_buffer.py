@@ -0,0 +1,143 @@
+import asyncio
+import pytest
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+from sqlalchemy import event, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.database import Base
+from app.models.user import User, UserStatus
+from app.services.user_activity_buffer import UserActivityBuffer
+
+
+@asynccontextmanager
+async def fake_session_factory():
+    """Session factory yielding a mocked session."""
+    yield AsyncMock(info={})
+
+
+@pytest.mark.unit
+class TestUserActivityBuffer:
+    """Unit tests for the write-behind buffer of user updates"""
+
+    @pytest.fixture
+    def buffer(self):
+        """Buffer flushing through a mocked session"""
+        return UserActivityBuffer(
+            session_factory=fake_session_factory, flush_interval=5, max_pending=3
+        )
+
+    @pytest.fixture
+    def repository(self):
+        """Patched UserRepository class"""
+        with patch("app.services.user_activity_buffer.UserRepository") as repository:
+            repository.return_value.update_activity = AsyncMock(return_value=2)
+            yield repository.return_value
+
+    async def test_updates_are_coalesced_per_user(self, buffer, repository):
+        """Test many updates of a user are written once with the latest values"""
+        now = datetime.now(timezone.utc)
+        for seconds in range(10):
+            buffer.record(1, last_active=now + timedelta(seconds=seconds))
+        buffer.record(1, status=UserStatus.BUSY)
+        buffer.record(2, status=UserStatus.AWAY)
+
+        assert await buffer.flush() == 2
+        assert await buffer.flush() == 0
+
+        repository.update_activity.assert_awaited_once_with(
+            {1: now + timedelta(seconds=9)},
+            {1: UserStatus.BUSY, 2: UserStatus.AWAY},
+            1000,
+        )
+        assert buffer.stats()["updates_recorded"] == 12
+        assert buffer.stats()["flushes"] == 1
+
+    async def test_failed_flush_keeps_updates(self, buffer, repository):
+        """Test values survive a failed flush unless newer ones arrived"""
+        repository.update_activity.side_effect = RuntimeError("database down")
+        buffer.record(1, status=UserStatus.BUSY)
+        buffer.record(2, status=UserStatus.BUSY)
+
+        with pytest.raises(RuntimeError):
+            await buffer.flush()
+        buffer.record(2, status=UserStatus.AVAILABLE)
+
+        assert buffer.get_pending(1) == (None, UserStatus.BUSY)
+        assert buffer.get_pending(2) == (None, UserStatus.AVAILABLE)
+        assert buffer.stats()["failures"] == 1
+
+    async def test_full_buffer_triggers_early_flush(self, buffer, repository):
+        """Test reaching max_pending flushes before the interval elapsed"""
+        await buffer.start()
+        try:
+            for user_id in range(3):
+                buffer.record(user_id, status=UserStatus.AWAY)
+            for _ in range(10):
+                await asyncio.sleep(0)
+        finally:
+            await buffer.stop()
+
+        repository.update_activity.assert_awaited_once()
+        assert buffer.pending_count == 0
+
+    async def test_stop_flushes_remaining_updates(self, buffer, repository):
+        """Test shutdown writes what is still buffered"""
+        buffer.record(1, last_active=datetime.now(timezone.utc))
+
+        await buffer.stop()
+
+        repository.update_activity.assert_awaited_once()
+        assert buffer.pending_count == 0
+
+    async def test_flush_writes_in_chunks(self):
+        """Test flushes write chunk_size users per UPDATE and skip deleted users"""
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(
+                insert(User),
+                [
+                    {
+                        "id": user_id,
+                        "username": f"user{user_id}",
+                        "email": f"user{user_id}@example.com",
+                        "password_hash": "x",
+                    }
+                    for user_id in range(1, 6)
+                ],
+            )
+        updates = []
+
+        @event.listens_for(engine.sync_engine, "before_cursor_execute")
+        def count_updates(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("UPDATE"):
+                updates.append(len(parameters) if executemany else 1)
+
+        buffer = UserActivityBuffer(
+            session_factory=async_sessionmaker(engine), chunk_size=2
+        )
+        now = datetime.now(timezone.utc)
+        for user_id in range(1, 7):
+            buffer.record(user_id, last_active=now)
+        buffer.record(3, status=UserStatus.BUSY)
+
+        try:
+            assert await buffer.flush() == 5
+            async with engine.connect() as conn:
+                rows = (
+                    await conn.execute(
+                        select(User.id, User.last_active, User.status).order_by(User.id)
+                    )
+                ).all()
+        finally:
+            await engine.dispose()
+
+        assert updates == [2, 2, 1, 1]
+        assert all(last_active is not None for _, last_active, _ in rows)
+        assert [
+            user_id for user_id, _, status in rows if status == UserStatus.BUSY
+        ] == [3]
+        assert buffer.pending_count == 0